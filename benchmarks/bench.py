@@ -0,0 +1,364 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: bench.py
+# Desc: Measures the filter plugins and module output parsers of the
+#       collection on generated fixtures and records the results as JSON.
+# Auth: Mark Stillings
+# Note: Runs offline, no vastool, preflight or Active Directory is needed.
+#       The collection must be importable as
+#       ansible_collections.oneidentity.authentication_services, see README.md.
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import timeit
+
+import fixtures
+
+
+# ------------------------------------------------------------------------------
+# Constants
+# ------------------------------------------------------------------------------
+
+# Fixture sizes measured by default
+SIZES_DEFAULT = [1000, 10000, 100000]
+
+# Number of timing repeats, the best one is reported
+REPEAT_DEFAULT = 5
+
+# Minimum number of seconds one timing repeat should take
+MIN_TIME = 0.2
+
+# Slowdown ratio against a baseline that is reported as a regression
+MAX_REGRESSION_DEFAULT = 1.25
+
+# Collection package
+COLLECTION = 'ansible_collections.oneidentity.authentication_services'
+
+
+# ------------------------------------------------------------------------------
+# Functions
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def import_collection():
+    """
+    Make the collection importable when it is checked out in the usual
+    <path>/ansible_collections/oneidentity/authentication_services layout.
+    """
+
+    repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    collections_dir = os.path.dirname(os.path.dirname(repo_dir))
+    if os.path.basename(collections_dir) == 'ansible_collections':
+        sys.path.insert(0, os.path.dirname(collections_dir))
+
+    try:
+        __import__(COLLECTION)
+    except ImportError:
+        sys.exit('Cannot import ' + COLLECTION + ', check out the repository as '
+            '<path>/ansible_collections/oneidentity/authentication_services or install the collection.')
+
+
+# ------------------------------------------------------------------------------
+def load(name):
+    """
+    Import name relative to the collection package.
+    """
+
+    module_name = COLLECTION + '.plugins.' + name
+    __import__(module_name)
+    return sys.modules[module_name]
+
+
+# ------------------------------------------------------------------------------
+def benchmarks(tmp_dir):
+    """
+    Returns the list of (name, setup) benchmarks.  setup takes the fixture size
+    and returns the function to time.
+    """
+
+    ad_user = load('filter.ad_user_conflicts_filters')
+    ad_group = load('filter.ad_group_conflicts_filters')
+    ue_users = load('filter.unix_enabled_ad_users_filters')
+    ue_groups = load('filter.unix_enabled_ad_groups_filters')
+    logon_policy = load('filter.logon_policy_for_ad_user_filters')
+    client_sw = load('filter.client_sw_filters')
+    client_config = load('filter.client_config_filters')
+    preflight = load('modules.preflight')
+    vastool_join = load('modules.vastool_join')
+    client_sw_pkgs = load('modules.client_sw_pkgs')
+    vastool = load('module_utils.vastool')
+    client_sw_utils = load('module_utils.client_sw')
+    asdcom = load('module_utils.asdcom')
+    vasd_cache = load('module_utils.vasd_cache')
+    fact_delta = load('module_utils.fact_delta')
+    local_unix = load('module_utils.local_unix')
+    fact_delta_filters = load('filter.fact_delta_filters')
+
+    def users(size, schemaless):
+        return fixtures.generate_user_objects(size, schemaless=schemaless)
+
+    def groups(size, schemaless):
+        return fixtures.generate_group_objects(size, schemaless=schemaless)
+
+    def packages(size):
+        path = os.path.join(tmp_dir, 'pkgs_' + str(size), 'linux-x86_64')
+        fixtures.generate_package_dir(path, size)
+        return lambda: client_sw_pkgs.parse_packages(path, 'rpm')
+
+    def packages_manifest(size):
+        path = os.path.join(tmp_dir, 'manifest_' + str(size))
+        fixtures.generate_package_dir(os.path.join(path, 'linux-x86_64'), size)
+        client_sw_utils.write_manifest(path, client_sw_utils.build_manifest(path))
+        return lambda: client_sw_utils.manifest_packages(
+            client_sw_utils.read_manifest(path), path, 'linux-x86_64', 'rpm')
+
+    def users_allowed_cache(size):
+        path = os.path.join(tmp_dir, 'vas_ident_' + str(size) + '.vdb')
+        fixtures.generate_vasd_cache(path, size)
+        return lambda: vasd_cache.list_users_allowed(path=path)
+
+    def users_allowed_cache_lookup(size):
+        path = os.path.join(tmp_dir, 'vas_ident_' + str(size) + '.vdb')
+        fixtures.generate_vasd_cache(path, size)
+        return lambda: vasd_cache.list_users_allowed(['tu-%07d@BENCH.SB' % (size // 2)], path=path)
+
+    def changed_rows(rows):
+        # 1% of the records changed, removed and added each
+        step = 100
+        new_rows = [row[:6] + ['/bin/false'] if i % step == 0 else row
+            for i, row in enumerate(rows) if i % step != 1]
+        return new_rows + [['new%07d' % i] + row[1:] for i, row in enumerate(rows[::step])]
+
+    def fact_delta_apply(size):
+        rows = fixtures.generate_passwd_rows(size)
+        added, changed, removed = fact_delta.diff_rows(rows, changed_rows(rows))
+        baseline_facts = {'delta_version': 'baseline', 'local_unix_users': rows}
+        facts = {'delta': {'baseline': 'baseline', 'added': added, 'changed': changed, 'removed': removed}}
+        return lambda: fact_delta_filters.apply_fact_delta(facts, baseline_facts, 'local_unix_users')
+
+    def fact_delta_since(size):
+        path = os.path.join(tmp_dir, 'delta_' + str(size) + '.json')
+        rows = fixtures.generate_passwd_rows(size)
+        version, _ = fact_delta.delta_since(path, '', rows)
+        new_rows = changed_rows(rows)
+        fact_delta.write_state(path, version, rows)
+        # The state is rewritten by every call, restore it to keep the delta
+        def delta_since():
+            fact_delta.delta_since(path, version, new_rows)
+            fact_delta.write_state(path, version, rows)
+        return delta_since
+
+    def with_fixture(generate, func):
+        def setup(size):
+            data = generate(size)
+            return lambda: func(data)
+        return setup
+
+    return [
+        ('filter.selectconflictingusers.schema', with_fixture(
+            lambda size: users(size, False),
+            lambda data: ad_user.select_conflicting_users(data, 'uidNumber', 'loginShell'))),
+        ('filter.selectconflictingusers.schemaless', with_fixture(
+            lambda size: users(size, True),
+            lambda data: ad_user.select_conflicting_users(data, 'uidNumber', 'loginShell'))),
+        ('filter.conflictinggroupsbyschema', with_fixture(
+            lambda size: groups(size, False),
+            lambda data: ad_group.select_conflicting_groups_by_schema(data, 'gidNumber', 'sAMAccountName'))),
+        ('filter.conflictinggroupswhenschemaless', with_fixture(
+            lambda size: groups(size, True),
+            ad_group.select_conflicting_groups_when_schemaless)),
+        ('filter.usersbyschema', with_fixture(
+            lambda size: users(size, False),
+            lambda data: ue_users.extract_properties_by_schema(
+                data, 'uidNumber', 'sAMAccountName', 'gidNumber', 'gecos', 'unixHomeDirectory', 'loginShell'))),
+        ('filter.userswhenschemaless', with_fixture(
+            lambda size: users(size, True),
+            ue_users.extract_properties_when_schemaless)),
+        ('filter.groupsbyschema', with_fixture(
+            lambda size: groups(size, False),
+            lambda data: ue_groups.extract_properties_by_schema(data, 'gidNumber', 'sAMAccountName'))),
+        ('filter.groupswhenschemaless', with_fixture(
+            lambda size: groups(size, True),
+            ue_groups.extract_properties_when_schemaless)),
+        ('filter.logonpolicyforaduser', with_fixture(
+            fixtures.generate_logon_policy_for_unix_hosts,
+            logon_policy.get_logon_policy_for_ad_user)),
+        # pkgdict2items empties its input so every call gets a copy
+        ('filter.pkgdict2items', with_fixture(
+            fixtures.generate_pkg_dict,
+            lambda data: client_sw.pkg_dict_2_items(dict(data)))),
+        ('filter.dictlistselect', with_fixture(
+            fixtures.generate_dict_list,
+            lambda data: client_config.dict_list_select(
+                data, ['section', 'option', 'value', 'state'], '', {}, {'state': 'absent'}))),
+        ('filter.applyfactdelta', fact_delta_apply),
+        ('fact_delta.delta_since', fact_delta_since),
+        ('local_unix.summarize_users', with_fixture(
+            fixtures.generate_passwd_rows,
+            lambda data: local_unix.summarize_users(iter(data)))),
+        ('local_unix.summarize_groups', with_fixture(
+            fixtures.generate_group_rows,
+            lambda data: local_unix.summarize_groups(iter(data)))),
+        ('preflight.parse_preflight_steps', with_fixture(
+            fixtures.generate_preflight_output,
+            preflight.parse_preflight_steps)),
+        ('vastool.vastool_status_check_parse', with_fixture(
+            fixtures.generate_vastool_status_output,
+            lambda data: vastool.vastool_status_check_parse(False, data))),
+        ('vastool.vastool_list_users_allowed_parse', with_fixture(
+            fixtures.generate_vastool_users_allowed_output,
+            lambda data: vastool.vastool_list_users_allowed_parse(False, data))),
+        ('vastool.vastool_list_users_allowed_parse.user_names', with_fixture(
+            fixtures.generate_vastool_users_allowed_output,
+            lambda data: vastool.vastool_list_users_allowed_parse(False, data, ['tu-0000000@BENCH.SB']))),
+        ('vasd_cache.list_users_allowed', users_allowed_cache),
+        ('vasd_cache.list_users_allowed.user_names', users_allowed_cache_lookup),
+        ('vastool_join.parse_vastool_steps', with_fixture(
+            fixtures.generate_vastool_join_output,
+            lambda data: vastool_join.parse_vastool_steps('bench.sb', data))),
+        ('asdcom.parse_asdcom_stdout', with_fixture(
+            fixtures.generate_asdcom_output,
+            asdcom.parse_asdcom_stdout)),
+        ('client_sw_pkgs.parse_packages', packages),
+        ('client_sw.manifest_packages', packages_manifest)
+    ]
+
+
+# ------------------------------------------------------------------------------
+def measure(func, repeat):
+    """
+    Time func, returns the number of calls per repeat and the best and mean
+    seconds per call.
+    """
+
+    timer = timeit.Timer(func)
+
+    # Find the number of calls that takes at least MIN_TIME
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= MIN_TIME or number >= 1000000:
+            break
+        number *= 10 if elapsed < MIN_TIME / 10 else 2
+
+    times = [t / number for t in timer.repeat(repeat, number)]
+    return number, min(times), sum(times) / len(times)
+
+
+# ------------------------------------------------------------------------------
+def run(sizes, repeat, name_filter):
+    """
+    Run the benchmarks, returns the list of results.
+    """
+
+    results = []
+    tmp_dir = tempfile.mkdtemp(prefix='sas_bench_')
+    try:
+        for name, setup in benchmarks(tmp_dir):
+            if name_filter and not any(f in name for f in name_filter):
+                continue
+            for size in sizes:
+                number, best, mean = measure(setup(size), repeat)
+                results.append({
+                    'name': name,
+                    'size': size,
+                    'number': number,
+                    'repeat': repeat,
+                    'best': best,
+                    'mean': mean,
+                    'per_item': best / size
+                })
+                print('%-45s %8s %12.6f s %12.3f us/item' % (name, fixtures.size_label(size), best, best / size * 1e6))
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return results
+
+
+# ------------------------------------------------------------------------------
+def compare(results, baseline_path, max_regression):
+    """
+    Compare results to the results in baseline_path, returns the list of
+    regressions.
+    """
+
+    with open(baseline_path, 'r') as baseline_file:
+        baseline = json.load(baseline_file)
+
+    best_of = dict(((r['name'], r['size']), r['best']) for r in baseline.get('results', []))
+
+    regressions = []
+    print('\nCompared to ' + baseline_path + ':')
+    for r in results:
+        base = best_of.get((r['name'], r['size']))
+        if not base:
+            continue
+        ratio = r['best'] / base
+        flag = ''
+        if ratio > max_regression:
+            flag = '  REGRESSION'
+            regressions.append(r['name'] + ' ' + fixtures.size_label(r['size']))
+        print('%-45s %8s %8.2fx%s' % (r['name'], fixtures.size_label(r['size']), ratio, flag))
+
+    return regressions
+
+
+# ------------------------------------------------------------------------------
+def main():
+    """
+    Main
+    """
+
+    parser = argparse.ArgumentParser(description='Benchmark the filter plugins and module parsers.')
+    parser.add_argument('-s', '--sizes', type=int, nargs='+', default=SIZES_DEFAULT,
+        help='Fixture sizes (default: 1000 10000 100000)')
+    parser.add_argument('-r', '--repeat', type=int, default=REPEAT_DEFAULT,
+        help='Timing repeats, the best is reported (default: 5)')
+    parser.add_argument('-k', '--filter', nargs='+', default=[],
+        help='Only run benchmarks whose name contains any of these strings')
+    parser.add_argument('-o', '--output', default='bench_results.json',
+        help='JSON results file (default: bench_results.json)')
+    parser.add_argument('-b', '--baseline',
+        help='JSON results file of an earlier run to compare with')
+    parser.add_argument('--max-regression', type=float, default=MAX_REGRESSION_DEFAULT,
+        help='Slowdown ratio reported as regression (default: 1.25)')
+    args = parser.parse_args()
+
+    import_collection()
+
+    results = run(args.sizes, args.repeat, args.filter)
+
+    with open(args.output, 'w') as output_file:
+        json.dump({
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'results': results
+        }, output_file, indent=2)
+    print('\nResults written to ' + args.output)
+
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.max_regression)
+        if regressions:
+            sys.exit('Regressions: ' + ', '.join(regressions))
+
+
+# When run from command line
+# ------------------------------------------------------------------------------
+if __name__ == '__main__':
+    main()
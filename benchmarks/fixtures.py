@@ -0,0 +1,418 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: fixtures.py
+# Desc: Generates synthetic Active Directory objects and command outputs for
+#       benchmarking the collection's filter plugins and module parsers.
+# Auth: Laszlo Nagy
+# Note: Objects have the same shape as the objects returned by
+#       community.windows.win_domain_object_info in the AD report roles.
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+
+
+# ------------------------------------------------------------------------------
+# Constants
+# ------------------------------------------------------------------------------
+
+# Fixture sizes written by default
+SIZES_DEFAULT = [10000, 100000, 1000000]
+
+# Fraction of objects that reuse an already assigned Unix ID
+DUPLICATE_RATIO_DEFAULT = 0.01
+
+# Fraction of users that have /bin/false as login shell
+DISABLED_RATIO_DEFAULT = 0.05
+
+# Schemaless label prefixes of user and group objects
+POSIX_ACCOUNT_LABEL = 'X509:<S>CN=Posix Account<I>CN=Quest Software<DATA>'
+POSIX_GROUP_LABEL = 'X509:<S>CN=Posix Group<I>CN=Quest Software<DATA>'
+
+# First Unix ID assigned to generated objects
+ID_BASE = 10000
+
+# Package states used by the client_sw role
+PKG_STATES = ['absent', 'present', 'check']
+
+
+# ------------------------------------------------------------------------------
+# Functions
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def unix_ids(count, duplicate_ratio, rnd):
+    """
+    Yields count Unix ID numbers where about duplicate_ratio of them repeat an
+    ID that has already been handed out.
+    """
+
+    next_id = ID_BASE
+    for i in range(count):
+        if i and rnd.random() < duplicate_ratio:
+            yield rnd.randrange(ID_BASE, next_id)
+        else:
+            yield next_id
+            next_id += 1
+
+
+# ------------------------------------------------------------------------------
+def generate_user_objects(count, schemaless=False, uid_attr='uidNumber', shell_attr='loginShell',
+    duplicate_ratio=DUPLICATE_RATIO_DEFAULT, disabled_ratio=DISABLED_RATIO_DEFAULT, seed=0):
+    """
+    Returns a list of count user objects, either in schema or in schemaless
+    (altSecurityIdentities) form.
+    """
+
+    rnd = random.Random(seed)
+    users = []
+    for i, uid in enumerate(unix_ids(count, duplicate_ratio, rnd)):
+        name = 'tu-%07d' % i
+        shell = '/bin/false' if rnd.random() < disabled_ratio else '/bin/bash'
+        user = {
+            'DistinguishedName': 'CN=' + name + ',OU=Bench,DC=bench,DC=sb',
+            'Name': name,
+            'ObjectClass': 'user',
+            'sAMAccountName': name
+        }
+        if schemaless:
+            user['altSecurityIdentities'] = [
+                POSIX_ACCOUNT_LABEL + 'LoginShell: ' + shell,
+                POSIX_ACCOUNT_LABEL + 'HomeDirectory: /home/' + name,
+                POSIX_ACCOUNT_LABEL + 'Gecos: ' + name,
+                POSIX_ACCOUNT_LABEL + 'UserGidNumber: 8000',
+                POSIX_ACCOUNT_LABEL + 'LoginName: ' + name,
+                POSIX_ACCOUNT_LABEL + 'UidNumber: ' + str(uid)
+            ]
+        else:
+            user.update({
+                uid_attr: uid,
+                'gidNumber': 8000,
+                'gecos': name,
+                'unixHomeDirectory': '/home/' + name,
+                shell_attr: shell
+            })
+        users.append(user)
+
+    return users
+
+
+# ------------------------------------------------------------------------------
+def generate_group_objects(count, schemaless=False, gid_attr='gidNumber', name_attr='sAMAccountName',
+    duplicate_ratio=DUPLICATE_RATIO_DEFAULT, seed=0):
+    """
+    Returns a list of count group objects, either in schema or in schemaless
+    (altSecurityIdentities) form.
+    """
+
+    rnd = random.Random(seed)
+    groups = []
+    for i, gid in enumerate(unix_ids(count, duplicate_ratio, rnd)):
+        name = 'tg-%07d' % i
+        group = {
+            'DistinguishedName': 'CN=' + name + ',OU=Bench,DC=bench,DC=sb',
+            'Name': name,
+            'ObjectClass': 'group'
+        }
+        if schemaless:
+            group['altSecurityIdentities'] = [
+                POSIX_GROUP_LABEL + 'GroupName: ' + name,
+                POSIX_GROUP_LABEL + 'GroupGidNumber: ' + str(gid)
+            ]
+        else:
+            group.update({
+                gid_attr: gid,
+                name_attr: name
+            })
+        groups.append(group)
+
+    return groups
+
+
+# ------------------------------------------------------------------------------
+def generate_logon_policy_for_unix_hosts(count, users_per_host=1000, seed=0):
+    """
+    Returns a {host: users allowed} dictionary with count users allowed in
+    total, the input of the logonpolicyforaduser filter.  Users are drawn from
+    a pool so most of them are allowed on several hosts.
+    """
+
+    rnd = random.Random(seed)
+    pool = max(1, count // 4)
+    hosts = {}
+    for i in range(count):
+        host = '10.0.%d.%d' % divmod(i // users_per_host, 256)
+        n = rnd.randrange(pool)
+        hosts.setdefault(host, []).append(
+            ['BENCH\\tu-%07d' % n, 'VAS', str(ID_BASE + n), '8000', 'User %d' % n, '/home/tu-%07d' % n, '/bin/bash'])
+
+    return hosts
+
+
+# ------------------------------------------------------------------------------
+def generate_pkg_dict(count, seed=0):
+    """
+    Returns a {package name: state} dictionary of count packages including
+    vasclnt and vasclnts, the input of the pkgdict2items filter.
+    """
+
+    rnd = random.Random(seed)
+    pkg_dict = {'vasclnt': 'present', 'vasclnts': 'absent'}
+    for i in range(count - len(pkg_dict)):
+        pkg_dict['pkg%07d' % i] = rnd.choice(PKG_STATES)
+
+    return pkg_dict
+
+
+# ------------------------------------------------------------------------------
+def generate_dict_list(count, seed=0):
+    """
+    Returns a list of count vas.conf setting dictionaries, the input of the
+    dictlistselect filter.  Some dictionaries miss the state key.
+    """
+
+    rnd = random.Random(seed)
+    dict_list = []
+    for i in range(count):
+        d = {
+            'section': 'section%d' % (i % 20),
+            'option': 'option%d' % i,
+            'value': str(i),
+            'comment': 'generated'
+        }
+        if rnd.random() < 0.9:
+            d['state'] = rnd.choice(['present', 'absent'])
+        dict_list.append(d)
+
+    return dict_list
+
+
+# ------------------------------------------------------------------------------
+def generate_preflight_output(count, seed=0):
+    """
+    Returns preflight --csv output with count result lines.
+    """
+
+    rnd = random.Random(seed)
+    lines = []
+    for i in range(count):
+        lines.append('%d,%d,check%d,Checking requirement %d,"Result of check %d", detail %d' % (
+            rnd.choice([0, 0, 0, 1, 2, 3]), i, i, i, i, i))
+
+    return '\n'.join(lines) + '\n'
+
+
+# ------------------------------------------------------------------------------
+def generate_vastool_join_output(count, seed=0):
+    """
+    Returns vastool join output with count step lines.
+    """
+
+    rnd = random.Random(seed)
+    lines = []
+    for i in range(count):
+        lines.append('Performing step %d of the join ... %s' % (i, rnd.choice(['ok', 'done', 'success'])))
+
+    return '\n'.join(lines) + '\n'
+
+
+# ------------------------------------------------------------------------------
+def generate_vastool_status_output(count, seed=0):
+    """
+    Returns vastool status -c output with count STATUS lines.
+    """
+
+    rnd = random.Random(seed)
+    lines = ['HEADER,Authentication Services status check']
+    for i in range(count):
+        lines.append('STATUS,T%d,`Checking item %d`,%d,`Result of item %d`' % (i, i, rnd.choice([0, 0, 0, 1]), i))
+
+    return '\n'.join(lines) + '\n'
+
+
+# ------------------------------------------------------------------------------
+def generate_asdcom_output(count, seed=0):
+    """
+    Returns asdcom GetMappedUsers output with count mapped users, some of
+    which come from NSS and are skipped by the parser.
+    """
+
+    rnd = random.Random(seed)
+    lines = ['UPN,ULoginName,UniqueID,NTName,SourceFile']
+    for i in range(count):
+        source = 'NSS' if rnd.random() < 0.1 else '/etc/opt/quest/vas/user-override'
+        lines.append('tu-%07d@BENCH.SB,loc%07d,%08X-0000-0000-0000-000000000000,BENCH\\tu-%07d,%s' % (i, i, i, i, source))
+
+    return '\n'.join(lines) + '\n'
+
+
+# ------------------------------------------------------------------------------
+def generate_package_dir(path, count, ext='rpm'):
+    """
+    Creates count empty package files in path, named like the Authentication
+    Services packages with distinct alphabetic package names.
+    """
+
+    if not os.path.isdir(path):
+        os.makedirs(path)
+
+    for i in range(count):
+        name = ''
+        n = i
+        while True:
+            n, r = divmod(n, 26)
+            name = chr(ord('a') + r) + name
+            if not n:
+                break
+        pkg_path = os.path.join(path, 'vas' + name + '-5.1.0-' + str(i) + '.x86_64.' + ext)
+        open(pkg_path, 'w').close()
+
+
+# ------------------------------------------------------------------------------
+def generate_vastool_users_allowed_output(count, seed=0):
+    """
+    Returns vastool list users-allowed output with count users.
+    """
+
+    rnd = random.Random(seed)
+    lines = []
+    for i in range(count):
+        lines.append('tu-%07d@BENCH.SB:VAS:%d:%d:Test User %d:/home/tu-%07d:%s' % (
+            i, ID_BASE + i, ID_BASE + rnd.randint(0, 99), i, i, rnd.choice(['/bin/bash', '/bin/sh'])))
+
+    return '\n'.join(lines) + '\n'
+
+
+# ------------------------------------------------------------------------------
+def generate_passwd_rows(count, disabled_ratio=DISABLED_RATIO_DEFAULT, seed=0):
+    """
+    Returns count /etc/passwd entries split into fields, the records the
+    get_local_unix_users module returns.
+    """
+
+    rnd = random.Random(seed)
+    rows = []
+    for i in range(count):
+        shell = '/bin/false' if rnd.random() < disabled_ratio else '/bin/bash'
+        rows.append(['lu%07d' % i, 'x', str(ID_BASE + i), str(ID_BASE + rnd.randint(0, 99)),
+            'Local User %d' % i, '/home/lu%07d' % i, shell])
+
+    return rows
+
+
+# ------------------------------------------------------------------------------
+def generate_group_rows(count, seed=0):
+    """
+    Returns count /etc/group entries split into fields, the records the
+    get_local_unix_groups module returns, with 0 to 100 members each.
+    """
+
+    rnd = random.Random(seed)
+    rows = []
+    for i in range(count):
+        members = ','.join('lu%07d' % rnd.randint(0, count) for _ in range(rnd.choice([0, 1, 5, 100])))
+        rows.append(['lg%07d' % i, 'x', str(ID_BASE + i), members])
+
+    return rows
+
+
+# ------------------------------------------------------------------------------
+def generate_vasd_cache(path, count, version=4, seed=0):
+    """
+    Creates a vasd identity cache database in path with count users and
+    count / 10 groups in the table layout of schema version, about 90% of the
+    users are allowed to log on.
+    """
+
+    rnd = random.Random(seed)
+    if os.path.exists(path):
+        os.remove(path)
+
+    conn = sqlite3.connect(path)
+    conn.execute('CREATE TABLE usercache (name TEXT, passwd TEXT, uid INTEGER, gid INTEGER, '
+        'gecos TEXT, home TEXT, shell TEXT, access_allowed INTEGER)')
+    conn.execute('CREATE INDEX usercache_name ON usercache (name)')
+    conn.execute('CREATE INDEX usercache_uid ON usercache (uid)')
+    conn.execute('CREATE TABLE groupcache (name TEXT, passwd TEXT, gid INTEGER, members TEXT)')
+    conn.execute('CREATE INDEX groupcache_name ON groupcache (name)')
+    conn.execute('CREATE INDEX groupcache_gid ON groupcache (gid)')
+    conn.executemany('INSERT INTO usercache VALUES (?, ?, ?, ?, ?, ?, ?, ?)', (
+        ('tu-%07d@BENCH.SB' % i, 'VAS', ID_BASE + i, ID_BASE + rnd.randint(0, 99), 'Test User %d' % i,
+         '/home/tu-%07d' % i, rnd.choice(['/bin/bash', '/bin/sh']), int(rnd.random() < 0.9))
+        for i in range(count)))
+    conn.executemany('INSERT INTO groupcache VALUES (?, ?, ?, ?)', (
+        ('tg-%07d@BENCH.SB' % i, 'VAS', ID_BASE + i, ','.join('tu-%07d@BENCH.SB' % (i * 10 + j) for j in range(10)))
+        for i in range(max(count // 10, 1))))
+    conn.execute('PRAGMA user_version = %d' % version)
+    conn.commit()
+    conn.close()
+
+
+# ------------------------------------------------------------------------------
+def size_label(size):
+    """
+    Returns a short label for a fixture size, e.g. 10k or 1m.
+    """
+
+    if size % 1000000 == 0:
+        return str(size // 1000000) + 'm'
+    if size % 1000 == 0:
+        return str(size // 1000) + 'k'
+    return str(size)
+
+
+# ------------------------------------------------------------------------------
+def write_fixture(path, objects):
+    """
+    Writes objects as JSON to path.
+    """
+
+    with open(path, 'w') as fixture_file:
+        json.dump(objects, fixture_file)
+
+
+# ------------------------------------------------------------------------------
+def main():
+    """
+    Main
+    """
+
+    parser = argparse.ArgumentParser(description='Generate synthetic AD objects for benchmarks.')
+    parser.add_argument('-o', '--output-dir', default='fixtures',
+        help='Directory to write the fixture files to (default: fixtures)')
+    parser.add_argument('-s', '--sizes', type=int, nargs='+', default=SIZES_DEFAULT,
+        help='Number of objects per fixture (default: 10000 100000 1000000)')
+    parser.add_argument('--seed', type=int, default=0,
+        help='Random seed (default: 0)')
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.output_dir):
+        os.makedirs(args.output_dir)
+
+    generators = [
+        ('ad_users', generate_user_objects),
+        ('ad_groups', generate_group_objects)
+    ]
+    for size in args.sizes:
+        for prefix, generator in generators:
+            for form, schemaless in (('schema', False), ('schemaless', True)):
+                path = os.path.join(args.output_dir, prefix + '_' + form + '_' + size_label(size) + '.json')
+                write_fixture(path, generator(size, schemaless=schemaless, seed=args.seed))
+                print(path)
+
+
+# When run from command line
+# ------------------------------------------------------------------------------
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: sas_snapshot_facts.py
+# Desc: Ansible action that sets the facts of a host from the controller side
+#       snapshot without connecting to the host.
+# Auth: Laszlo Nagy
+# Note: See the sas_snapshot_facts module for documentation.
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+# Future module imports for consistency across Python versions
+from __future__ import absolute_import, division, print_function
+
+# Want classes to be new type for consistency across Python versions
+__metaclass__ = type
+
+from ansible.plugins.action import ActionBase
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.snapshot as ss
+
+
+# ------------------------------------------------------------------------------
+# Classes
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+class ActionModule(ActionBase):
+    """
+    Snapshot facts action, runs on the Ansible control node only
+    """
+
+    TRANSFERS_FILES = False
+    _VALID_ARGS = frozenset(['path', 'keys'])
+
+    def run(self, tmp=None, task_vars=None):
+        result = super(ActionModule, self).run(tmp, task_vars)
+        del tmp
+
+        # Parameters
+        path = self._task.args.get('path') or ss.SNAPSHOT_PATH_DEFAULT
+        keys = self._task.args.get('keys') or []
+        if not isinstance(keys, list):
+            keys = [keys]
+        host = task_vars.get('inventory_hostname') if task_vars else None
+
+        # Load facts of the host, a host missing from the snapshot is not an
+        # error so its reports show it without facts like an unreachable host
+        err, found, facts = ss.load_facts(path, host, keys)
+
+        # Build result
+        result['changed'] = False
+        result['failed'] = err is not None
+        result['msg'] = err if err is not None else ''
+        result['found'] = found
+        if err is None:
+            result['ansible_facts'] = facts
+
+        # Return
+        return result
@@ -0,0 +1,157 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: sas_snapshot.py
+# Desc: Ansible callback that writes the facts collected by the roles to the
+#       controller side snapshot as task results arrive.
+# Auth: Laszlo Nagy
+# Note:
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+# Future module imports for consistency across Python versions
+from __future__ import absolute_import, division, print_function
+
+# Want classes to be new type for consistency across Python versions
+__metaclass__ = type
+
+from ansible.plugins.callback import CallbackBase
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.snapshot as ss
+
+
+# ------------------------------------------------------------------------------
+# Required Ansible documentation
+# ------------------------------------------------------------------------------
+
+DOCUMENTATION = """
+---
+callback: sas_snapshot
+
+type: aggregate
+
+short_description: Writes the facts collected by the roles to a snapshot
+
+version_added: '2.9'
+
+description: >
+    Stores the sas_* facts of every host and the host facts the reports use in
+    a SQLite snapshot on the Ansible control node as task results arrive.
+    Hosts are indexed by Active Directory domain and users by host, name and
+    UID.  Reports can then be generated from the snapshot with the
+    reports_from_snapshot role variable without connecting to the hosts.
+    Facts are committed at the start of every task and at the end of the
+    playbook.
+
+requirements:
+    - Enable in ansible.cfg callbacks_enabled (callback_whitelist before Ansible 2.11)
+    - Python sqlite3 module on the Ansible control node
+
+options:
+    path:
+        description: Snapshot database path on the Ansible control node
+        type: path
+        default: ~/.ansible/sas_snapshot.db
+        env:
+            - name: SAS_SNAPSHOT_PATH
+        ini:
+            - section: callback_sas_snapshot
+              key: path
+
+author:
+    - Laszlo Nagy (laszlo.nagy@oneidentity.com)
+"""
+
+
+# ------------------------------------------------------------------------------
+# Constants
+# ------------------------------------------------------------------------------
+
+# Actions whose facts come from the snapshot and are not written back
+SNAPSHOT_ACTIONS = [
+    'sas_snapshot_facts',
+    'oneidentity.authentication_services.sas_snapshot_facts'
+]
+
+
+# ------------------------------------------------------------------------------
+# Classes
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+class CallbackModule(CallbackBase):
+    """
+    Snapshot callback
+    """
+
+    CALLBACK_VERSION = 2.0
+    CALLBACK_TYPE = 'aggregate'
+    CALLBACK_NAME = 'oneidentity.authentication_services.sas_snapshot'
+    CALLBACK_NEEDS_ENABLED = True
+    CALLBACK_NEEDS_WHITELIST = True
+
+    def __init__(self, display=None):
+        super(CallbackModule, self).__init__(display=display)
+        self.conn = None
+        self.disabled = False
+
+    def set_options(self, task_keys=None, var_options=None, direct=None):
+        super(CallbackModule, self).set_options(task_keys=task_keys, var_options=var_options, direct=direct)
+
+        err, self.conn = ss.connect(self.get_option('path'))
+        if err is not None:
+            self._display.warning('sas_snapshot callback disabled: ' + err)
+            self.disabled = True
+
+    def store(self, result):
+        """
+        Store the facts of a task result, of every loop item for loops
+        """
+
+        if self.conn is None or result._task.action in SNAPSHOT_ACTIONS:
+            return
+
+        host = result._host.get_name()
+        if result._task.delegate_to and result._task.delegate_facts:
+            host = result._result.get('_ansible_delegated_vars', {}).get('ansible_delegated_host', host)
+
+        for item_result in [result._result] + result._result.get('results', []):
+            facts = item_result.get('ansible_facts') if isinstance(item_result, dict) else None
+            if facts:
+                try:
+                    ss.store_facts(self.conn, host, facts)
+                except ss.sqlite3.Error as e:
+                    self._display.warning('sas_snapshot callback cannot store facts of ' + host + ': ' + str(e))
+
+    def commit(self):
+        """
+        Commit the facts stored since the last commit
+        """
+
+        if self.conn is None:
+            return
+
+        try:
+            self.conn.commit()
+        except ss.sqlite3.Error as e:
+            self._display.warning('sas_snapshot callback cannot commit facts: ' + str(e))
+
+    def v2_runner_on_ok(self, result):
+        self.store(result)
+
+    def v2_playbook_on_task_start(self, task, is_conditional):
+        self.commit()
+
+    def v2_playbook_on_handler_task_start(self, task):
+        self.commit()
+
+    def v2_playbook_on_stats(self, stats):
+        self.commit()
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
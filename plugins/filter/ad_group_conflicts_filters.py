@@ -21,6 +21,10 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from ansible.errors import AnsibleFilterError
+from ansible_collections.oneidentity.authentication_services.plugins.module_utils.id_conflicts import (
+    select_duplicates, select_top_duplicates)
+from ansible_collections.oneidentity.authentication_services.plugins.module_utils.alt_security_identities import (
+    parse_alt_security_identities, POSIX_GROUP_LABEL)
 
 
 # ------------------------------------------------------------------------------
@@ -28,7 +32,7 @@ from ansible.errors import AnsibleFilterError
 # ------------------------------------------------------------------------------
 
 # ------------------------------------------------------------------------------
-def select_conflicting_groups_by_schema(group_objects_list, group_gid_number_attr, group_name_attr):
+def select_conflicting_groups_by_schema(group_objects_list, group_gid_number_attr, group_name_attr, top=0):
     """
     Safeguard Authentication Services is designed to support any Active Directory schema
     configuration. If your Active Directory schema has built-in support for Unix attributes
@@ -52,8 +56,17 @@ def select_conflicting_groups_by_schema(group_objects_list, group_gid_number_att
     },
     """
 
+    return select_conflicting_groups(
+        lambda: groups_by_schema(group_objects_list, group_gid_number_attr, group_name_attr), top)
+
+
+def groups_by_schema(group_objects_list, group_gid_number_attr, group_name_attr):
+    """
+    Yields the DistinguishedName, name and GID number of each Unix-enabled
+    group object.
+    """
+
     attrs = ['DistinguishedName', group_name_attr, group_gid_number_attr]
-    groups = []
     for group_object in group_objects_list:
         group = []
         for attr in attrs:
@@ -64,12 +77,10 @@ def select_conflicting_groups_by_schema(group_objects_list, group_gid_number_att
         # A Group object is considered to be 'Unix-enabled' if it has values for
         # the Group GID Number and Group Name.
         if group[1] and group[2]:
-            groups.append(group)
+            yield group
 
-    return select_conflicting_groups(groups)
 
-
-def select_conflicting_groups_when_schemaless(group_objects_list):
+def select_conflicting_groups_when_schemaless(group_objects_list, top=0):
     """
     If your Active Directory schema does not natively support Unix account attributes
     and a schema extension is not possible, Safeguard Authentication Services uses "schemaless"
@@ -97,19 +108,19 @@ def select_conflicting_groups_when_schemaless(group_objects_list):
     }
     """
 
+    return select_conflicting_groups(lambda: groups_when_schemaless(group_objects_list), top)
+
+
+def groups_when_schemaless(group_objects_list):
+    """
+    Yields the DistinguishedName, name and GID number of each Unix-enabled
+    schemaless group object.
+    """
+
     attrs = ['GroupName', 'GroupGidNumber']
-    groups = []
     for group_object in group_objects_list:
-        group = []
-        for attr in attrs:
-            alt_sec_ids = group_object['altSecurityIdentities']
-            for alt_sec_id in alt_sec_ids:
-                label = 'X509:<S>CN=Posix Group<I>CN=Quest Software<DATA>' + attr + ':'
-                if label in alt_sec_id:
-                    group.append(alt_sec_id[len(label):].strip())
-                    break
-            else:
-                group.append('')
+        alt_sec_attrs = parse_alt_security_identities(group_object['altSecurityIdentities'], POSIX_GROUP_LABEL)
+        group = [alt_sec_attrs.get(attr, '') for attr in attrs]
 
         # A Group object is considered to be 'Unix-enabled' if it has values for
         # the Group GID Number and Group Name.
@@ -119,31 +130,25 @@ def select_conflicting_groups_when_schemaless(group_objects_list):
                 group.insert(0, group_object[dn])
             else:
                 group.insert(0, '')
-            groups.append(group)
+            yield group
 
-    return select_conflicting_groups(groups)
 
+def select_conflicting_groups(make_groups, top=0):
+    """
+    Groups [DistinguishedName, name, GID number] lists by GID number and returns
+    the GID numbers that are assigned to more than one group.
+
+    make_groups is a function returning a generator of the groups.  It is read
+    once, holding a group per distinct GID number while grouping.  If top is
+    greater than zero then only the top GID numbers with the most groups are
+    returned, reading the groups twice but holding only a count per distinct
+    GID number and the groups of the top GID numbers.
+    """
 
-def select_conflicting_groups(groups):
-
-    conflicting_groups = {}
-    if len(groups) < 2:
-        return conflicting_groups
-
-    for id_outer, group_outer in enumerate(groups):
-        for id_inner, group_inner in enumerate(groups):
-            if id_inner <= id_outer:
-                continue
-            if group_outer[2] == group_inner[2]:
-                group_gid_number = group_outer[2]
-                if group_gid_number not in conflicting_groups:
-                    conflicting_groups[group_gid_number] = []
-                if group_outer not in conflicting_groups[group_gid_number]:
-                    conflicting_groups[group_gid_number].append(group_outer)
-                if group_inner not in conflicting_groups[group_gid_number]:
-                    conflicting_groups[group_gid_number].append(group_inner)
+    if top > 0:
+        return select_top_duplicates(make_groups, lambda group: group[2], top)
 
-    return conflicting_groups
+    return select_duplicates(make_groups(), lambda group: group[2])
 
 
 # ------------------------------------------------------------------------------
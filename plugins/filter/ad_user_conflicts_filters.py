@@ -21,6 +21,9 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from ansible.errors import AnsibleFilterError
+from ansible_collections.oneidentity.authentication_services.plugins.module_utils.id_conflicts import select_duplicates
+from ansible_collections.oneidentity.authentication_services.plugins.module_utils.alt_security_identities import (
+    parse_alt_security_identities, POSIX_ACCOUNT_LABEL)
 
 
 # ------------------------------------------------------------------------------
@@ -63,53 +66,35 @@ def select_conflicting_users(user_objects_list, uid_attr, shell_attr):
     if not isinstance(user_objects_list, list):
         raise AnsibleFilterError("selectconflictingusers requires a list, got %s instead." % type(user_objects_list))
 
-    conflicting_users = {}
     if len(user_objects_list) < 2:
-        return conflicting_users
+        return {}
+
+    return select_duplicates(unix_enabled_users(user_objects_list, uid_attr, shell_attr),
+        lambda user: user['uidNumber'])
+
+
+# ------------------------------------------------------------------------------
+def unix_enabled_users(user_objects_list, uid_attr, shell_attr):
+    """
+    Yields the uidNumber, DistinguishedName and sAMAccountName of each user
+    object whose login shell is not /bin/false.
+    """
 
-    users = []
     if 'altSecurityIdentities' in user_objects_list[0]:
-        uid_label = 'X509:<S>CN=Posix Account<I>CN=Quest Software<DATA>UidNumber:'
-        shell_label = 'X509:<S>CN=Posix Account<I>CN=Quest Software<DATA>LoginShell:'
         for user_object in user_objects_list:
-            attr_list = user_object['altSecurityIdentities']
-            unix_enabled = True
-            for attr in attr_list:
-                if shell_label in attr:
-                    shell = attr[ len(shell_label) : ].strip()
-                    if shell == '/bin/false':
-                        unix_enabled = False
-                    break
-            if unix_enabled:
-                for attr in attr_list:
-                    if uid_label in attr:
-                        users.append({
-                            'uidNumber': attr[ len(uid_label) : ].strip(),
-                            'DistinguishedName': user_object['DistinguishedName'],
-                            'sAMAccountName': user_object['sAMAccountName']})
-                        break
+            alt_sec_attrs = parse_alt_security_identities(user_object['altSecurityIdentities'], POSIX_ACCOUNT_LABEL)
+            if alt_sec_attrs.get('LoginShell') != '/bin/false' and 'UidNumber' in alt_sec_attrs:
+                yield {
+                    'uidNumber': alt_sec_attrs['UidNumber'],
+                    'DistinguishedName': user_object['DistinguishedName'],
+                    'sAMAccountName': user_object['sAMAccountName']}
     elif uid_attr in user_objects_list[0]:
         for user_object in user_objects_list:
             if user_object[shell_attr] != '/bin/false':
-                users.append({
+                yield {
                     'uidNumber': user_object[uid_attr],
                     'DistinguishedName': user_object['DistinguishedName'],
-                    'sAMAccountName': user_object['sAMAccountName']})
-
-    for id_outer, user_outer in enumerate(users):
-        for id_inner, user_inner in enumerate(users):
-            if id_inner <= id_outer:
-                continue
-            if user_outer['uidNumber'] == user_inner['uidNumber']:
-                uid_number = user_outer['uidNumber']
-                if uid_number not in conflicting_users:
-                    conflicting_users[uid_number] = []
-                if user_outer not in conflicting_users[uid_number]:
-                    conflicting_users[uid_number].append(user_outer)
-                if user_inner not in conflicting_users[uid_number]:
-                    conflicting_users[uid_number].append(user_inner)
-
-    return conflicting_users
+                    'sAMAccountName': user_object['sAMAccountName']}
 
 
 # ------------------------------------------------------------------------------
@@ -0,0 +1,77 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: fact_delta_filters.py
+# Desc: Ansible filters for the delta facts of the local_unix_users,
+#       local_unix_groups and logon_policy_for_unix_host roles
+# Auth: Laszlo Nagy
+# Note:
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+# Future module imports for consistency across Python versions
+from __future__ import absolute_import, division, print_function
+
+# Want classes to be new type for consistency across Python versions
+__metaclass__ = type
+
+from ansible.module_utils.common._collections_compat import Mapping
+from ansible.errors import AnsibleFilterError
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.fact_delta as fd
+
+
+# ------------------------------------------------------------------------------
+# Helper functions
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def apply_fact_delta(facts, baseline_facts, records_key):
+    """
+    Full facts from the facts of a module run with delta set (facts) and the
+    facts of the run the delta is relative to (baseline_facts).  records_key is
+    the key of the records, e.g. local_unix_users.  Facts without delta already
+    have all records and are returned as they are.
+    """
+
+    # Make sure facts are dictionaries
+    if not isinstance(facts, Mapping):
+        raise AnsibleFilterError("applyfactdelta requires a dictionary, got %s instead." % type(facts))
+    if 'delta' not in facts:
+        return facts
+    if not isinstance(baseline_facts, Mapping) or records_key not in baseline_facts:
+        raise AnsibleFilterError("applyfactdelta requires the baseline facts with %s." % records_key)
+
+    # The delta must be relative to the baseline records
+    delta = facts['delta']
+    if baseline_facts.get('delta_version') != delta.get('baseline'):
+        raise AnsibleFilterError(
+            "applyfactdelta baseline version %s does not match the delta baseline %s." %
+            (baseline_facts.get('delta_version'), delta.get('baseline')))
+
+    # Return full facts
+    full_facts = dict((key, value) for key, value in facts.items() if key != 'delta')
+    full_facts[records_key] = fd.apply_delta(baseline_facts[records_key], delta)
+    return full_facts
+
+
+# ------------------------------------------------------------------------------
+# Classes
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+class FilterModule(object):
+    """
+    Delta facts jinja2 filters
+    """
+
+    def filters(self):
+        filters = {
+            'applyfactdelta': apply_fact_delta,
+        }
+        return filters
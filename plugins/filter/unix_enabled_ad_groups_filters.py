@@ -21,6 +21,8 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from ansible.errors import AnsibleFilterError
+from ansible_collections.oneidentity.authentication_services.plugins.module_utils.alt_security_identities import (
+    parse_alt_security_identities, POSIX_GROUP_LABEL)
 
 
 # ------------------------------------------------------------------------------
@@ -100,16 +102,8 @@ def extract_properties_when_schemaless(group_objects_list):
     attrs = ['GroupName', 'GroupGidNumber']
     groups = []
     for group_object in group_objects_list:
-        group = []
-        for attr in attrs:
-            alt_sec_ids = group_object['altSecurityIdentities']
-            for alt_sec_id in alt_sec_ids:
-                label = 'X509:<S>CN=Posix Group<I>CN=Quest Software<DATA>' + attr + ':'
-                if label in alt_sec_id:
-                    group.append(alt_sec_id[len(label):].strip())
-                    break
-            else:
-                group.append('')
+        alt_sec_attrs = parse_alt_security_identities(group_object['altSecurityIdentities'], POSIX_GROUP_LABEL)
+        group = [alt_sec_attrs.get(attr, '') for attr in attrs]
 
         # A Group object is considered to be 'Unix-enabled' if it has values for
         # the Group GID Number and Group Name.
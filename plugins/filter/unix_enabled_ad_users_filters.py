@@ -21,6 +21,8 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from ansible.errors import AnsibleFilterError
+from ansible_collections.oneidentity.authentication_services.plugins.module_utils.alt_security_identities import (
+    parse_alt_security_identities, POSIX_ACCOUNT_LABEL)
 
 
 # ------------------------------------------------------------------------------
@@ -120,16 +122,8 @@ def extract_properties_when_schemaless(user_objects_list):
         'UserGidNumber', 'Gecos', 'HomeDirectory', 'LoginShell']
     users = []
     for user_object in user_objects_list:
-        user = []
-        for attr in attrs:
-            alt_sec_ids = user_object['altSecurityIdentities']
-            for alt_sec_id in alt_sec_ids:
-                label = 'X509:<S>CN=Posix Account<I>CN=Quest Software<DATA>' + attr + ':'
-                if label in alt_sec_id:
-                    user.append(alt_sec_id[len(label):].strip())
-                    break
-            else:
-                user.append('')
+        alt_sec_attrs = parse_alt_security_identities(user_object['altSecurityIdentities'], POSIX_ACCOUNT_LABEL)
+        user = [alt_sec_attrs.get(attr, '') for attr in attrs]
 
         # A User object is considered to be 'Unix-enabled' if it has values for
         # the UID Number, Primary GID Number, Home Directory and Login Shell.
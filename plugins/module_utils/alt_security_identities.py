@@ -0,0 +1,58 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: alt_security_identities.py
+# Desc: Ansible utils module that parses the Unix attributes stored in the
+#       altSecurityIdentities attribute of schemaless Active Directory objects.
+# Auth: Laszlo Nagy
+# Note:
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Constants
+# ------------------------------------------------------------------------------
+
+# Labels that prefix the Unix attributes of users and groups
+POSIX_ACCOUNT_LABEL = 'X509:<S>CN=Posix Account<I>CN=Quest Software<DATA>'
+POSIX_GROUP_LABEL = 'X509:<S>CN=Posix Group<I>CN=Quest Software<DATA>'
+
+
+# ------------------------------------------------------------------------------
+# Functions
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def parse_alt_security_identities(alt_sec_ids, label):
+    """
+    If your Active Directory schema does not natively support Unix account attributes
+    and a schema extension is not possible, Safeguard Authentication Services uses "schemaless"
+    functionality where Unix account information is stored in the altSecurityIdentities attribute.
+    Example of alt_sec_ids for label POSIX_ACCOUNT_LABEL:
+    [
+        "X509:<S>CN=Posix Account<I>CN=Quest Software<DATA>LoginShell: /bin/sh",
+        "X509:<S>CN=Posix Account<I>CN=Quest Software<DATA>UidNumber:8085"
+    ]
+
+    Returns a dictionary of the Unix attributes, for the example above:
+    {
+        "LoginShell": "/bin/sh",
+        "UidNumber": "8085"
+    }
+
+    Every entry is split once, entries that do not start with label are
+    skipped.  If an attribute appears more than once the first value wins.
+    """
+
+    attrs = {}
+    label_len = len(label)
+    for alt_sec_id in alt_sec_ids:
+        if not alt_sec_id.startswith(label):
+            continue
+        attr, sep, value = alt_sec_id[label_len:].partition(':')
+        if sep and attr not in attrs:
+            attrs[attr] = value.strip()
+
+    return attrs
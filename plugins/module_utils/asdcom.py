@@ -0,0 +1,151 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: asdcom.py
+# Desc: Ansible utils module that finds the local Unix users that are mapped
+#       to Active Directory accounts with asdcom.
+# Auth: Laszlo Nagy
+# Note:
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+from io import StringIO
+import csv
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.exec_cmd as ec
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.vastool as vt
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.check_file_exec as cfe
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.local_unix as lu
+
+
+# ------------------------------------------------------------------------------
+# Constants
+# ------------------------------------------------------------------------------
+
+# asdcom
+ASDCOM_PATH = '/opt/quest/libexec/vas/sugi/asdcom'
+
+# Number of seconds asdcom may run before it is killed
+ASDCOM_TIMEOUT = 120
+
+
+# ------------------------------------------------------------------------------
+# Functions
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def get_mapped_users_with_gecos():
+    """
+    Get the local Unix users that are required to use Active Directory
+    credentials to log on, as [Unix name, AD account, GECOS] lists.
+
+    Returns an err value that contains None if no error or a string describing
+    the error, and the list of mapped users.  If the host is not joined then
+    the list is empty.
+    """
+
+    # Return values
+    err = None
+    mapped_users = []
+    gecos_of_users = {}
+
+    while True:
+        err, version = cfe.check_file_exec(vt.VASTOOL_PATH, '')
+        if err is not None:
+            break
+
+        status_domain = vt.vastool_status()
+        if status_domain is None:
+            break
+
+        err, version = cfe.check_file_exec(ASDCOM_PATH, '')
+        if err is not None:
+            break
+
+        err, mapped_users = asdcom_get_mapped_users()
+        if err is not None:
+            break
+
+        # Only keep the local users that are mapped
+        mapped_user_names = set(mapped_user[0] for mapped_user in mapped_users)
+        err, local_unix_users = lu.read_users(lambda user: user[0] in mapped_user_names)
+        if err is not None:
+            break
+
+        for user in local_unix_users:
+            gecos_of_users[user[0]] = user[4]
+
+        for mapped_user in mapped_users:
+            if mapped_user[0] in gecos_of_users:
+                mapped_user.append(gecos_of_users[mapped_user[0]])
+
+        break
+
+    # Return
+    return err, mapped_users
+
+
+# ------------------------------------------------------------------------------
+def asdcom_get_mapped_users():
+    """
+    Call asdcom GetMappedUsers
+    """
+
+    # Return values
+    err = None
+    mapped_users = []
+
+    # Build vastool command
+    cmd = []
+    cmd += [ASDCOM_PATH]
+    cmd += ['GetMappedUsers']
+
+    # Call asdcom
+    rc, rval_str, _ = ec.exec_cmd(cmd, ASDCOM_TIMEOUT)
+    if rc == 0:
+        # Parse asdcom return
+        err, mapped_users = parse_asdcom_stdout(rval_str)
+
+    # Return
+    return err, mapped_users
+
+
+# ------------------------------------------------------------------------------
+def parse_asdcom_stdout(stdout_str):
+    """
+    The original code in script used by MCU:
+    GetMappedUsers()
+    {
+        $ASDCOM GetMappedUsers | sed '1d' | grep -v "NSS$" 2> /dev/null
+    }
+
+    Example result:
+    $ /opt/quest/libexec/vas/sugi/asdcom GetMappedUsers
+    UPN,ULoginName,UniqueID,NTName,SourceFile
+    abaelemer@QASDEV.oi,abaeleloc,73D5FC4F-0B9A-470C-A9B1-7508C2671922,QASDEV\abaelemer,/etc/opt/quest/vas/console_mappings
+    abativadar@qasdev.oi,abativloc,B5D09597-4750-4B1F-888F-925BDF43850E,QASDEV\abativadar,/etc/vas-user-map-file
+    """
+
+    # Return values
+    err = None
+    mapped_users = []
+
+    first_row = True
+
+    text_stream = StringIO(stdout_str)
+    csv_reader = csv.reader(text_stream)
+    for row in csv_reader:
+        if first_row:
+            first_row = False
+            continue
+        if row[-1].endswith('NSS'):
+            continue
+        mapped_users.append([ row[1], row[3] ])
+
+    # Return
+    return err, mapped_users
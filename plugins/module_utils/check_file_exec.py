@@ -15,10 +15,18 @@
 # Imports
 # ------------------------------------------------------------------------------
 
-import sys
 import os
-import subprocess
 import re
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.exec_cmd as ec
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.vastool_cache as vc
+
+
+# ------------------------------------------------------------------------------
+# Constants
+# ------------------------------------------------------------------------------
+
+# Number of seconds getting the version may take
+VERSION_TIMEOUT = 60
 
 
 # ------------------------------------------------------------------------------
@@ -46,9 +54,14 @@ def check_file_exec(file_path, version_cmd):
         if not x_ok:
             err = 'Insufficient permissions to execute ' + file_path
 
-    # Get version
+    # Get version, cached on the host between module runs
     if not err and version_cmd:
-        err, version = get_file_version(file_path, version_cmd)
+        cache_name = 'version ' + file_path + ' ' + version_cmd
+        hit, version = vc.cache_get(cache_name, file_path)
+        if not hit:
+            err, version = get_file_version(file_path, version_cmd)
+            if not err:
+                vc.cache_put(cache_name, file_path, version)
 
     # Return
     return err, version
@@ -70,14 +83,7 @@ def get_file_version(file_path, version_cmd):
     cmd += [version_cmd]
 
     # Exec file to get version
-    try:
-        p = subprocess.Popen(' '.join(cmd), stdin=None, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=True)
-        rval_bytes, rval_err = p.communicate()
-        rval_bytes += rval_err
-    except subprocess.CalledProcessError as e:
-        rval_bytes = e.output
-    # Popen returns list of bytes so we have to decode to get a string
-    rval_str = rval_bytes.decode(sys.stdout.encoding)
+    _, rval_str, _ = ec.exec_cmd(cmd, VERSION_TIMEOUT)
 
     # Compile regex
     vers_re_str = r'(?=.*)[\d]+\.[\d]+\.[\d]+[\.-][\d]+'
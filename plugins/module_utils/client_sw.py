@@ -0,0 +1,438 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: client_sw.py
+# Desc: Shared code for the client_sw role plugins: package ordering, version
+#       comparison, package action planning and the client software directory
+#       manifest.
+# Auth: Laszlo Nagy
+# Note:
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+import hashlib
+import json
+import os
+import re
+
+
+# ------------------------------------------------------------------------------
+# Constants
+# ------------------------------------------------------------------------------
+
+# vasclnt packages, removed last and installed first
+VASCLNT_PKGS = ['vasclnt', 'vasclnts']
+
+# Package states in processing order with the vasclnt order of each state
+PKG_STATES = [
+    ('absent', 'last'),
+    ('present', 'first'),
+    ('check', None),
+    (None, None)
+]
+
+# Package actions
+ACTION_NONE = 'none'
+ACTION_INSTALL = 'install'
+ACTION_UPGRADE = 'upgrade'
+ACTION_DOWNGRADE = 'downgrade'
+ACTION_REMOVE = 'remove'
+
+# Actions that need the install package on the host
+FILE_ACTIONS = [ACTION_INSTALL, ACTION_UPGRADE, ACTION_DOWNGRADE]
+
+# Package state change reported for each action
+ACTION_RESULTS = {
+    ACTION_NONE: 'none',
+    ACTION_INSTALL: 'installed',
+    ACTION_UPGRADE: 'upgraded',
+    ACTION_DOWNGRADE: 'downgraded',
+    ACTION_REMOVE: 'removed'
+}
+
+# Package name and version in install package file names
+PKG_NAME_RE = re.compile(r'^[a-z]+', re.I)
+PKG_VERS_RE = re.compile(r'(?=.*)[\d]+\.[\d]+\.[\d]+[\.-][\d]+(?=\D\D)')
+
+# Manifest of the client software directory
+MANIFEST_FILE = '.client_sw_manifest.json'
+MANIFEST_VERSION = 1
+
+# Number of bytes read at a time when computing checksums
+CHECKSUM_CHUNK_SIZE = 1024 * 1024
+
+
+# ------------------------------------------------------------------------------
+# Functions
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def pkg_dict_2_items(pkg_dict):
+    """
+    Transforms a dictionary of package (pkg_dict) to a item list of packages
+    ordered by package state and name.  pkg_dict is emptied.
+
+    Absent packages are ordered first with vasclnt(s) always coming last and all
+    other packages in alphabetical order.
+
+    Present packages are ordered next with vasclnt(s) always coming first and all
+    other packages in alphabetical order.
+
+    Check packages are ordered next in alphabetical order.
+
+    Packages with an unexpected state value are ordered last in alphabetical
+    order.
+    """
+
+    # Build package items list
+    pkg_items = []
+    for pkg_state, vasclnt_order in PKG_STATES:
+        pkg_items_append(pkg_items, pkg_dict, pkg_state, vasclnt_order)
+
+    # Return list of package items ready for Ansible iteration
+    return pkg_items
+
+
+# ------------------------------------------------------------------------------
+def pkg_items_append(pkg_items, pkg_dict, pkg_state, vasclnt_order):
+    """
+    Append packages from pkg_dict to pkg_items if their state matches pkg_state.
+
+    vasclnt order can be 'first', 'last', or None which controls the order in
+    which vasclnt is added to the list.  'first' and 'last' are self-
+    explanatory and None adds vasclnt in alphabetical order like the rest of the
+    packages.
+
+    pkg_items is a list of package dicts with 'key' and 'value' keys for the
+    package name and state.  This is a format Ansible expects for an item
+    list (Ansible loop control statement.)
+    """
+
+    # vasclnt first
+    if vasclnt_order == 'first':
+        for pkg in VASCLNT_PKGS:
+            pkg_item_append(pkg_items, pkg_dict, pkg, pkg_state)
+
+    # Add all packages including vasclnt if order is None
+    # Make a copy of pkt_dict to iterate because we may modify pkg_dict during iteration
+    pkg_dict_temp = pkg_dict.copy()
+    for pkg in sorted(pkg_dict_temp):
+        if vasclnt_order is None or pkg not in VASCLNT_PKGS:
+            pkg_item_append(pkg_items, pkg_dict, pkg, pkg_state)
+
+    # vasclnt last
+    if vasclnt_order == 'last':
+        for pkg in VASCLNT_PKGS:
+            pkg_item_append(pkg_items, pkg_dict, pkg, pkg_state)
+
+
+# ------------------------------------------------------------------------------
+def pkg_item_append(pkg_items, pkg_dict, pkg_name, pkg_state):
+    """
+    Append package from pkg_dict to pkg_items and remove it from pkg_dict if its
+    name matches pkg_name and its state matches pkg_state.  Note that a
+    pkg_state of None will match any state.
+
+    pkg_items is a list of package dicts with 'key' and 'value' keys for the
+    package name and state.  This is a format Ansible expects for an item
+    list (Ansible loop control statement.)
+    """
+
+    if pkg_name in pkg_dict:
+        if pkg_dict[pkg_name] == pkg_state or pkg_state is None:
+            pkg_items.append({'key': pkg_name, 'value': pkg_dict[pkg_name]})
+            del pkg_dict[pkg_name]
+
+
+# ------------------------------------------------------------------------------
+def version_key(vers):
+    """
+    Sort key of a version string like 5.1.0.123, numeric parts compare as
+    numbers so 5.1.0.99 < 5.1.0.123.
+    """
+
+    return [(0, int(part), '') if part.isdigit() else (1, 0, part) for part in re.split(r'[.\-]', vers)]
+
+
+# ------------------------------------------------------------------------------
+def compare_versions(vers_a, vers_b):
+    """
+    Compare two version strings, returns -1, 0 or 1.
+    """
+
+    key_a = version_key(vers_a)
+    key_b = version_key(vers_b)
+
+    return (key_a > key_b) - (key_a < key_b)
+
+
+# ------------------------------------------------------------------------------
+def plan_actions(pkg_state, packages, versions):
+    """
+    Plan the action of each package in pkg_dict_2_items order.
+
+    pkg_state maps package name to the requested state, packages is the
+    client_sw_pkgs packages dictionary of the available install packages and
+    versions maps package name to the installed version ('' if not installed).
+
+    Returns a list of dicts with the package name, requested state, action,
+    installed version, install package version and install package file.
+    """
+
+    plan = []
+    for item in pkg_dict_2_items(dict(pkg_state)):
+        pkg = item['key']
+        state = item['value']
+        installed_vers = versions.get(pkg, '') or ''
+        pkg_info = packages.get(pkg, {})
+        pkg_vers = pkg_info.get('vers', '')
+
+        action = ACTION_NONE
+        if state == 'absent':
+            if installed_vers:
+                action = ACTION_REMOVE
+        elif state == 'present' and pkg_info:
+            if not installed_vers:
+                action = ACTION_INSTALL
+            elif pkg_vers:
+                cmp = compare_versions(installed_vers, pkg_vers)
+                if cmp < 0:
+                    action = ACTION_UPGRADE
+                elif cmp > 0:
+                    action = ACTION_DOWNGRADE
+
+        plan.append({
+            'package': pkg,
+            'state': state,
+            'action': action,
+            'installed_version': installed_vers,
+            'package_version': pkg_vers,
+            'file': pkg_info.get('file', '') if action in FILE_ACTIONS else ''
+        })
+
+    return plan
+
+
+# ------------------------------------------------------------------------------
+def parse_package_file(pkg_file):
+    """
+    Parse package name and version from an install package file name, name is
+    None if the file name does not start with one.
+    """
+
+    pkg_name = None
+    pkg_name_match = PKG_NAME_RE.search(pkg_file)
+    if pkg_name_match:
+        pkg_name = pkg_name_match.group().lower()
+
+    pkg_vers = ''
+    pkg_vers_match = PKG_VERS_RE.search(pkg_file)
+    if pkg_vers_match:
+        pkg_vers = pkg_vers_match.group()
+        pkg_vers = pkg_vers.replace('-', '.')
+
+    return pkg_name, pkg_vers
+
+
+# ------------------------------------------------------------------------------
+def file_sha256(path):
+    """
+    SHA-256 checksum of a file
+    """
+
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHECKSUM_CHUNK_SIZE), b''):
+            sha256.update(chunk)
+
+    return sha256.hexdigest()
+
+
+# ------------------------------------------------------------------------------
+def read_manifest(sw_path):
+    """
+    Read the manifest of the client software directory, None if there is no
+    usable manifest.
+    """
+
+    try:
+        with open(os.path.join(sw_path, MANIFEST_FILE), 'r') as manifest_file:
+            manifest = json.load(manifest_file)
+    except (IOError, OSError, ValueError):
+        return None
+
+    if not isinstance(manifest, dict) or manifest.get('version') != MANIFEST_VERSION:
+        return None
+
+    return manifest
+
+
+# ------------------------------------------------------------------------------
+def build_manifest(sw_path, checksum=True, old_manifest=None):
+    """
+    Walk the client software directory and build its manifest.
+
+    The manifest has an entry for every package directory (<sys>-<arch>) with
+    its mtime, the packages in it by file extension and package name, and the
+    preflight binary.  Every file has its size, mtime and optionally SHA-256
+    checksum, checksums of unchanged files are taken from old_manifest.
+    """
+
+    old_dirs = (old_manifest or {}).get('dirs', {})
+    dirs = {}
+
+    for dir_name in sorted(os.listdir(sw_path)):
+        dir_path = os.path.join(sw_path, dir_name)
+        if dir_name.startswith('.') or not os.path.isdir(dir_path):
+            continue
+
+        old_dir = old_dirs.get(dir_name, {})
+        old_files = {}
+        for pkgs in old_dir.get('exts', {}).values():
+            for pkg in pkgs.values():
+                old_files[pkg['file']] = pkg
+        if old_dir.get('preflight'):
+            old_files['preflight'] = old_dir['preflight']
+
+        exts = {}
+        preflight = None
+        for pkg_file in sorted(os.listdir(dir_path)):
+            pkg_path = os.path.join(dir_path, pkg_file)
+            if not os.path.isfile(pkg_path):
+                continue
+
+            if pkg_file == 'preflight':
+                preflight = manifest_file_info(pkg_path, pkg_file, '', checksum, old_files.get(pkg_file))
+                continue
+
+            pkg_name, pkg_vers = parse_package_file(pkg_file)
+            ext = pkg_file.rsplit('.', 1)[-1] if '.' in pkg_file else ''
+            if pkg_name and ext:
+                exts.setdefault(ext, {})[pkg_name] = manifest_file_info(
+                    pkg_path, pkg_file, pkg_vers, checksum, old_files.get(pkg_file))
+
+        dirs[dir_name] = {
+            'mtime': os.stat(dir_path).st_mtime,
+            'exts': exts,
+            'preflight': preflight
+        }
+
+    return {
+        'version': MANIFEST_VERSION,
+        'checksum': checksum,
+        'dirs': dirs
+    }
+
+
+# ------------------------------------------------------------------------------
+def manifest_file_info(path, pkg_file, pkg_vers, checksum, old_info):
+    """
+    Manifest entry of a file, the checksum of old_info is reused if the file
+    has not changed.
+    """
+
+    st = os.stat(path)
+    info = {
+        'file': pkg_file,
+        'vers': pkg_vers,
+        'size': st.st_size,
+        'mtime': st.st_mtime
+    }
+
+    if checksum:
+        if old_info and old_info.get('sha256') and \
+                old_info.get('size') == st.st_size and old_info.get('mtime') == st.st_mtime:
+            info['sha256'] = old_info['sha256']
+        else:
+            info['sha256'] = file_sha256(path)
+
+    return info
+
+
+# ------------------------------------------------------------------------------
+def manifest_packages(manifest, sw_path, pkgs_dir, ext):
+    """
+    Packages with extension ext and the preflight binary of package directory
+    pkgs_dir from the manifest.  Like the directory glob all directories
+    starting with pkgs_dir are included.
+
+    Returns None if the manifest is missing or stale: the set of package
+    directories, a directory mtime or the size or mtime of a returned file
+    differs from the manifest.
+    """
+
+    if manifest is None:
+        return None
+
+    try:
+        dir_names = sorted(d for d in os.listdir(sw_path)
+            if d.startswith(pkgs_dir) and os.path.isdir(os.path.join(sw_path, d)))
+        manifest_dirs = manifest['dirs']
+        if dir_names != sorted(d for d in manifest_dirs if d.startswith(pkgs_dir)):
+            return None
+
+        packages = {}
+        for dir_name in dir_names:
+            dir_path = os.path.join(sw_path, dir_name)
+            dir_info = manifest_dirs[dir_name]
+            if os.stat(dir_path).st_mtime != dir_info['mtime']:
+                return None
+            for pkg_name, info in dir_info['exts'].get(ext, {}).items():
+                packages[pkg_name] = manifest_package(dir_path, info)
+
+        preflight = None
+        if manifest_dirs.get(pkgs_dir, {}).get('preflight'):
+            preflight = manifest_package(os.path.join(sw_path, pkgs_dir), manifest_dirs[pkgs_dir]['preflight'])
+
+        # Files overwritten in place do not change the directory mtime
+        for pkg in list(packages.values()) + ([preflight] if preflight else []):
+            st = os.stat(pkg['path'])
+            if st.st_size != pkg['size'] or st.st_mtime != pkg['mtime']:
+                return None
+
+    except (OSError, KeyError, TypeError, AttributeError):
+        return None
+
+    return packages, preflight
+
+
+# ------------------------------------------------------------------------------
+def manifest_package(dir_path, info):
+    """
+    Package dictionary of a manifest file entry
+    """
+
+    pkg = {
+        'path': os.path.join(dir_path, info['file']),
+        'file': info['file'],
+        'vers': info['vers'],
+        'size': info['size'],
+        'mtime': info['mtime']
+    }
+    if info.get('sha256'):
+        pkg['sha256'] = info['sha256']
+
+    return pkg
+
+
+# ------------------------------------------------------------------------------
+def write_manifest(sw_path, manifest):
+    """
+    Atomically write the manifest of the client software directory
+    """
+
+    manifest_path = os.path.join(sw_path, MANIFEST_FILE)
+    tmp_path = manifest_path + '.' + str(os.getpid())
+    try:
+        with open(tmp_path, 'w') as manifest_file:
+            json.dump(manifest, manifest_file, indent=1, sort_keys=True)
+        os.rename(tmp_path, manifest_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
@@ -0,0 +1,188 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: config_file.py
+# Desc: Shared code for the client_config role modules: reading, hashing and
+#       atomically writing configuration files and the desired state digests
+#       stored next to them.
+# Auth: Laszlo Nagy
+# Note:
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+from ansible.module_utils.common.text.converters import to_bytes, to_text
+import hashlib
+import json
+import os
+import tempfile
+
+
+# ------------------------------------------------------------------------------
+# Constants
+# ------------------------------------------------------------------------------
+
+# Digest file name is '.' + file name + DIGEST_SUFFIX in the file's directory
+DIGEST_SUFFIX = '.sas_digest'
+
+# Digest record format version
+DIGEST_VERSION = 1
+
+# Result message of items of a file skipped because it is in the desired state
+DIGEST_MATCH_MSG = 'digest match'
+
+
+# ------------------------------------------------------------------------------
+# Functions
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def sha256(content):
+    """
+    SHA-256 checksum of file content
+    """
+
+    return hashlib.sha256(to_bytes(content, errors='surrogate_or_strict')).hexdigest()
+
+
+# ------------------------------------------------------------------------------
+def read_file(path, create):
+    """
+    Read file content, empty if the file does not exist and create is set
+    """
+
+    if not os.path.exists(path):
+        if not create:
+            return 'Destination ' + path + ' does not exist !', ''
+        return None, ''
+
+    with open(path, 'rb') as f:
+        content = to_text(f.read(), errors='surrogate_or_strict')
+
+    return None, content
+
+
+# ------------------------------------------------------------------------------
+def write_file(module, path, content):
+    """
+    Atomically write file content
+    """
+
+    dest_dir = os.path.dirname(path) or '.'
+    if not os.path.isdir(dest_dir):
+        os.makedirs(dest_dir)
+
+    fd, tmp_path = tempfile.mkstemp(dir=dest_dir)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(to_bytes(content, errors='surrogate_or_strict'))
+        module.atomic_move(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+# ------------------------------------------------------------------------------
+def digest_path(path):
+    """
+    Path of the digest file stored next to file path
+    """
+
+    return os.path.join(os.path.dirname(path), '.' + os.path.basename(path) + DIGEST_SUFFIX)
+
+
+# ------------------------------------------------------------------------------
+def desired_digest(module_name, items, create, mode, owner, group):
+    """
+    SHA-256 digest of the desired state of a file, the module applying the
+    items, the items and the file creation and attribute parameters.  Empty
+    attribute parameters are the same as omitted ones.
+    """
+
+    desired = {
+        'module': module_name,
+        'items': items,
+        'create': bool(create),
+        'mode': str(mode) if mode else None,
+        'owner': owner or None,
+        'group': group or None
+    }
+
+    return sha256(json.dumps(desired, sort_keys=True))
+
+
+# ------------------------------------------------------------------------------
+def file_state(path):
+    """
+    Current state of file path: SHA-256 checksum of its content, mode, uid and
+    gid.  None if the file does not exist.
+    """
+
+    if not os.path.isfile(path):
+        return None
+
+    with open(path, 'rb') as f:
+        checksum = hashlib.sha256(f.read()).hexdigest()
+    st = os.stat(path)
+
+    return {
+        'sha256': checksum,
+        'mode': st.st_mode,
+        'uid': st.st_uid,
+        'gid': st.st_gid
+    }
+
+
+# ------------------------------------------------------------------------------
+def digest_current(path, desired):
+    """
+    Is file path in the desired state?  True if the digest stored next to the
+    file matches desired and the file has not changed since it was stored.
+    """
+
+    try:
+        with open(digest_path(path), 'r') as f:
+            record = json.load(f)
+    except (IOError, OSError, ValueError):
+        return False
+
+    if not isinstance(record, dict) or record.get('version') != DIGEST_VERSION:
+        return False
+    if record.get('desired') != desired:
+        return False
+
+    return record.get('file') == file_state(path)
+
+
+# ------------------------------------------------------------------------------
+def write_digest(path, desired):
+    """
+    Atomically store the desired state digest and the current state of file
+    path next to the file, failing to write it is not an error
+    """
+
+    tmp_path = digest_path(path) + '.' + str(os.getpid())
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump({'version': DIGEST_VERSION, 'desired': desired, 'file': file_state(path)}, f)
+        os.rename(tmp_path, digest_path(path))
+    except (IOError, OSError):
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+# ------------------------------------------------------------------------------
+def remove_digest(path):
+    """
+    Remove the digest stored next to file path
+    """
+
+    try:
+        os.remove(digest_path(path))
+    except OSError:
+        pass
@@ -0,0 +1,127 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: dscl.py
+# Desc: Ansible utils module that reads local users and groups from macOS
+#       directory services.
+# Auth: Laszlo Nagy
+# Note:
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.exec_cmd as ec
+
+
+# ------------------------------------------------------------------------------
+# Constants
+# ------------------------------------------------------------------------------
+
+# dscl
+DSCL_PATH = '/usr/bin/dscl'
+
+# Number of seconds dscl may run before it is killed
+DSCL_TIMEOUT = 60
+
+# Directory service paths
+USERS_PATH = '/Users'
+GROUPS_PATH = '/Groups'
+
+# Record separator of dscl -readall
+RECORD_SEPARATOR = '-'
+
+# Key of the record name
+RECORD_NAME_KEY = 'RecordName'
+
+
+# ------------------------------------------------------------------------------
+# Functions
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def run_dscl(args):
+    """
+    macOS manages users and groups by directory services instead of /etc/passwd
+    and /etc/group.
+    macOS uses the dscl command to interact with directory services.
+    """
+
+    rc, rval_str, _ = ec.exec_cmd([DSCL_PATH] + args, DSCL_TIMEOUT)
+
+    return rc, rval_str
+
+
+# ------------------------------------------------------------------------------
+def read_all_records(path, keys):
+    """
+    Reads the given keys of every record under path (e.g. /Users) with a single
+    dscl -readall call.
+
+    Returns an err value that contains None if no error or a string describing
+    the error, and a list of [record name, {key: value}] lists in the order dscl
+    returns them.  Keys missing from a record are not present in its dictionary.
+    """
+
+    rc, rval_str = run_dscl(['.', '-readall', path, RECORD_NAME_KEY] + keys)
+    if rc != 0:
+        return rval_str, []
+
+    return None, parse_readall(rval_str)
+
+
+# ------------------------------------------------------------------------------
+def parse_readall(rval_str):
+    """
+    Parses the output of dscl -readall in one pass.
+
+    -readall prints the records separated by a line with a single dash.  The
+    property key is followed by colon, then a space-separated list of the values
+    for that property.  If any value contains embedded spaces, the list will
+    instead be displayed one entry per line, starting on the line after the key.
+    In that case the first value is kept, the same way as dscl -read was handled.
+
+    Example:
+    RecordName: _amavisd amavisd
+    UniqueID: 83
+    -
+    RealName:
+     Ellen Ripley
+    RecordName: eripley
+    UniqueID: 501
+    """
+
+    records = []
+    record = {}
+    key = None
+
+    for line in rval_str.splitlines():
+        if line == RECORD_SEPARATOR:
+            append_record(records, record)
+            record = {}
+            key = None
+        elif line.startswith(' '):
+            if key is not None and not record.get(key):
+                record[key] = line.strip()
+        elif line:
+            key, sep, value = line.partition(':')
+            record[key] = value.strip()
+    append_record(records, record)
+
+    return records
+
+
+# ------------------------------------------------------------------------------
+def append_record(records, record):
+    """
+    Appends record to records as [record name, record] if it has a name.
+    A record may have several names, the first one is used.
+    """
+
+    names = record.pop(RECORD_NAME_KEY, '').split()
+    if names:
+        records.append([names[0], record])
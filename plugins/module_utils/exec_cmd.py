@@ -0,0 +1,150 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: exec_cmd.py
+# Desc: Ansible utils module that runs external commands without a shell,
+#       with a timeout and a bounded output buffer.
+# Auth: Laszlo Nagy
+# Note: The return codes of a timeout and of a command that could not be
+#       started follow the coreutils timeout and the shell conventions so the
+#       callers' existing non-zero return code handling covers them.
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+from ansible.module_utils.common.text.converters import to_text
+import subprocess
+import threading
+import time
+
+
+# ------------------------------------------------------------------------------
+# Constants
+# ------------------------------------------------------------------------------
+
+# Default number of seconds a command may run before it is killed
+EXEC_TIMEOUT = 300
+
+# Default maximum number of bytes kept from stdout and from stderr each
+EXEC_MAX_OUTPUT = 16 * 1024 * 1024
+
+# Size of the chunks read from the pipes
+READ_CHUNK_SIZE = 64 * 1024
+
+# Number of seconds to wait for the output after the command exited
+READER_GRACE = 10
+
+# Return codes of a killed and of a not started command
+TIMEOUT_RC = 124
+EXEC_FAILED_RC = 127
+
+
+# ------------------------------------------------------------------------------
+# Functions
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def exec_cmd(cmd, timeout=EXEC_TIMEOUT, max_output=EXEC_MAX_OUTPUT):
+    """
+    Execute the cmd argument list directly (no shell) and wait for it at most
+    timeout seconds, killing it if it runs longer.  A timeout of 0 or None
+    waits forever.
+
+    stdout and stderr are read as they are produced, the first max_output bytes
+    of each are kept and the rest is discarded.
+
+    Returns the return code, the decoded stdout followed by stderr, and the
+    wall-clock duration of the call in seconds.  If the command timed out or
+    could not be started the return code is TIMEOUT_RC or EXEC_FAILED_RC and
+    the reason is appended to the output.
+    """
+
+    start = time.time()
+
+    try:
+        p = subprocess.Popen(cmd, stdin=None, stdout=subprocess.PIPE, stderr=subprocess.PIPE, close_fds=True)
+    except (IOError, OSError) as e:
+        return EXEC_FAILED_RC, to_text(cmd[0]) + ': ' + to_text(e), time.time() - start
+
+    # Drain both pipes concurrently so a full pipe can't block the command
+    stdout_chunks = []
+    stderr_chunks = []
+    readers = [
+        threading.Thread(target=read_bounded, args=(p.stdout, stdout_chunks, max_output)),
+        threading.Thread(target=read_bounded, args=(p.stderr, stderr_chunks, max_output))
+    ]
+    for reader in readers:
+        reader.daemon = True
+        reader.start()
+
+    # Kill the command if it runs too long
+    timed_out = []
+    timer = None
+    if timeout:
+        timer = threading.Timer(timeout, kill, args=(p, timed_out))
+        timer.daemon = True
+        timer.start()
+
+    try:
+        p.wait()
+        # A daemon started by the command may inherit and hold the pipes open
+        for reader in readers:
+            reader.join(READER_GRACE)
+    finally:
+        if timer is not None:
+            timer.cancel()
+
+    rval_bytes = b''.join(stdout_chunks) + b''.join(stderr_chunks)
+    rval_str = to_text(rval_bytes, errors='surrogate_or_replace')
+    rc = p.returncode
+
+    if timed_out:
+        rc = TIMEOUT_RC
+        rval_str += '\n' + to_text(cmd[0]) + ' timed out after ' + str(timeout) + ' seconds and was killed'
+
+    # Return
+    return rc, rval_str, time.time() - start
+
+
+# ------------------------------------------------------------------------------
+def read_bounded(pipe, chunks, max_output):
+    """
+    Read pipe until EOF, appending at most max_output bytes to chunks.
+    """
+
+    # read1 returns what is available instead of waiting for a full chunk
+    read = getattr(pipe, 'read1', pipe.read)
+
+    size = 0
+    try:
+        while True:
+            chunk = read(READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            if size < max_output:
+                chunk = chunk[:max_output - size]
+                chunks.append(chunk)
+                size += len(chunk)
+    finally:
+        pipe.close()
+
+
+# ------------------------------------------------------------------------------
+def kill(p, timed_out):
+    """
+    Kill the process of p if it is still running.  timed_out is set before
+    killing it so the waiting caller never sees the kill without the flag.
+    """
+
+    if p.poll() is None:
+        timed_out.append(True)
+        try:
+            p.kill()
+        except OSError:
+            # The process exited on its own meanwhile
+            del timed_out[:]
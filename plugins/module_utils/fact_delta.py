@@ -0,0 +1,160 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: fact_delta.py
+# Desc: Ansible utils module that returns only the changes of a list of user or
+#       group records since the version the controller already has.
+# Auth: Laszlo Nagy
+# Note: The last returned records and their version are stored on the host in
+#       a file private to the user, records are keyed by their first field
+#       (user or group name).
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+import hashlib
+import json
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.private_file as pf
+
+
+# ------------------------------------------------------------------------------
+# Constants
+# ------------------------------------------------------------------------------
+
+# State file record format version
+STATE_VERSION = 1
+
+
+# ------------------------------------------------------------------------------
+# Functions
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def fingerprint(rows):
+    """
+    Version of a list of records, the SHA-256 digest of their content
+    """
+
+    return hashlib.sha256(json.dumps(rows, separators=(',', ':')).encode('utf-8')).hexdigest()
+
+
+# ------------------------------------------------------------------------------
+def group_rows(rows):
+    """
+    Records grouped by name, a list of names in the order they first appear
+    and a dict of name to the list of records with that name.  Duplicate names
+    are kept together so they are added, changed and removed as one.
+    """
+
+    names = []
+    groups = {}
+    for row in rows:
+        name = row[0]
+        if name not in groups:
+            names.append(name)
+            groups[name] = []
+        groups[name].append(row)
+
+    return names, groups
+
+
+# ------------------------------------------------------------------------------
+def diff_rows(old_rows, new_rows):
+    """
+    Changes from old_rows to new_rows: records of added names, records of
+    changed names and removed names
+    """
+
+    old_names, old_groups = group_rows(old_rows)
+    new_names, new_groups = group_rows(new_rows)
+
+    added = []
+    changed = []
+    for name in new_names:
+        if name not in old_groups:
+            added += new_groups[name]
+        elif new_groups[name] != old_groups[name]:
+            changed += new_groups[name]
+    removed = [name for name in old_names if name not in new_groups]
+
+    return added, changed, removed
+
+
+# ------------------------------------------------------------------------------
+def apply_delta(rows, delta):
+    """
+    Records after applying delta (added, changed and removed) to rows.  Changed
+    names keep their position, added names are appended.
+    """
+
+    names, groups = group_rows(rows)
+    for name in delta.get('removed') or []:
+        groups.pop(name, None)
+
+    delta_names, delta_groups = group_rows((delta.get('changed') or []) + (delta.get('added') or []))
+    for name in delta_names:
+        if name not in groups:
+            names.append(name)
+        groups[name] = delta_groups[name]
+
+    return [row for name in names if name in groups for row in groups[name]]
+
+
+# ------------------------------------------------------------------------------
+def read_state(path):
+    """
+    Version and records returned last, None, None if there are none or they
+    could have been written by somebody else
+    """
+
+    state = pf.read_json(path)
+
+    if not isinstance(state, dict) or state.get('format') != STATE_VERSION:
+        return None, None
+
+    return state.get('version'), state.get('rows')
+
+
+# ------------------------------------------------------------------------------
+def write_state(path, version, rows):
+    """
+    Atomically store the version and records returned in a file private to the
+    user, failing to write them is not an error
+    """
+
+    pf.write_json(path, {'format': STATE_VERSION, 'version': version, 'rows': rows})
+
+
+# ------------------------------------------------------------------------------
+def delta_since(path, baseline, rows):
+    """
+    Version of rows and their changes since version baseline.  The delta is
+    None when the records of baseline are not stored in path, the full records
+    have to be returned then.  Stores rows as the last returned records.
+    """
+
+    # Round trip through JSON so the records compare equal to the stored ones
+    rows = json.loads(json.dumps(rows))
+    version = fingerprint(rows)
+
+    stored_version, stored_rows = read_state(path)
+
+    delta = None
+    if baseline and baseline == stored_version and stored_rows is not None:
+        added, changed, removed = diff_rows(stored_rows, rows)
+        delta = {
+            'baseline': baseline,
+            'added': added,
+            'changed': changed,
+            'removed': removed
+        }
+
+    if version != stored_version:
+        write_state(path, version, rows)
+
+    return version, delta
@@ -0,0 +1,317 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: host_access.py
+# Desc: Ansible utils module that reads the host access control files
+#       (users.allow and users.deny) of Authentication Services.
+# Auth: Laszlo Nagy
+# Note:
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+from ansible.module_utils.common.text.converters import to_text
+import fnmatch
+import os
+import re
+import traceback
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.vastool as vt
+
+
+# ------------------------------------------------------------------------------
+# Constants
+# ------------------------------------------------------------------------------
+
+# Default access control files
+USERS_ALLOW_FILE_DEFAULT = '/etc/opt/quest/vas/users.allow'
+USERS_DENY_FILE_DEFAULT = '/etc/opt/quest/vas/users.deny'
+
+# Specificity of access control entry matches, the most specific match of
+# users.allow and users.deny decides, users.deny wins a tie
+MATCH_NONE = 0
+MATCH_DOMAIN = 1
+MATCH_OU = 2
+MATCH_GROUP = 3
+MATCH_USER = 4
+
+
+# ------------------------------------------------------------------------------
+# Functions
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def get_users_allow_deny():
+    """
+    Find the users.allow and users.deny files configured in vas.conf and get
+    their entries.
+
+    Returns an err value that contains None if no error or a string describing
+    the error, and the lists of users.allow and users.deny entries.
+    """
+
+    # Return values
+    err = None
+    users_allow = []
+    users_deny = []
+
+    err, users_allow_file, users_deny_file = get_users_allow_deny_files()
+
+    if err is None:
+        err, users_allow = get_entries(users_allow_file)
+
+    if err is None:
+        err, users_deny = get_entries(users_deny_file)
+
+    # Return
+    return err, users_allow, users_deny
+
+
+# ------------------------------------------------------------------------------
+def get_users_allow_deny_files():
+    """
+    Find the users.allow and users.deny files configured in vas.conf.
+
+    Returns an err value that contains None if no error or a string describing
+    the error, and the users.allow and users.deny file paths.
+    """
+
+    # Return values
+    users_allow_file = USERS_ALLOW_FILE_DEFAULT
+    users_deny_file = USERS_DENY_FILE_DEFAULT
+
+    err, settings = vt.vastool_inspect_many(['vas_auth users-allow-file', 'vas_auth users-deny-file'])
+
+    if err is None:
+        users_allow_file = settings['vas_auth users-allow-file'] or USERS_ALLOW_FILE_DEFAULT
+        users_deny_file = settings['vas_auth users-deny-file'] or USERS_DENY_FILE_DEFAULT
+
+    # Return
+    return err, users_allow_file, users_deny_file
+
+
+# ------------------------------------------------------------------------------
+def get_entries(file_name):
+    """
+    Get non-empty, non-comment lines
+    """
+
+    err = None
+    entries = []
+
+    # check whether the file exists
+    if os.path.isfile(file_name):
+        try:
+            with open(file_name, 'rb') as users_file:
+                users_bytes = users_file.read()
+                users_str = to_text(users_bytes, errors='surrogate_or_strict')
+
+                entries = users_str.split('\n')
+                entries = [entry.strip() for entry in entries]
+                entries = [entry for entry in entries if len(entry) > 0]
+                entries = [entry for entry in entries if entry[0] != '#']
+
+        except Exception:
+            tb = traceback.format_exc()
+            err = str(tb)
+    else:
+        entries.append(file_name + ' does not exist.')
+
+    # Return
+    return err, entries
+
+
+# ------------------------------------------------------------------------------
+def evaluate_access(users):
+    """
+    Evaluate whether each user may log on to the host according to the
+    users.allow and users.deny files configured in vas.conf.
+
+    users is a list of user names or dicts with name, groups, dn and domain
+    keys.
+
+    Returns an err value that contains None if no error or a string describing
+    the error, and a list with a dict of user, allowed, file and entry (the
+    deciding entry) for each user.  allowed is None for users that do not
+    resolve to Active Directory, see evaluate_user.
+    """
+
+    # Return values
+    err = None
+    access = []
+
+    err, users_allow_file, users_deny_file = get_users_allow_deny_files()
+
+    # Compile the rule sets once, a missing or empty users.allow allows
+    # everybody
+    allow_rules = None
+    if err is None and os.path.isfile(users_allow_file):
+        err, entries = get_entries(users_allow_file)
+        if entries:
+            allow_rules = compile_rules(entries)
+
+    deny_rules = compile_rules([])
+    if err is None and os.path.isfile(users_deny_file):
+        err, entries = get_entries(users_deny_file)
+        deny_rules = compile_rules(entries)
+
+    if err is None:
+        for user in users:
+            access.append(evaluate_user(user, allow_rules, deny_rules))
+
+    # Return
+    return err, access
+
+
+# ------------------------------------------------------------------------------
+def evaluate_user(user, allow_rules, deny_rules):
+    """
+    Evaluate one user against the compiled users.allow (None if there is no
+    users.allow) and users.deny rules.  users.allow and users.deny only govern
+    Active Directory users, so a user without a domain, distinguished name or
+    groups (a local account like root) is not evaluated and allowed is None.
+    """
+
+    if not isinstance(user, dict):
+        user = {'name': user}
+    subject = user_subject(user)
+
+    if not subject['domains'] and not subject['ous'] and not subject['groups']:
+        return {
+            'user': user.get('name', ''),
+            'allowed': None,
+            'file': '',
+            'entry': ''
+        }
+
+    allow_level, allow_entry = MATCH_NONE, ''
+    if allow_rules is not None:
+        allow_level, allow_entry = match_rules(allow_rules, subject)
+    deny_level, deny_entry = match_rules(deny_rules, subject)
+
+    if deny_level != MATCH_NONE and deny_level >= allow_level:
+        allowed, rule_file, entry = False, 'users.deny', deny_entry
+    elif allow_rules is not None and allow_level == MATCH_NONE:
+        allowed, rule_file, entry = False, 'users.allow', ''
+    else:
+        allowed, rule_file, entry = True, 'users.allow' if allow_level else '', allow_entry
+
+    return {
+        'user': user.get('name', ''),
+        'allowed': allowed,
+        'file': rule_file,
+        'entry': entry
+    }
+
+
+# ------------------------------------------------------------------------------
+def compile_rules(entries):
+    """
+    Compile access control entries into hash sets of exact names, domains and
+    OU distinguished names and a list of compiled wildcard patterns.  Names are
+    matched case insensitively like Active Directory does.
+    """
+
+    rules = {
+        'names': {},
+        'domains': {},
+        'ous': {},
+        'patterns': []
+    }
+
+    for entry in entries:
+        key = entry.lower()
+        if '*' in entry or '?' in entry:
+            rules['patterns'].append((re.compile(fnmatch.translate(key)), entry))
+        elif '\\' in entry or '@' in entry:
+            rules['names'].setdefault(key, entry)
+        elif '=' in entry:
+            rules['ous'].setdefault(normalize_dn(key), entry)
+        else:
+            rules['domains'].setdefault(key, entry)
+
+    return rules
+
+
+# ------------------------------------------------------------------------------
+def user_subject(user):
+    """
+    Normalized names, groups, OU distinguished names and domains of a user to
+    match against compiled rules
+    """
+
+    name = (user.get('name') or '').lower()
+    groups = [group.lower() for group in user.get('groups') or []]
+
+    # Domain from DOMAIN\name or name@domain, both forms can be given
+    domains = set()
+    if user.get('domain'):
+        domains.add(user['domain'].lower())
+    for value in [name] + ([user['upn'].lower()] if user.get('upn') else []):
+        if '\\' in value:
+            domains.add(value.split('\\', 1)[0])
+        elif '@' in value:
+            domains.add(value.rsplit('@', 1)[1])
+
+    # Every parent container of the user's distinguished name
+    ous = []
+    dn_parts = normalize_dn(user.get('dn') or '').split(',')
+    for i in range(1, len(dn_parts)):
+        ous.append(','.join(dn_parts[i:]))
+
+    names = [name]
+    if user.get('upn'):
+        names.append(user['upn'].lower())
+
+    return {
+        'names': names,
+        'groups': groups,
+        'ous': ous,
+        'domains': domains
+    }
+
+
+# ------------------------------------------------------------------------------
+def match_rules(rules, subject):
+    """
+    Most specific match of subject in rules, returns the match level and the
+    matching entry
+    """
+
+    for name in subject['names']:
+        if name in rules['names']:
+            return MATCH_USER, rules['names'][name]
+    for pattern, entry in rules['patterns']:
+        if any(pattern.match(name) for name in subject['names']):
+            return MATCH_USER, entry
+
+    for group in subject['groups']:
+        if group in rules['names']:
+            return MATCH_GROUP, rules['names'][group]
+    for pattern, entry in rules['patterns']:
+        if any(pattern.match(group) for group in subject['groups']):
+            return MATCH_GROUP, entry
+
+    for ou in subject['ous']:
+        if ou in rules['ous']:
+            return MATCH_OU, rules['ous'][ou]
+
+    for domain in subject['domains']:
+        if domain in rules['domains']:
+            return MATCH_DOMAIN, rules['domains'][domain]
+
+    return MATCH_NONE, ''
+
+
+# ------------------------------------------------------------------------------
+def normalize_dn(dn):
+    """
+    Lower case distinguished name without spaces around the separators
+    """
+
+    return ','.join(part.strip() for part in dn.lower().split(',') if part.strip())
+
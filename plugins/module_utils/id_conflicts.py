@@ -0,0 +1,103 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: id_conflicts.py
+# Desc: Ansible utils module that finds Unix ID (UID/GID) numbers shared by
+#       more than one object.
+# Auth: Laszlo Nagy
+# Note:
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+import heapq
+
+
+# ------------------------------------------------------------------------------
+# Functions
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def select_duplicates(records, key):
+    """
+    Groups records by key in a single pass and returns a dictionary of
+    key -> list of records for every key that is shared by two or more records.
+
+    records can be any iterable (list or generator) and key is a function that
+    returns the grouping key of a record.  Records keep the order in which they
+    were encountered.
+
+    Only the first record of each key is remembered until a second record with
+    the same key shows up, so the returned dictionary never holds records that
+    are not conflicting.  Memory still holds one record per distinct key while
+    grouping, see select_top_duplicates for a bound on that.  A record equal to
+    one already in its key's list is not added again, so identical objects
+    listed twice show up only once.  That is checked against a set of the
+    record identities of each conflicting key, see record_identity.
+    """
+
+    first_seen = {}
+    duplicates = {}
+    identities = {}
+
+    for record in records:
+        record_key = key(record)
+        bucket = duplicates.get(record_key)
+        if bucket is None:
+            if record_key not in first_seen:
+                first_seen[record_key] = record
+                continue
+            first_record = first_seen.pop(record_key)
+            bucket = duplicates[record_key] = [first_record]
+            identities[record_key] = set([record_identity(first_record)])
+
+        identity = record_identity(record)
+        if identity not in identities[record_key]:
+            identities[record_key].add(identity)
+            bucket.append(record)
+
+    return duplicates
+
+
+# ------------------------------------------------------------------------------
+def select_top_duplicates(make_records, key, top):
+    """
+    Same as select_duplicates but returns only the top keys shared by the most
+    records.
+
+    make_records is a function that returns a new iterable of the records each
+    time it is called, because the records are read twice: the first pass
+    only counts the records of each key, the second one groups the records of
+    the top keys.  So memory holds a count per distinct key and the records of
+    at most top keys, instead of a record per distinct key.  Keys are ranked
+    by their number of records, identical records included.
+    """
+
+    counts = {}
+    for record in make_records():
+        record_key = key(record)
+        counts[record_key] = counts.get(record_key, 0) + 1
+
+    top_keys = set(heapq.nlargest(
+        top, (record_key for record_key, count in counts.items() if count > 1), key=counts.get))
+
+    return select_duplicates((record for record in make_records() if key(record) in top_keys), key)
+
+
+# ------------------------------------------------------------------------------
+def record_identity(record):
+    """
+    Hashable value that is equal for equal records: the sorted items of a dict
+    record, the items of a list record or the record itself
+    """
+
+    if isinstance(record, dict):
+        return tuple(sorted(record.items()))
+    if isinstance(record, list):
+        return tuple(record)
+    return record
@@ -0,0 +1,315 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: local_unix.py
+# Desc: Ansible utils module that reads local Unix users and groups from
+#       /etc/passwd and /etc/group, or from directory services on macOS.
+# Auth: Laszlo Nagy
+# Note:
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+from ansible.module_utils.common.text.converters import to_text
+import heapq
+import platform
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.dscl as dscl
+
+
+# ------------------------------------------------------------------------------
+# Constants
+# ------------------------------------------------------------------------------
+
+# Local account files
+PASSWD_PATH = '/etc/passwd'
+GROUP_PATH = '/etc/group'
+
+# Number of fields in /etc/passwd and /etc/group entries
+PASSWD_FIELDS = 7
+GROUP_FIELDS = 4
+
+# macOS directory service keys of passwd and group fields
+DSCL_USER_KEYS = ['UniqueID', 'PrimaryGroupID', 'RealName', 'NFSHomeDirectory', 'UserShell']
+DSCL_GROUP_KEYS = ['PrimaryGroupID', 'GroupMembership']
+
+# Login shells of users that cannot log on
+NOLOGIN_SHELLS = ['/bin/false', '/usr/bin/false', '/sbin/nologin', '/usr/sbin/nologin', '/bin/nologin']
+
+# Summary defaults: size of the ID ranges users and groups are counted in and
+# number of most used IDs and largest groups listed
+SUMMARY_RANGE_SIZE_DEFAULT = 1000
+SUMMARY_TOP_DEFAULT = 10
+
+
+# ------------------------------------------------------------------------------
+# Functions
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def read_users(match=None):
+    """
+    Read the local users as lists of the 7 /etc/passwd fields.  If match is
+    given then only the users it returns true for are kept, see field_matcher.
+
+    Returns an err value that contains None if no error or a string describing
+    the error, and the list of users.
+    """
+
+    err, users = iter_users(match)
+    return err, list(users)
+
+
+# ------------------------------------------------------------------------------
+def read_groups(match=None):
+    """
+    Read the local groups as lists of the 4 /etc/group fields.  If match is
+    given then only the groups it returns true for are kept, see field_matcher.
+
+    Returns an err value that contains None if no error or a string describing
+    the error, and the list of groups.
+    """
+
+    err, groups = iter_groups(match)
+    return err, list(groups)
+
+
+# ------------------------------------------------------------------------------
+def iter_users(match=None):
+    """
+    Like read_users but returns a generator over the users, so callers that
+    only aggregate them never hold all users in memory.
+    """
+
+    if platform.system() == 'Darwin':
+        rval_err, records = dscl.read_all_records(dscl.USERS_PATH, DSCL_USER_KEYS)
+        if rval_err is not None:
+            return 'Failed to get list of users. ' + rval_err, iter([])
+        users = ([user, '*'] + [props.get(key, '') for key in DSCL_USER_KEYS] for user, props in records)
+    else:
+        users = iter_colon_file(PASSWD_PATH, PASSWD_FIELDS)
+
+    return None, (user for user in users if match is None or match(user))
+
+
+# ------------------------------------------------------------------------------
+def iter_groups(match=None):
+    """
+    Like read_groups but returns a generator over the groups, so callers that
+    only aggregate them never hold all groups in memory.
+    """
+
+    if platform.system() == 'Darwin':
+        rval_err, records = dscl.read_all_records(dscl.GROUPS_PATH, DSCL_GROUP_KEYS)
+        if rval_err is not None:
+            return 'Failed to get list of groups. ' + rval_err, iter([])
+        groups = ([group, '*'] + [props.get(key, '') for key in DSCL_GROUP_KEYS] for group, props in records)
+    else:
+        groups = iter_colon_file(GROUP_PATH, GROUP_FIELDS)
+
+    return None, (group for group in groups if match is None or match(group))
+
+
+# ------------------------------------------------------------------------------
+def iter_colon_file(file_path, num_fields):
+    """
+    Generator over the entries of a colon separated file like /etc/passwd.
+
+    The file is read line by line, empty and comment lines are skipped and the
+    entries that have num_fields fields are yielded split into lists, so only
+    the entries kept by the caller are ever held in memory.
+    """
+
+    with open(file_path, 'rb') as colon_file:
+        for line in colon_file:
+            entry = to_text(line, errors='surrogate_or_strict').strip()
+            if not entry or entry[0] == '#':
+                continue
+            entry = entry.split(':')
+            if len(entry) == num_fields:
+                yield entry
+
+
+# ------------------------------------------------------------------------------
+def field_matcher(equals=None, contains=None, contains_any=None):
+    """
+    Build a predicate for read_users and read_groups that checks all field
+    filters of an entry in one pass.
+
+    equals maps field index to a value the field must be equal to, contains
+    maps field index to a value the field must contain and contains_any maps
+    field index to a list of values one of which the field must contain.
+    Empty values mean no filter on that field.
+
+    Returns None if there is nothing to filter on.
+    """
+
+    equals = [(index, value) for index, value in (equals or {}).items() if value]
+    contains = [(index, value) for index, value in (contains or {}).items() if value]
+    contains_any = [(index, values) for index, values in (contains_any or {}).items() if values]
+
+    if not equals and not contains and not contains_any:
+        return None
+
+    def match(entry):
+        for index, value in equals:
+            if entry[index] != value:
+                return False
+        for index, value in contains:
+            if value not in entry[index]:
+                return False
+        for index, values in contains_any:
+            if not any(value in entry[index] for value in values):
+                return False
+        return True
+
+    return match
+
+
+# ------------------------------------------------------------------------------
+def id_counter(top):
+    """
+    Empty ID counter for count_id and id_summary, keeping up to top names of
+    each ID used more than once
+    """
+
+    return {'first_names': {}, 'duplicates': {}, 'ranges': {}, 'min': None, 'max': None, 'invalid': 0, 'top': top}
+
+
+# ------------------------------------------------------------------------------
+def count_id(counter, id_str, name, range_size):
+    """
+    Count the ID of entry name in counter: minimum and maximum, entries per ID
+    range of range_size IDs and entries sharing an ID
+    """
+
+    try:
+        id_number = int(id_str)
+    except ValueError:
+        counter['invalid'] += 1
+        return
+
+    if counter['min'] is None or id_number < counter['min']:
+        counter['min'] = id_number
+    if counter['max'] is None or id_number > counter['max']:
+        counter['max'] = id_number
+
+    range_start = id_number - id_number % range_size
+    counter['ranges'][range_start] = counter['ranges'].get(range_start, 0) + 1
+
+    first_name = counter['first_names'].get(id_number)
+    if first_name is None:
+        counter['first_names'][id_number] = name
+        return
+
+    duplicate = counter['duplicates'].get(id_number)
+    if duplicate is None:
+        duplicate = counter['duplicates'][id_number] = [1, [first_name][:counter['top']]]
+    duplicate[0] += 1
+    if len(duplicate[1]) < counter['top']:
+        duplicate[1].append(name)
+
+
+# ------------------------------------------------------------------------------
+def id_summary(counter, prefix, range_size):
+    """
+    Summary of an ID counter with keys named prefix (uid or gid) + _min, _max,
+    _invalid, _ranges (list of first ID, last ID and count of each range in
+    use), duplicate_ + prefix + _count (number of IDs used more than once) and
+    duplicate_ + prefix + s (ID, number of entries and up to top names of the
+    top IDs used most)
+    """
+
+    duplicates = counter['duplicates']
+    most_used = heapq.nsmallest(counter['top'], duplicates, key=lambda id_number: (-duplicates[id_number][0], id_number))
+
+    return {
+        prefix + '_min': counter['min'],
+        prefix + '_max': counter['max'],
+        prefix + '_invalid': counter['invalid'],
+        prefix + '_ranges': [
+            [start, start + range_size - 1, counter['ranges'][start]] for start in sorted(counter['ranges'])],
+        'duplicate_' + prefix + '_count': len(duplicates),
+        'duplicate_' + prefix + 's': [[id_number] + duplicates[id_number] for id_number in most_used]
+    }
+
+
+# ------------------------------------------------------------------------------
+def size_label(size):
+    """
+    Group size range of size members: 0, 1-9, 10-99, 100-999 and so on
+    """
+
+    if size == 0:
+        return '0'
+    low = 10 ** (len(str(size)) - 1)
+    return '%d-%d' % (low, low * 10 - 1)
+
+
+# ------------------------------------------------------------------------------
+def summarize_users(users, range_size=SUMMARY_RANGE_SIZE_DEFAULT, top=SUMMARY_TOP_DEFAULT):
+    """
+    Aggregates of users in one pass: number of users, UID summary (see
+    id_summary, top limits the duplicate UIDs listed), users per login shell
+    and number of users that cannot log on.  users can be a generator, only
+    one user is held at a time besides the first name of every UID.
+    """
+
+    count = 0
+    uids = id_counter(top)
+    shells = {}
+    nologin = 0
+
+    for user in users:
+        count += 1
+        count_id(uids, user[2], user[0], range_size)
+        shell = user[6]
+        shells[shell] = shells.get(shell, 0) + 1
+        if shell in NOLOGIN_SHELLS:
+            nologin += 1
+
+    summary = {'count': count, 'shells': shells, 'nologin': nologin}
+    summary.update(id_summary(uids, 'uid', range_size))
+    return summary
+
+
+# ------------------------------------------------------------------------------
+def summarize_groups(groups, range_size=SUMMARY_RANGE_SIZE_DEFAULT, top=SUMMARY_TOP_DEFAULT):
+    """
+    Aggregates of groups in one pass: number of groups, GID summary (see
+    id_summary, top limits the duplicate GIDs listed), total number of
+    members, groups per size range (see size_label) and the top largest
+    groups as name and number of members.  groups can be a generator like
+    for summarize_users.
+    """
+
+    count = 0
+    gids = id_counter(top)
+    members = 0
+    sizes = {}
+    largest = []
+
+    for group in groups:
+        count += 1
+        count_id(gids, group[2], group[0], range_size)
+        size = len(group[3].replace(',', ' ').split())
+        members += size
+        label = size_label(size)
+        sizes[label] = sizes.get(label, 0) + 1
+        if len(largest) < top:
+            heapq.heappush(largest, (size, count, group[0]))
+        elif top and size > largest[0][0]:
+            heapq.heapreplace(largest, (size, count, group[0]))
+
+    summary = {
+        'count': count,
+        'members': members,
+        'sizes': sizes,
+        'largest': [[name, size] for size, order, name in sorted(largest, key=lambda g: (-g[0], g[1]))]
+    }
+    summary.update(id_summary(gids, 'gid', range_size))
+    return summary
@@ -0,0 +1,150 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: private_file.py
+# Desc: Ansible utils module that reads and writes files on the host that only
+#       the user the module runs as can modify.
+# Auth: Laszlo Nagy
+# Note: Modules run as root, so anything they read back from a file another
+#       user could have written or replaced must not be trusted.
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+import json
+import os
+import stat
+import tempfile
+
+
+# ------------------------------------------------------------------------------
+# Constants
+# ------------------------------------------------------------------------------
+
+# Mode of the created directories
+DIR_MODE = 0o700
+
+
+# ------------------------------------------------------------------------------
+# Functions
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def private_dir(path):
+    """
+    Can only the user the module runs as (or root) modify directory path and
+    its parents?  Each directory has to be owned by the user or root and not be
+    group or other writable, except directories owned by root with the sticky
+    bit set like /tmp.  Symbolic links are resolved first so the directories
+    actually used are checked.
+    """
+
+    euid = os.geteuid()
+    path = os.path.realpath(os.path.expanduser(path))
+    while True:
+        try:
+            st = os.lstat(path)
+        except OSError:
+            return False
+
+        if not stat.S_ISDIR(st.st_mode) or st.st_uid not in (euid, 0):
+            return False
+        if st.st_mode & 0o022 and not (st.st_uid == 0 and st.st_mode & stat.S_ISVTX):
+            return False
+
+        parent = os.path.dirname(path)
+        if parent == path:
+            return True
+        path = parent
+
+
+# ------------------------------------------------------------------------------
+def make_private_dirs(path):
+    """
+    Create directory path and its missing parents with DIR_MODE.  Unlike
+    os.makedirs the parents get DIR_MODE too and it is not masked by umask.
+    """
+
+    path = os.path.abspath(os.path.expanduser(path))
+    parent = os.path.dirname(path)
+    if not os.path.isdir(parent):
+        make_private_dirs(parent)
+
+    os.mkdir(path, DIR_MODE)
+    os.chmod(path, DIR_MODE)
+
+
+# ------------------------------------------------------------------------------
+def private_file(path):
+    """
+    Is path a regular file of the user the module runs as that nobody else can
+    read or write, in a directory only the user can modify (see private_dir)?
+    """
+
+    path = os.path.expanduser(path)
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+
+    if not stat.S_ISREG(st.st_mode) or st.st_uid != os.geteuid() or st.st_mode & 0o077:
+        return False
+
+    return private_dir(os.path.dirname(os.path.abspath(path)))
+
+
+# ------------------------------------------------------------------------------
+def read_json(path):
+    """
+    Value stored in JSON file path, None if it is missing, unreadable, corrupt
+    or could have been written by somebody else
+    """
+
+    if not private_file(path):
+        return None
+
+    try:
+        with open(os.path.expanduser(path), 'r') as json_file:
+            return json.load(json_file)
+    except (IOError, OSError, ValueError):
+        return None
+
+
+# ------------------------------------------------------------------------------
+def write_json(path, value):
+    """
+    Atomically write value to JSON file path, creating its directory private to
+    the user.  Returns True if written, the file is not written to a directory
+    other users can modify.
+    """
+
+    path = os.path.abspath(os.path.expanduser(path))
+    file_dir = os.path.dirname(path)
+
+    tmp_path = None
+    try:
+        if not os.path.isdir(file_dir):
+            make_private_dirs(file_dir)
+        if not private_dir(file_dir):
+            return False
+
+        # mkstemp creates a new file only the user can access, never a link
+        fd, tmp_path = tempfile.mkstemp(dir=file_dir, prefix='.' + os.path.basename(path) + '.')
+        with os.fdopen(fd, 'w') as json_file:
+            json.dump(value, json_file)
+        os.rename(tmp_path, path)
+
+    except (IOError, OSError, TypeError, ValueError):
+        if tmp_path:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        return False
+
+    return True
@@ -0,0 +1,221 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: snapshot.py
+# Desc: Controller side store of the facts collected by the roles, written by
+#       the sas_snapshot callback and read by the sas_snapshot_facts action to
+#       generate reports without connecting to the hosts.
+# Auth: Laszlo Nagy
+# Note: Runs on the Ansible control node only.
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+import json
+import os
+import time
+
+try:
+    import sqlite3
+    HAS_SQLITE = True
+except ImportError:
+    HAS_SQLITE = False
+
+
+# ------------------------------------------------------------------------------
+# Constants
+# ------------------------------------------------------------------------------
+
+# Snapshot database
+SNAPSHOT_PATH_DEFAULT = '~/.ansible/sas_snapshot.db'
+
+# Facts of the roles
+FACT_PREFIX = 'sas_'
+
+# Host facts the reports use besides the facts of the roles
+BASE_FACTS = [
+    'system',
+    'architecture',
+    'os_family',
+    'distribution',
+    'distribution_version',
+    'distribution_major_version',
+    'distribution_release',
+    'default_ipv4',
+    'date_time'
+]
+
+# Facts holding user lists: fact key -> (list key, UID field index or None).
+# Users are indexed by name and UID so they can be searched across hosts.
+USER_LISTS = {
+    'sas_local_unix_users_key': ('local_unix_users', 2),
+    'sas_local_unix_user_conflicts_key': ('local_unix_user_conflicts', 2),
+    'sas_logon_policy_for_unix_host_key': ('users_allowed', 2),
+    'sas_logon_policy_for_ad_user_key': ('users_allowed', 2),
+    'sas_local_unix_users_with_ad_logon_key': ('local_unix_users_with_ad_logon', None)
+}
+
+# Key of the changes in facts returned with delta set, such facts do not have
+# all records and are stored once the role has applied the changes
+DELTA_KEY = 'delta'
+
+# Fact and field holding the Active Directory domain of a host
+DOMAIN_FACT = 'sas_client_join_status'
+DOMAIN_FIELD = 'domain'
+
+# Number of seconds to wait for another writer to release the database
+BUSY_TIMEOUT = 30
+
+# Database layout
+SCHEMA = [
+    'CREATE TABLE IF NOT EXISTS hosts ('
+    ' host TEXT PRIMARY KEY, domain TEXT, time REAL)',
+    'CREATE TABLE IF NOT EXISTS facts ('
+    ' host TEXT, key TEXT, value TEXT, time REAL, PRIMARY KEY (host, key))',
+    'CREATE TABLE IF NOT EXISTS users ('
+    ' host TEXT, fact TEXT, name TEXT, uid INTEGER)',
+    'CREATE INDEX IF NOT EXISTS hosts_domain ON hosts (domain)',
+    'CREATE INDEX IF NOT EXISTS users_host ON users (host, fact)',
+    'CREATE INDEX IF NOT EXISTS users_name ON users (name)',
+    'CREATE INDEX IF NOT EXISTS users_uid ON users (uid)'
+]
+
+
+# ------------------------------------------------------------------------------
+# Functions
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def connect(path=SNAPSHOT_PATH_DEFAULT):
+    """
+    Open the snapshot database, creating it and its tables if needed.  Returns
+    err and the connection.
+    """
+
+    if not HAS_SQLITE:
+        return 'Python sqlite3 module is required for the snapshot', None
+
+    path = os.path.expanduser(path)
+    try:
+        snapshot_dir = os.path.dirname(path)
+        if snapshot_dir and not os.path.isdir(snapshot_dir):
+            os.makedirs(snapshot_dir)
+        conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        for statement in SCHEMA:
+            conn.execute(statement)
+        conn.commit()
+    except (sqlite3.Error, OSError) as e:
+        return 'Cannot open snapshot ' + path + ': ' + str(e), None
+
+    return None, conn
+
+
+# ------------------------------------------------------------------------------
+def select_facts(facts):
+    """
+    Facts of facts that are kept in the snapshot, the facts of the roles and
+    the host facts the reports use, but not facts with only record changes
+    """
+
+    selected = {}
+    for key, value in facts.items():
+        name = key[len('ansible_'):] if key.startswith('ansible_') else key
+        if isinstance(value, dict) and DELTA_KEY in value:
+            continue
+        if name.startswith(FACT_PREFIX) or name in BASE_FACTS:
+            selected[name] = value
+
+    return selected
+
+
+# ------------------------------------------------------------------------------
+def user_rows(host, key, value):
+    """
+    Users table rows of the user list in fact key
+    """
+
+    list_key, uid_index = USER_LISTS[key]
+    users = value.get(list_key) if isinstance(value, dict) else None
+    if not isinstance(users, list):
+        return []
+
+    rows = []
+    for user in users:
+        if not isinstance(user, (list, tuple)) or not user:
+            continue
+        uid = None
+        if uid_index is not None and len(user) > uid_index:
+            try:
+                uid = int(user[uid_index])
+            except (TypeError, ValueError):
+                pass
+        rows.append((host, key, str(user[0]), uid))
+
+    return rows
+
+
+# ------------------------------------------------------------------------------
+def store_facts(conn, host, facts):
+    """
+    Store the snapshot facts of facts for host, replacing earlier values of the
+    same facts.  Returns the number of facts stored, the caller commits.
+    """
+
+    selected = select_facts(facts)
+    if not selected:
+        return 0
+
+    now = time.time()
+    conn.execute('INSERT OR IGNORE INTO hosts (host, domain, time) VALUES (?, NULL, ?)', (host, now))
+    conn.execute('UPDATE hosts SET time = ? WHERE host = ?', (now, host))
+
+    conn.executemany(
+        'INSERT OR REPLACE INTO facts (host, key, value, time) VALUES (?, ?, ?, ?)',
+        [(host, key, json.dumps(value, sort_keys=True, default=str), now) for key, value in selected.items()])
+
+    for key, value in selected.items():
+        if key in USER_LISTS:
+            conn.execute('DELETE FROM users WHERE host = ? AND fact = ?', (host, key))
+            conn.executemany(
+                'INSERT INTO users (host, fact, name, uid) VALUES (?, ?, ?, ?)', user_rows(host, key, value))
+        elif key == DOMAIN_FACT and isinstance(value, dict) and value.get(DOMAIN_FIELD):
+            conn.execute('UPDATE hosts SET domain = ? WHERE host = ?', (str(value[DOMAIN_FIELD]), host))
+
+    return len(selected)
+
+
+# ------------------------------------------------------------------------------
+def load_facts(path, host, keys=None):
+    """
+    Facts of host stored in the snapshot at path, only the facts in keys if
+    set.  Returns err, found and the facts, found is False if the snapshot has
+    none of the facts of host.
+    """
+
+    if not HAS_SQLITE:
+        return 'Python sqlite3 module is required for the snapshot', False, {}
+
+    path = os.path.expanduser(path)
+    if not os.path.isfile(path):
+        return 'Snapshot ' + path + ' does not exist', False, {}
+
+    facts = {}
+    try:
+        conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT)
+        try:
+            for key, value in conn.execute('SELECT key, value FROM facts WHERE host = ?', (host,)):
+                if not keys or key in keys:
+                    facts[key] = json.loads(value)
+        finally:
+            conn.close()
+    except (sqlite3.Error, ValueError) as e:
+        return 'Cannot read snapshot ' + path + ': ' + str(e), False, {}
+
+    return None, bool(facts), facts
@@ -0,0 +1,243 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: vasd_cache.py
+# Desc: Ansible utils module that reads users and groups from the vasd identity
+#       cache database instead of forking vastool.
+# Auth: Laszlo Nagy
+# Note: The database is only read when the caller opts in and its schema
+#       version and table layout are ones this module knows, callers fall
+#       back to vastool otherwise.
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+import os
+
+try:
+    import sqlite3
+    HAS_SQLITE = True
+except ImportError:
+    HAS_SQLITE = False
+
+
+# ------------------------------------------------------------------------------
+# Constants
+# ------------------------------------------------------------------------------
+
+# vasd identity cache database
+CACHE_PATH = '/var/opt/quest/vas/vasd/vas_ident.vdb'
+
+# Table layout of each known schema version (PRAGMA user_version).  User rows
+# are selected in the order of the fields of vastool list users output
+# (name:passwd:uid:gid:gecos:home:shell), group rows in the order of vastool
+# list groups output (name:passwd:gid:members).
+# NOTE: vasd does not document the layout of its cache database.  The layout
+#       below is not taken from a vasd release, so the cache is only read when
+#       enabled (vasd_cache option of get_logon_policy_for_unix_host) after
+#       checking it against the vasd version in use, e.g. with
+#       sqlite3 /var/opt/quest/vas/vasd/vas_ident.vdb 'PRAGMA user_version' '.schema'
+#       A database is only used if it also has the tables and columns of the
+#       layout (PRAGMA table_info), any other database falls back to vastool.
+SCHEMAS = {
+    4: {
+        'users_table': 'usercache',
+        'user_columns': ['name', 'passwd', 'uid', 'gid', 'gecos', 'home', 'shell'],
+        'user_allowed_column': 'access_allowed',
+        'groups_table': 'groupcache',
+        'group_columns': ['name', 'passwd', 'gid', 'members']
+    }
+}
+
+# Number of rows fetched from the database at a time
+FETCH_SIZE = 1000
+
+# Number of seconds to wait for vasd to release a database lock
+BUSY_TIMEOUT = 5
+
+# Number of names looked up per query, below the SQLite host parameter limit
+LOOKUP_CHUNK = 500
+
+
+# ------------------------------------------------------------------------------
+# Functions
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def open_cache(path=CACHE_PATH):
+    """
+    Open the vasd identity cache read-only.  Returns the connection and the
+    table layout of its schema, or None, None if the database cannot be read,
+    its schema version is not known or its tables don't match the layout of
+    that version.
+    """
+
+    if not HAS_SQLITE or not os.path.isfile(path):
+        return None, None
+
+    conn = None
+    try:
+        conn = sqlite3.connect('file:' + path + '?mode=ro', uri=True, timeout=BUSY_TIMEOUT)
+        version = conn.execute('PRAGMA user_version').fetchone()[0]
+        schema = SCHEMAS.get(version)
+        if schema is not None and not schema_matches(conn, schema):
+            schema = None
+    except (sqlite3.Error, TypeError):
+        # TypeError: Python 2 cannot open databases read-only
+        if conn is not None:
+            conn.close()
+        return None, None
+
+    if schema is None:
+        conn.close()
+        return None, None
+
+    return conn, schema
+
+
+# ------------------------------------------------------------------------------
+def schema_matches(conn, schema):
+    """
+    Does the database have the users and groups tables of schema with all of
+    their columns?  The schema version alone could match a different layout.
+    """
+
+    tables = [
+        (schema['users_table'], schema['user_columns'] + [schema['user_allowed_column']]),
+        (schema['groups_table'], schema['group_columns'])
+    ]
+    for table, columns in tables:
+        # Rows of table_info are cid, name, type, notnull, dflt_value, pk
+        table_columns = set(row[1] for row in conn.execute('PRAGMA table_info(' + table + ')'))
+        if not table_columns.issuperset(columns):
+            return False
+
+    return True
+
+
+# ------------------------------------------------------------------------------
+def iter_rows(conn, table, columns, where='', args=()):
+    """
+    Yields rows of table as lists of strings, fetching FETCH_SIZE rows at a
+    time so large caches are never loaded into memory at once
+    """
+
+    query = 'SELECT ' + ', '.join(columns) + ' FROM ' + table
+    if where:
+        query += ' WHERE ' + where
+    cursor = conn.execute(query, args)
+    while True:
+        rows = cursor.fetchmany(FETCH_SIZE)
+        if not rows:
+            break
+        for row in rows:
+            yield ['' if value is None else str(value) for value in row]
+
+
+# ------------------------------------------------------------------------------
+def iter_users(conn, schema, allowed_only=False):
+    """
+    Yields all cached users, or only the ones allowed to log on to the host
+    """
+
+    where = schema['user_allowed_column'] + ' != 0' if allowed_only else ''
+    return iter_rows(conn, schema['users_table'], schema['user_columns'], where)
+
+
+# ------------------------------------------------------------------------------
+def iter_groups(conn, schema):
+    """
+    Yields all cached groups
+    """
+
+    return iter_rows(conn, schema['groups_table'], schema['group_columns'])
+
+
+# ------------------------------------------------------------------------------
+def find_users(conn, schema, name=None, uid=None, allowed_only=False):
+    """
+    Cached users with the given name and/or UID, looked up with the indexes of
+    the users table
+    """
+
+    conditions = []
+    args = []
+    if name is not None:
+        conditions.append('name = ?')
+        args.append(name)
+    if uid is not None:
+        conditions.append('uid = ?')
+        args.append(int(uid))
+    if allowed_only:
+        conditions.append(schema['user_allowed_column'] + ' != 0')
+
+    return list(iter_rows(conn, schema['users_table'], schema['user_columns'], ' AND '.join(conditions), args))
+
+
+# ------------------------------------------------------------------------------
+def find_groups(conn, schema, name=None, gid=None):
+    """
+    Cached groups with the given name and/or GID, looked up with the indexes
+    of the groups table
+    """
+
+    conditions = []
+    args = []
+    if name is not None:
+        conditions.append('name = ?')
+        args.append(name)
+    if gid is not None:
+        conditions.append('gid = ?')
+        args.append(int(gid))
+
+    return list(iter_rows(conn, schema['groups_table'], schema['group_columns'], ' AND '.join(conditions), args))
+
+
+# ------------------------------------------------------------------------------
+def find_users_by_names(conn, schema, names, allowed_only=False):
+    """
+    Cached users with any of the given names, looked up LOOKUP_CHUNK names at
+    a time with the name index of the users table
+    """
+
+    names = list(names)
+    users = []
+    for i in range(0, len(names), LOOKUP_CHUNK):
+        chunk = names[i:i + LOOKUP_CHUNK]
+        where = 'name IN (' + ', '.join('?' * len(chunk)) + ')'
+        if allowed_only:
+            where += ' AND ' + schema['user_allowed_column'] + ' != 0'
+        users += iter_rows(conn, schema['users_table'], schema['user_columns'], where, chunk)
+
+    return users
+
+
+# ------------------------------------------------------------------------------
+def list_users_allowed(user_names=None, path=None):
+    """
+    Users allowed to log on to the host in the format of vastool list
+    users-allowed, only the users in user_names if set.  path is the database,
+    CACHE_PATH if not set.  Returns a hit flag and the users, hit is False when
+    the cache cannot be used.
+    """
+
+    conn, schema = open_cache(path or CACHE_PATH)
+    if conn is None:
+        return False, []
+
+    try:
+        if user_names:
+            users_allowed = find_users_by_names(conn, schema, user_names, allowed_only=True)
+        else:
+            users_allowed = list(iter_users(conn, schema, allowed_only=True))
+    except sqlite3.Error:
+        return False, []
+    finally:
+        conn.close()
+
+    return True, users_allowed
@@ -14,9 +14,13 @@
 # Imports
 # ------------------------------------------------------------------------------
 
-import sys
-import subprocess
+from io import StringIO
+import csv
+import os
 import re
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.exec_cmd as ec
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.vastool_cache as vc
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.vasd_cache as vdc
 
 
 # ------------------------------------------------------------------------------
@@ -28,20 +32,34 @@ VASTOOL_DIR = '/opt/quest/bin'
 VASTOOL_FILE = 'vastool'
 VASTOOL_PATH = VASTOOL_DIR + '/' + VASTOOL_FILE
 
+# Number of seconds a vastool query may run before it is killed
+VASTOOL_TIMEOUT = 120
+
+# Parsed vas.conf by path, with the mtime and size it was parsed at
+VAS_CONF_PARSED = {}
+
 
 # ------------------------------------------------------------------------------
 # Functions
 # ------------------------------------------------------------------------------
 
 # ------------------------------------------------------------------------------
-def vastool_status():
+def vastool_status(use_cache=True):
     """
-    Call vastool status
+    Call vastool status, the domain is cached on the host between module runs.
+    Set use_cache to False to always call vastool, e.g. to decide whether to
+    join or unjoin.  Only successful calls are cached.
     """
 
     # Return values
     domain = None
 
+    # Check cache
+    if use_cache:
+        hit, domain = vc.cache_get('status -q', VASTOOL_PATH)
+        if hit:
+            return domain
+
     # Build vastool command
     cmd = []
     cmd += [VASTOOL_PATH]
@@ -49,19 +67,12 @@ def vastool_status():
     cmd += ['-q']
 
     # Call vastool
-    try:
-        p = subprocess.Popen(' '.join(cmd), stdin=None, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=True)
-        rval_bytes, rval_err = p.communicate()
-        rval_bytes += rval_err
-    # This exception happens when the process exits with a non-zero return code
-    except subprocess.CalledProcessError as e:
-        # Just grab output bytes likes a normal exit, we'll parse it for errors anyway
-        rval_bytes = e.output
-    # Popen returns list of bytes so we have to decode to get a string
-    rval_str = rval_bytes.decode(sys.stdout.encoding)
+    rc, rval_str, _ = ec.exec_cmd(cmd, VASTOOL_TIMEOUT)
 
     # Parse vastool return
     domain = vastool_status_parse(rval_str)
+    if rc == 0 and rval_str.strip():
+        vc.cache_put('status -q', VASTOOL_PATH, domain)
 
     # Return
     return domain
@@ -82,3 +93,296 @@ def vastool_status_parse(rval_str):
 
     # Return
     return domain
+
+
+# ------------------------------------------------------------------------------
+def vastool_status_check():
+    """
+    Call vastool status -c to check the health of the agent
+    """
+
+    # Return values
+    err = None
+    issues = []
+    non_zero_ret_code = False
+
+    # Build vastool command
+    cmd = []
+    cmd += [VASTOOL_PATH]
+    cmd += ['status']
+    cmd += ['-c']
+
+    # Call vastool
+    rc, rval_str, _ = ec.exec_cmd(cmd, VASTOOL_TIMEOUT)
+    if rc > 0:
+        non_zero_ret_code = True
+
+    # Parse vastool return
+    err, issues = vastool_status_check_parse(non_zero_ret_code, rval_str)
+
+    # Return
+    return err, issues
+
+
+# ------------------------------------------------------------------------------
+def vastool_status_check_parse(non_zero_ret_code, stdout_str):
+
+    # Return values
+    err = None
+    issues = []
+
+    failure = False
+
+    severities = {
+        '1': 'Warning',
+        '2': 'Failure',
+        '3': 'Critical Failure'
+    }
+
+    text_stream = StringIO(stdout_str)
+    csv_reader = csv.reader(text_stream)
+    for row in csv_reader:
+        if row[0] != 'STATUS':
+            continue
+        if row[3] not in severities:
+            continue
+        if row[3] in ('2', '3'):
+            failure = True
+        issues += [
+            {
+                'test_id': row[1],
+                'description': row[2].replace("`", ""),
+                'severity': severities[row[3]],
+                'result': row[4].replace("`", "")
+            }
+        ]
+
+    if failure:
+        err = 'One or more QAS Status checks failed.'
+
+    if not issues and non_zero_ret_code:
+        err = stdout_str
+
+    # Return
+    return err, issues
+
+
+# ------------------------------------------------------------------------------
+def vastool_list_users_allowed(user_names=None, vasd_cache=False):
+    """
+    Call vastool list users-allowed, only the users in user_names if set.  With
+    vasd_cache set the users are read from the vasd identity cache instead when
+    its schema is known.
+    """
+
+    # Return values
+    err = None
+    users_allowed = []
+    non_zero_ret_code = False
+
+    # Read vasd cache
+    if vasd_cache:
+        hit, users_allowed = vdc.list_users_allowed(user_names)
+        if hit:
+            return err, users_allowed
+
+    # Build vastool command
+    cmd = []
+    cmd += [VASTOOL_PATH]
+    cmd += ['list']
+    cmd += ['users-allowed']
+
+    # Call vastool
+    rc, rval_str, _ = ec.exec_cmd(cmd, VASTOOL_TIMEOUT)
+    if rc > 0:
+        non_zero_ret_code = True
+
+    # Parse vastool return
+    err, users_allowed = vastool_list_users_allowed_parse(non_zero_ret_code, rval_str, user_names)
+
+    # Return
+    return err, users_allowed
+
+
+# ------------------------------------------------------------------------------
+def vastool_list_users_allowed_parse(non_zero_ret_code, stdout_str, user_names=None):
+
+    # Return values
+    err = None
+    users_allowed = []
+
+    # Only lines of the requested users are split into records
+    names = set(user_names) if user_names else None
+
+    if non_zero_ret_code:
+        err = stdout_str
+    else:
+        for line in stdout_str.split('\n'):
+            line = line.strip()
+            if not line:
+                continue
+            if names is not None and line.split(':', 1)[0] not in names:
+                continue
+            user = line.split(':')
+            if len(user) == 7:
+                users_allowed.append(user)
+
+    # Return
+    return err, users_allowed
+
+
+# ------------------------------------------------------------------------------
+def vastool_inspect(setting):
+    """
+    Call vastool inspect, the value is cached on the host between module runs.
+    setting is 'section key', each is passed to vastool as its own argument.
+    """
+
+    # Return values
+    err = None
+    value = ''
+
+    # Check cache
+    cache_name = 'inspect ' + setting
+    hit, value = vc.cache_get(cache_name, VASTOOL_PATH)
+    if hit:
+        return err, value
+
+    # Build vastool command
+    cmd = []
+    cmd += [VASTOOL_PATH]
+    cmd += ['inspect']
+    cmd += setting.split()
+
+    # Call vastool
+    rc, rval_str, _ = ec.exec_cmd(cmd, VASTOOL_TIMEOUT)
+
+    if rc:
+        err = rval_str
+        value = ''
+    else:
+        value = rval_str.strip()
+        vc.cache_put(cache_name, VASTOOL_PATH, value)
+
+    # Return
+    return err, value
+
+
+# ------------------------------------------------------------------------------
+def vastool_inspect_many(settings):
+    """
+    Resolve any number of vas.conf settings ('section key', the vastool
+    inspect argument) in one pass.  Settings set in vas.conf are read from the
+    parsed file, the others from the host cache or, for the remaining ones,
+    with vastool inspect.
+
+    Returns an err value that contains None if no error or a string describing
+    the error, and a dict of the value of each setting.
+    """
+
+    # Return values
+    err = None
+    values = {}
+
+    # Settings in vas.conf
+    vas_conf = read_vas_conf(vc.VAS_CONF_PATH)
+    misses = []
+    for setting in settings:
+        key = tuple(setting.split(None, 1))
+        if key in vas_conf:
+            values[setting] = vas_conf[key]
+        else:
+            misses.append(setting)
+
+    # Settings cached on the host
+    vastool_misses = []
+    for setting in misses:
+        hit, value = vc.cache_get('inspect ' + setting, VASTOOL_PATH)
+        if hit:
+            values[setting] = value
+        else:
+            vastool_misses.append(setting)
+
+    # Defaults and computed settings from vastool, one call per setting but
+    # only on cache misses
+    for setting in vastool_misses:
+        setting_err, values[setting] = vastool_inspect(setting)
+        if setting_err is not None:
+            err = setting_err if err is None else err + '\n' + setting_err
+
+    # Return
+    return err, values
+
+
+# ------------------------------------------------------------------------------
+def read_vas_conf(path):
+    """
+    Settings of vas.conf as a dict of (section, key) to value, parsed once per
+    process and again only when the file changes.  Empty if the file cannot be
+    read.
+    """
+
+    try:
+        st = os.stat(path)
+    except OSError:
+        return {}
+
+    parsed = VAS_CONF_PARSED.get(path)
+    if parsed is not None and parsed[0] == (st.st_mtime, st.st_size):
+        return parsed[1]
+
+    try:
+        with open(path, 'rb') as vas_conf_file:
+            content = vas_conf_file.read().decode('utf-8', 'replace')
+    except (IOError, OSError):
+        return {}
+
+    settings = parse_vas_conf(content)
+    VAS_CONF_PARSED[path] = ((st.st_mtime, st.st_size), settings)
+
+    # Return
+    return settings
+
+
+# ------------------------------------------------------------------------------
+def parse_vas_conf(content):
+    """
+    Parse vas.conf (Kerberos profile format) into a dict of (section, key) to
+    value.  Only top level relations are returned, the first one wins like it
+    does for vastool.  Relations in braces (realms, domain_realm subsections)
+    are skipped.
+    """
+
+    settings = {}
+    section = None
+    depth = 0
+
+    for line in content.split('\n'):
+        line = line.strip()
+        if not line or line[0] in '#;':
+            continue
+
+        if depth:
+            depth += line.count('{') - line.count('}')
+            continue
+
+        if line.startswith('['):
+            end = line.find(']')
+            section = line[1:end].strip() if end > 0 else None
+            continue
+
+        if section is None or '=' not in line:
+            continue
+
+        key, value = line.split('=', 1)
+        key = key.strip()
+        value = value.strip()
+        if value.startswith('{'):
+            depth = value.count('{') - value.count('}')
+            continue
+
+        settings.setdefault((section, key), value)
+
+    # Return
+    return settings
+
@@ -0,0 +1,161 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: vastool_cache.py
+# Desc: Ansible utils module that caches vastool results on the host between
+#       module runs.
+# Auth: Laszlo Nagy
+# Note: Entries are tied to the identity (inode and mtime) of the executable
+#       and the mtime of vas.conf, so upgrading the software or changing the
+#       configuration makes them stale immediately.
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+import os
+import json
+import tempfile
+import time
+
+
+# ------------------------------------------------------------------------------
+# Constants
+# ------------------------------------------------------------------------------
+
+# Cache file
+CACHE_PATH = '/var/tmp/.oneidentity_authentication_services_cache.json'
+
+# Number of seconds a cache entry is valid for
+CACHE_TTL = 300
+
+# Configuration file whose changes invalidate the cached values
+VAS_CONF_PATH = '/etc/opt/quest/vas/vas.conf'
+
+
+# ------------------------------------------------------------------------------
+# Functions
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def cache_get(name, file_path, ttl=CACHE_TTL):
+    """
+    Get cached value of name that was produced by the file_path executable.
+
+    Returns a hit flag and the cached value.  The value can legitimately be
+    None, so always check the hit flag.
+    """
+
+    if ttl <= 0:
+        return False, None
+
+    entry = read_cache().get(name)
+    if not isinstance(entry, dict):
+        return False, None
+
+    if entry.get('key') != cache_key(file_path):
+        return False, None
+
+    if time.time() - entry.get('time', 0) > ttl:
+        return False, None
+
+    return True, entry.get('value')
+
+
+# ------------------------------------------------------------------------------
+def cache_put(name, file_path, value):
+    """
+    Cache value of name that was produced by the file_path executable.
+    """
+
+    cache = read_cache()
+    cache[name] = {
+        'key': cache_key(file_path),
+        'time': time.time(),
+        'value': value
+    }
+    write_cache(cache)
+
+
+# ------------------------------------------------------------------------------
+def cache_invalidate():
+    """
+    Drop all cached values, e.g. after joining or unjoining the domain.
+    """
+
+    try:
+        os.remove(CACHE_PATH)
+    except OSError:
+        pass
+
+
+# ------------------------------------------------------------------------------
+def cache_key(file_path):
+    """
+    Build the key that ties a cache entry to the executable and vas.conf.
+    """
+
+    return file_identity(file_path) + file_identity(VAS_CONF_PATH)
+
+
+# ------------------------------------------------------------------------------
+def file_identity(file_path):
+    """
+    Path, inode and mtime of a file, zeros if the file does not exist.
+    """
+
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return [file_path, 0, 0]
+
+    return [file_path, st.st_ino, st.st_mtime]
+
+
+# ------------------------------------------------------------------------------
+def read_cache():
+    """
+    Read the cache file.  Returns an empty cache if the file is missing,
+    unreadable, corrupt, or could have been written by somebody else.
+    """
+
+    try:
+        st = os.stat(CACHE_PATH)
+
+        # /var/tmp is world writable so only trust our own, private file
+        if st.st_uid != os.geteuid() or st.st_mode & 0o077:
+            return {}
+
+        with open(CACHE_PATH, 'r') as cache_file:
+            cache = json.load(cache_file)
+
+    except (IOError, OSError, ValueError):
+        return {}
+
+    return cache if isinstance(cache, dict) else {}
+
+
+# ------------------------------------------------------------------------------
+def write_cache(cache):
+    """
+    Write the cache file atomically.  Failing to write the cache is not an
+    error, the values are simply recomputed next time.
+    """
+
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(CACHE_PATH), prefix='.oneidentity_cache_')
+        with os.fdopen(fd, 'w') as cache_file:
+            json.dump(cache, cache_file)
+        os.rename(tmp_path, CACHE_PATH)
+
+    except (IOError, OSError):
+        if tmp_path:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
@@ -0,0 +1,387 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: client_sw_cache.py
+# Desc: Ansible module for client_sw and client_preflight roles that manages
+#       the content addressed install package cache on the host.
+# Auth: Laszlo Nagy
+# Note:
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Required Ansible documentation
+# ------------------------------------------------------------------------------
+
+ANSIBLE_METADATA = {
+    'metadata_version': '0.2',
+    'status': ['preview'],
+    'supported_by': 'community'
+}
+
+DOCUMENTATION = """
+---
+module: client_sw_cache
+
+short_description: Looks up an install package in the host's install package cache
+
+version_added: '2.9'
+
+description: >
+    Install packages are cached on the host in path/<sha256>/<file> where
+    <sha256> is the SHA-256 checksum of the install package.  Looks up the
+    install package in the cache and returns the cached file path and whether
+    it is already there (hit).  A cached file is only a hit if its SHA-256
+    checksum matches.  On a miss the cache entry directory is created and the
+    install package has to be copied to the returned path.
+    The cache directory and its entries are created private to the user the
+    module runs as.  The module fails if the cache directory or any of its
+    parents could be modified by other users, except directories owned by root
+    with the sticky bit set like /tmp.
+    Least recently used cache entries are evicted until the cache fits in
+    max_size bytes, the looked up entry is never evicted.
+
+options:
+    path:
+        description:
+            - Cache directory on the host
+        type: str
+        required: true
+    file:
+        description:
+            - Install package file name
+        type: str
+        required: true
+    sha256:
+        description:
+            - SHA-256 checksum of the install package
+        type: str
+        required: true
+    size:
+        description:
+            - Size of the install package in bytes, a cached file of another size is a miss
+        type: int
+        required: true
+    max_size:
+        description:
+            - Maximum size of the cache in bytes
+        type: int
+        required: false
+        default: 1073741824
+
+author:
+    - Laszlo Nagy (laszlo.nagy@oneidentity.com)
+"""
+
+EXAMPLES = """
+- name: Normal usage
+  client_sw_cache:
+    path: /tmp/1id/cache
+    file: vasclnt-5.1.0-123.x86_64.rpm
+    sha256: "{{ package_stat.stat.checksum }}"
+    size: "{{ package_stat.stat.size }}"
+  register: package_cache
+
+- name: Copy on miss
+  copy:
+    src: /tmp/1id/client/linux-x86_64/vasclnt-5.1.0-123.x86_64.rpm
+    dest: "{{ package_cache.dest }}"
+  when: not package_cache.hit
+"""
+
+RETURN = """
+dest:
+    description: Path of the cached install package on the host
+    type: str
+    returned: always
+hit:
+    description: Is the install package already in the cache?
+    type: bool
+    returned: always
+evicted:
+    description: Evicted cache entries
+    type: list
+    returned: always
+cache_size:
+    description: Size of the cache in bytes after eviction, including the looked up install package
+    type: int
+    returned: always
+"""
+
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+from ansible.module_utils.basic import AnsibleModule
+import traceback
+import hashlib
+import os
+import re
+import stat
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.private_file as pf
+
+
+# ------------------------------------------------------------------------------
+# Constants
+# ------------------------------------------------------------------------------
+
+# Arg choices and defaults
+MAX_SIZE_DEFAULT = 1024 * 1024 * 1024
+
+# Cache entry directory name
+ENTRY_RE = re.compile(r'^[0-9a-f]{64}$')
+
+# Number of bytes read at a time when checksumming a cached file
+CHUNK_SIZE = 1024 * 1024
+
+
+# ------------------------------------------------------------------------------
+# Functions
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def run_module():
+    """
+    Main Ansible module function
+    """
+
+    # Module argument info
+    module_args = {
+            'path': {
+                'type': 'str',
+                'required': True
+            },
+            'file': {
+                'type': 'str',
+                'required': True
+            },
+            'sha256': {
+                'type': 'str',
+                'required': True
+            },
+            'size': {
+                'type': 'int',
+                'required': True
+            },
+            'max_size': {
+                'type': 'int',
+                'required': False,
+                'default': MAX_SIZE_DEFAULT
+            }
+        }
+
+    # Seed result value
+    result = {
+            'changed': False,
+            'failed': False,
+            'msg': '',
+            'dest': '',
+            'hit': False,
+            'evicted': [],
+            'cache_size': 0
+        }
+
+    # Lean on boilerplate code in AnsibleModule class
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=True
+    )
+
+    # Run logic
+    err, result = run_normal(module.params, result, module.check_mode)
+
+    # Exit
+    module.exit_json(**result)
+
+
+# ------------------------------------------------------------------------------
+def run_normal(params, result, check_mode):
+    """
+    Normal mode logic, in check mode the cache is only looked up.
+
+    params contains input parameters.
+
+    result contains run results skeleton, will modify/add to and then return
+    this value along with an err value that contains None if no error or a string
+    describing the error.
+    """
+
+    # Return data
+    err = None
+    changed = False
+    hit = False
+    evicted = []
+    cache_size = 0
+
+    # Parameters
+    path = params['path']
+    file_name = os.path.basename(params['file'])
+    sha256 = params['sha256'].lower()
+    size = params['size']
+    max_size = params['max_size']
+
+    entry = os.path.join(path, sha256)
+    dest = os.path.join(entry, file_name)
+
+    try:
+
+        if not ENTRY_RE.match(sha256):
+            err = 'Invalid SHA-256 checksum ' + params['sha256']
+
+        else:
+
+            # Create entry private to the user
+            if not check_mode and not os.path.isdir(entry):
+                pf.make_private_dirs(entry)
+                changed = True
+
+            # Somebody else could have put the cached file there
+            if os.path.exists(entry) and not pf.private_dir(entry):
+                err = 'Install package cache ' + entry + ' or one of its parents can be modified by other users'
+
+            # A cached file only counts if it is the install package
+            elif cached_file_ok(dest, sha256, size):
+                hit = True
+
+            elif not check_mode and os.path.lexists(dest):
+                os.remove(dest)
+                changed = True
+
+            if err is None and not check_mode:
+
+                # Mark entry as most recently used
+                os.utime(entry, None)
+
+                # Make room for the install package
+                evicted, cache_size = evict(path, sha256, max_size - (0 if hit else size))
+                changed = changed or bool(evicted)
+                cache_size += 0 if hit else size
+
+    except Exception:
+        tb = traceback.format_exc()
+        err = str(tb)
+
+    # Build result
+    result['changed'] = changed
+    result['failed'] = err is not None
+    result['msg'] = err if err is not None else ''
+    result['dest'] = dest
+    result['hit'] = hit
+    result['evicted'] = evicted
+    result['cache_size'] = cache_size
+
+    # Return
+    return err, result
+
+
+# ------------------------------------------------------------------------------
+def cached_file_ok(file_path, sha256, size):
+    """
+    Is file_path a regular file of the user with the given size and SHA-256
+    checksum?
+    """
+
+    try:
+        st = os.lstat(file_path)
+    except OSError:
+        return False
+
+    if not stat.S_ISREG(st.st_mode) or st.st_uid != os.geteuid() or st.st_mode & 0o022:
+        return False
+    if st.st_size != size:
+        return False
+
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as cached_file:
+        for chunk in iter(lambda: cached_file.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+
+    return digest.hexdigest() == sha256
+
+
+# ------------------------------------------------------------------------------
+def evict(path, keep, max_size):
+    """
+    Evict least recently used cache entries in path, except keep, until the
+    cache size is at most max_size.  Returns the evicted entries and the cache
+    size.
+    """
+
+    entries = []
+    for name in os.listdir(path):
+        entry = os.path.join(path, name)
+        if ENTRY_RE.match(name) and os.path.isdir(entry):
+            entries.append((os.path.getmtime(entry), name, entry_size(entry)))
+
+    cache_size = sum(e[2] for e in entries)
+    evicted = []
+    for mtime, name, e_size in sorted(entries):
+        if cache_size <= max_size:
+            break
+        if name == keep:
+            continue
+        if remove_entry(os.path.join(path, name)):
+            evicted.append(name)
+            cache_size -= e_size
+
+    return evicted, cache_size
+
+
+# ------------------------------------------------------------------------------
+def entry_size(entry):
+    """
+    Size of the files in a cache entry
+    """
+
+    size = 0
+    for name in os.listdir(entry):
+        file_path = os.path.join(entry, name)
+        if os.path.isfile(file_path) and not os.path.islink(file_path):
+            size += os.path.getsize(file_path)
+
+    return size
+
+
+# ------------------------------------------------------------------------------
+def remove_entry(entry):
+    """
+    Remove a cache entry.  Only the files and empty directories of the entry
+    are removed so an entry with a mounted volume (macOS dmg) is left in place.
+    Returns True if the entry was removed.
+    """
+
+    for name in os.listdir(entry):
+        file_path = os.path.join(entry, name)
+        if os.path.ismount(file_path):
+            return False
+
+    for name in os.listdir(entry):
+        file_path = os.path.join(entry, name)
+        if os.path.isdir(file_path) and not os.path.islink(file_path):
+            try:
+                os.rmdir(file_path)
+            except OSError:
+                return False
+        else:
+            os.remove(file_path)
+    os.rmdir(entry)
+
+    return True
+
+
+# ------------------------------------------------------------------------------
+def main():
+    """
+    Main
+    """
+
+    run_module()
+
+
+# When run from command line
+# ------------------------------------------------------------------------------
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,423 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: client_sw_install.py
+# Desc: Ansible module for client_sw role that plans the package actions and
+#       applies them as batched package manager transactions.
+# Auth: Laszlo Nagy
+# Note:
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Required Ansible documentation
+# ------------------------------------------------------------------------------
+
+ANSIBLE_METADATA = {
+    'metadata_version': '0.2',
+    'status': ['preview'],
+    'supported_by': 'community'
+}
+
+DOCUMENTATION = """
+---
+module: client_sw_install
+
+short_description: Plans and applies Authentication Services client software package actions
+
+version_added: '2.9'
+
+description: >
+    Compares the requested state of every package (states) with its installed
+    version (versions) and the version of its install package (packages) and
+    plans the action (install, upgrade, downgrade, remove or none) of every
+    package.  Versions are compared numerically.  Packages are planned in the
+    same order as the pkgdict2items filter, absent packages first with
+    vasclnt(s) last, then present packages with vasclnt(s) first.
+    In check mode only the plan is returned.  Otherwise all removals, all
+    installs and all upgrades are each applied in one package manager
+    transaction, with the same commands and options the per package tasks of
+    the client_sw role use.  Like those tasks a downgrade removes the installed
+    version and then installs the package, so it is part of the removal and
+    the install transactions.  Applying the plan is supported for the Redhat,
+    Suse and Debian OS families.
+
+options:
+    packages:
+        description:
+            - Install packages, the packages dictionary returned by client_sw_pkgs
+        type: dict
+        required: true
+    states:
+        description:
+            - Requested state of each package (present, absent or check)
+        type: dict
+        required: true
+    versions:
+        description:
+            - Installed version of each package, the versions dictionary returned by client_sw_vers
+        type: dict
+        required: false
+        default: {}
+    os_family:
+        description:
+            - OS family (Redhat, Debian, etc.)
+        type: str
+        required: true
+    package_paths:
+        description:
+            - Path of the install package file of each package on the host
+        type: dict
+        required: false
+        default: {}
+    facts:
+        description:
+            - Generate Ansible facts?
+        type: bool
+        required: false
+        default: false
+    facts_key:
+        description:
+            - Ansible facts key
+        type: str
+        required: false
+        default: 'client_sw_install'
+
+author:
+    - Laszlo Nagy (laszlo.nagy@oneidentity.com)
+"""
+
+EXAMPLES = """
+- name: Plan package actions
+  client_sw_install:
+    packages: "{{ client_sw_pkgs['packages'] }}"
+    states: "{{ client_sw_pkg_state }}"
+    versions: "{{ client_sw_vers.versions }}"
+    os_family: "{{ ansible_facts['os_family'] }}"
+  check_mode: true
+  register: client_sw_plan
+
+- name: Apply package actions
+  client_sw_install:
+    packages: "{{ client_sw_pkgs['packages'] }}"
+    states: "{{ client_sw_pkg_state }}"
+    versions: "{{ client_sw_vers.versions }}"
+    os_family: "{{ ansible_facts['os_family'] }}"
+    package_paths: "{{ client_sw_cache_paths }}"
+  register: client_sw_install
+"""
+
+RETURN = """
+params:
+    description: Parameters passed in
+    type: dict
+    returned: always
+plan:
+    description: >
+        Ordered list of package actions, each with package, state, action,
+        installed_version, package_version and file keys
+    type: list
+    returned: always
+actions:
+    description: >
+        Result of each package (installed, upgraded, downgraded, removed, none
+        or failed), the planned result in check mode
+    type: dict
+    returned: always
+steps:
+    description: Package manager commands run with their return code and output
+    type: list
+    returned: always
+ansible_facts:
+    description: All return data is placed in Ansible facts
+    type: dict
+    returned: when facts parameter is true
+    keys:
+        changed:
+            description: Did the state of the host change?
+            type: bool
+            returned: always
+        failed:
+            description: Did the module fail?
+            type: bool
+            returned: always
+        msg:
+            description: Additional information if failed
+            type: str
+            returned: always
+        params:
+            description: Parameters passed in
+            type: dict
+            returned: always
+        plan:
+            description: Ordered list of package actions
+            type: list
+            returned: always
+        actions:
+            description: Result of each package
+            type: dict
+            returned: always
+        steps:
+            description: Package manager commands run
+            type: list
+            returned: always
+"""
+
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+from ansible.module_utils.basic import AnsibleModule
+import traceback
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.client_sw as csw
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.exec_cmd as ec
+
+
+# ------------------------------------------------------------------------------
+# Constants
+# ------------------------------------------------------------------------------
+
+# Arg choices and defaults
+VERSIONS_DEFAULT = {}
+PACKAGE_PATHS_DEFAULT = {}
+FACTS_DEFAULT = False
+FACTS_KEY_DEFAULT = 'client_sw_install'
+
+# Number of seconds a package manager transaction may run before it is killed
+TRANSACTION_TIMEOUT = 900
+
+# Remove, install and upgrade commands of each supported OS family, the same
+# as the per package tasks (roles/client_sw/tasks/os), the package names or
+# files are appended
+TRANSACTIONS = {
+    'redhat': {
+        'remove': ['rpm', '-e', '--nodeps'],
+        'install': ['rpm', '-ivh', '--nodeps'],
+        'upgrade': ['rpm', '-Uvh', '--nodeps']
+    },
+    'debian': {
+        'remove': ['dpkg', '--purge'],
+        'install': ['dpkg', '-i', '--force-depends'],
+        'upgrade': ['dpkg', '-i']
+    }
+}
+TRANSACTIONS['suse'] = TRANSACTIONS['redhat']
+
+
+# ------------------------------------------------------------------------------
+# Functions
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def run_module():
+    """
+    Main Ansible module function
+    """
+
+    # Module argument info
+    module_args = {
+            'packages': {
+                'type': 'dict',
+                'required': True
+            },
+            'states': {
+                'type': 'dict',
+                'required': True
+            },
+            'versions': {
+                'type': 'dict',
+                'required': False,
+                'default': VERSIONS_DEFAULT
+            },
+            'os_family': {
+                'type': 'str',
+                'required': True
+            },
+            'package_paths': {
+                'type': 'dict',
+                'required': False,
+                'default': PACKAGE_PATHS_DEFAULT
+            },
+            'facts': {
+                'type': 'bool',
+                'required': False,
+                'default': FACTS_DEFAULT
+            },
+            'facts_key': {
+                'type': 'str',
+                'required': False,
+                'default': FACTS_KEY_DEFAULT
+            }
+        }
+
+    # Seed result value
+    result = {
+            'changed': False,
+            'failed': False,
+            'msg': '',
+            'params': {},
+            'plan': [],
+            'actions': {},
+            'steps': []
+        }
+
+    # Lean on boilerplate code in AnsibleModule class
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=True
+    )
+
+    # Run logic
+    err, result = run_normal(module.params, result, module.check_mode)
+
+    # Exit
+    module.exit_json(**result)
+
+
+# ------------------------------------------------------------------------------
+def run_normal(params, result, check_mode):
+    """
+    Normal mode logic, in check mode the plan is returned without applying it.
+
+    params contains input parameters.
+
+    result contains run results skeleton, will modify/add to and then return
+    this value along with an err value that contains None if no error or a string
+    describing the error.
+    """
+
+    # Return data
+    err = None
+    changed = False
+    plan = []
+    actions = {}
+    steps = []
+
+    # Parameters
+    packages = params['packages']
+    states = params['states']
+    versions = params['versions'] or {}
+    os_family = params['os_family'].lower()
+    package_paths = params['package_paths'] or {}
+    facts = params['facts']
+    facts_key = params['facts_key'] if params['facts_key'] else FACTS_KEY_DEFAULT
+
+    try:
+
+        # Plan
+        plan = csw.plan_actions(states, packages, versions)
+        actions = dict((p['package'], csw.ACTION_RESULTS[p['action']]) for p in plan)
+
+        # Apply
+        if not check_mode:
+            err, changed, steps = apply_plan(plan, actions, os_family, package_paths)
+
+    except Exception:
+        tb = traceback.format_exc()
+        err = str(tb)
+
+    # Build result
+    result['changed'] = changed
+    result['failed'] = err is not None
+    result['msg'] = err if err is not None else ''
+    result['params'] = params
+    result['plan'] = plan
+    result['actions'] = actions
+    result['steps'] = steps
+
+    # Create ansible_facts data
+    if facts:
+        result_facts = result.copy()
+        result['ansible_facts'] = {facts_key: result_facts}
+
+    # Return
+    return err, result
+
+
+# ------------------------------------------------------------------------------
+def apply_plan(plan, actions, os_family, package_paths):
+    """
+    Apply plan with one remove, one install and one upgrade transaction,
+    downgrades are removed and then installed.  actions is updated with the
+    result of each transaction.
+    """
+
+    # Return values
+    err = None
+    changed = False
+    steps = []
+
+    removes = [p for p in plan if p['action'] in (csw.ACTION_REMOVE, csw.ACTION_DOWNGRADE)]
+    installs = [p for p in plan if p['action'] in (csw.ACTION_INSTALL, csw.ACTION_DOWNGRADE)]
+    upgrades = [p for p in plan if p['action'] == csw.ACTION_UPGRADE]
+    if not removes and not installs and not upgrades:
+        return err, changed, steps
+
+    if os_family not in TRANSACTIONS:
+        return 'Applying package actions is not supported for OS family ' + os_family, changed, steps
+
+    missing = [p['package'] for p in installs + upgrades if p['package'] not in package_paths]
+    if missing:
+        return 'No install package path for packages ' + ', '.join(missing), changed, steps
+
+    # Packages keep no action until their transaction succeeds
+    for p in removes + installs + upgrades:
+        actions[p['package']] = csw.ACTION_RESULTS[csw.ACTION_NONE]
+
+    # Removals first, then installs so downgraded packages are back before
+    # the upgrades that may depend on them.  The arguments are in plan order
+    # but rpm and dpkg order the packages of a transaction by their
+    # dependencies themselves.
+    batches = [
+        ('remove', removes, [p['package'] for p in removes]),
+        ('install', installs, [package_paths[p['package']] for p in installs]),
+        ('upgrade', upgrades, [package_paths[p['package']] for p in upgrades])
+    ]
+    for name, batch, args in batches:
+        if not batch:
+            continue
+
+        cmd = TRANSACTIONS[os_family][name] + args
+        rc, rval_str, duration = ec.exec_cmd(cmd, TRANSACTION_TIMEOUT)
+        steps.append({
+            'cmd': ' '.join(cmd),
+            'rc': rc,
+            'output': rval_str,
+            'time': duration
+        })
+
+        # A failed transaction may have changed some packages, the end version
+        # read shows which
+        if rc != 0:
+            for p in batch:
+                actions[p['package']] = 'failed'
+            err = 'Failed to ' + name + ' packages ' + ', '.join(p['package'] for p in batch) + ': ' + rval_str
+            changed = True
+            break
+
+        # A downgrade is done once its install transaction succeeded
+        for p in batch:
+            if name != 'remove' or p['action'] == csw.ACTION_REMOVE:
+                actions[p['package']] = csw.ACTION_RESULTS[p['action']]
+        changed = True
+
+    # Return
+    return err, changed, steps
+
+
+# ------------------------------------------------------------------------------
+def main():
+    """
+    Main
+    """
+
+    run_module()
+
+
+# When run from command line
+# ------------------------------------------------------------------------------
+if __name__ == '__main__':
+    main()
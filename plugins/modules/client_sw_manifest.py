@@ -0,0 +1,204 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: client_sw_manifest.py
+# Desc: Ansible module for client_sw and client_preflight roles that writes the
+#       manifest of the client software directory.
+# Auth: Laszlo Nagy
+# Note:
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Required Ansible documentation
+# ------------------------------------------------------------------------------
+
+ANSIBLE_METADATA = {
+    'metadata_version': '0.2',
+    'status': ['preview'],
+    'supported_by': 'community'
+}
+
+DOCUMENTATION = """
+---
+module: client_sw_manifest
+
+short_description: Writes the manifest of the Authentication Services client software directory
+
+version_added: '2.9'
+
+description: >
+    Walks the client software directory (path) once and writes a JSON manifest
+    (.client_sw_manifest.json) indexed by package directory (system and
+    architecture) and file extension, holding the name, version, size and
+    SHA-256 checksum of every install package.  client_sw_pkgs reads the
+    packages from the manifest while the directory mtimes match it instead of
+    scanning the directory for every host.  The manifest is only rewritten when
+    the directory has changed, checksums of unchanged files are reused.
+
+options:
+    path:
+        description:
+            - Client software directory
+        type: str
+        required: true
+    checksum:
+        description:
+            - Compute SHA-256 checksums of the install packages?
+        type: bool
+        required: false
+        default: true
+
+author:
+    - Laszlo Nagy (laszlo.nagy@oneidentity.com)
+"""
+
+EXAMPLES = """
+- name: Normal usage
+  client_sw_manifest:
+    path: /var/tmp/authentication_services/client
+  run_once: true
+  delegate_to: 127.0.0.1
+"""
+
+RETURN = """
+path:
+    description: Manifest file path
+    type: str
+    returned: always
+dirs:
+    description: Package directories in the manifest
+    type: list
+    returned: always
+"""
+
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+from ansible.module_utils.basic import AnsibleModule
+import traceback
+import os
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.client_sw as csw
+
+
+# ------------------------------------------------------------------------------
+# Constants
+# ------------------------------------------------------------------------------
+
+# Arg choices and defaults
+CHECKSUM_DEFAULT = True
+
+
+# ------------------------------------------------------------------------------
+# Functions
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def run_module():
+    """
+    Main Ansible module function
+    """
+
+    # Module argument info
+    module_args = {
+            'path': {
+                'type': 'str',
+                'required': True
+            },
+            'checksum': {
+                'type': 'bool',
+                'required': False,
+                'default': CHECKSUM_DEFAULT
+            }
+        }
+
+    # Seed result value
+    result = {
+            'changed': False,
+            'failed': False,
+            'msg': '',
+            'path': '',
+            'dirs': []
+        }
+
+    # Lean on boilerplate code in AnsibleModule class
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=True
+    )
+
+    # Run logic
+    err, result = run_normal(module.params, result, module.check_mode)
+
+    # Exit
+    module.exit_json(**result)
+
+
+# ------------------------------------------------------------------------------
+def run_normal(params, result, check_mode):
+    """
+    Normal mode logic, in check mode the manifest is built but not written.
+
+    params contains input parameters.
+
+    result contains run results skeleton, will modify/add to and then return
+    this value along with an err value that contains None if no error or a string
+    describing the error.
+    """
+
+    # Return data
+    err = None
+    changed = False
+    dirs = []
+
+    # Parameters
+    path = params['path']
+    checksum = params['checksum']
+
+    try:
+
+        if not os.path.isdir(path):
+            err = path + ' is not a directory'
+
+        else:
+            old_manifest = csw.read_manifest(path)
+            manifest = csw.build_manifest(path, checksum, old_manifest)
+            dirs = sorted(manifest['dirs'])
+
+            if manifest != old_manifest:
+                changed = True
+                if not check_mode:
+                    csw.write_manifest(path, manifest)
+
+    except Exception:
+        tb = traceback.format_exc()
+        err = str(tb)
+
+    # Build result
+    result['changed'] = changed
+    result['failed'] = err is not None
+    result['msg'] = err if err is not None else ''
+    result['path'] = os.path.join(path, csw.MANIFEST_FILE)
+    result['dirs'] = dirs
+
+    # Return
+    return err, result
+
+
+# ------------------------------------------------------------------------------
+def main():
+    """
+    Main
+    """
+
+    run_module()
+
+
+# When run from command line
+# ------------------------------------------------------------------------------
+if __name__ == '__main__':
+    main()
@@ -32,7 +32,10 @@ version_added: '2.9'
 description: >
     Checks and parses Authentication Services client software install directory to find list
     of client software packages per the provided system (sys), distribution (dist),
-    architecture (arch), at the specified path (path)
+    architecture (arch), at the specified path (path).  The packages are read from
+    the manifest written by client_sw_manifest when it is up to date, which also
+    provides the size and SHA-256 checksum of each package, otherwise the package
+    directory is globbed.
 
 options:
     sys:
@@ -87,6 +90,10 @@ packages:
     description: The discovered packages and versions in supplied path
     type: dict
     returned: always
+manifest:
+    description: Were the packages read from the client software directory manifest?
+    type: bool
+    returned: always
 ansible_facts:
     description: All return data is placed in Ansible facts
     type: dict
@@ -112,6 +119,10 @@ ansible_facts:
             description: The discovered packages and versions in supplied path
             type: dict
             returned: always
+        manifest:
+            description: Were the packages read from the client software directory manifest?
+            type: bool
+            returned: always
 """
 
 
@@ -123,7 +134,7 @@ from ansible.module_utils.basic import AnsibleModule
 import os
 import traceback
 import glob
-import re
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.client_sw as csw
 
 
 # ------------------------------------------------------------------------------
@@ -232,7 +243,8 @@ def run_module():
             'failed': False,
             'msg': '',
             'params': {},
-            'packages': {}
+            'packages': {},
+            'manifest': False
         }
 
     # Lean on boilerplate code in AnsibleModule class
@@ -265,6 +277,7 @@ def run_normal(params, result):
     # Return data
     err = None
     packages = {}
+    manifest = False
 
     # Parameters
     path = params['path']
@@ -281,7 +294,7 @@ def run_normal(params, result):
 
         # Find packages
         if err is None:
-            err, packages = find_packages(path, sys, dist, arch)
+            err, packages, manifest = find_packages(path, sys, dist, arch)
 
     except Exception:
         tb = traceback.format_exc()
@@ -293,6 +306,7 @@ def run_normal(params, result):
     result['msg'] = err if err is not None else ''
     result['params'] = params
     result['packages'] = packages
+    result['manifest'] = manifest
 
     # Create ansible_facts data
     if facts:
@@ -331,12 +345,15 @@ def check_dir(path):
 # ------------------------------------------------------------------------------
 def find_packages(sw_path, sys, dist, arch):
     """
-    Find packages
+    Find packages, from the client software directory manifest if it is up to
+    date otherwise by globbing the package directory
     """
 
     # Return values
     err = None
     packages = {}
+    manifest = False
+    preflight = None
 
     # Find package path for specified sys and arch
     err, pkgs_dir = find_packages_path(sys, arch)
@@ -348,23 +365,29 @@ def find_packages(sw_path, sys, dist, arch):
     # Find packages
     if not err:
         pkgs_path = sw_path + '/' + pkgs_dir
-        err, packages = parse_packages(pkgs_path, pkgs_ext)
+        manifest_pkgs = csw.manifest_packages(csw.read_manifest(sw_path), sw_path, pkgs_dir, pkgs_ext)
+        if manifest_pkgs is not None:
+            packages, preflight = manifest_pkgs
+            manifest = True
+        else:
+            err, packages = parse_packages(pkgs_path, pkgs_ext)
+            preflight = find_preflight(pkgs_path)
 
     # NOTE: Authentication Services macOS packages are grouped into dmg files,
     #       so need to do some post-processing
     if not err and sys == 'darwin':
         err, packages = process_macos_packages(packages)
 
-    # Find preflight
+    # Add preflight
     if not err:
-        packages['preflight'] = find_preflight(pkgs_path)
+        packages['preflight'] = preflight
 
     # Check for no packages found
     if not err and not packages:
         err = 'No packages found at ' + sw_path + ' for sys=' + sys + ', dist=' + dist + ', arch=' + arch
 
     # Return
-    return err, packages
+    return err, packages, manifest
 
 
 # ------------------------------------------------------------------------------
@@ -423,17 +446,10 @@ def parse_packages(path, ext):
     err = None
     packages = {}
 
-    # regex strings
-    pkg_name_re_str = r'^[a-z]+'
-    pkg_vers_re_str = r'(?=.*)[\d]+\.[\d]+\.[\d]+[\.-][\d]+(?=\D\D)'
-
-    # Compile regex's
-    pkg_name_re = re.compile(pkg_name_re_str, re.I)
-    pkg_vers_re = re.compile(pkg_vers_re_str)
-
-    # Glob the package directory to find packages with correct file extension
+    # Glob the package directory to find packages with correct file extension,
+    # sorted to match the manifest order
     pkgs_str = path + '*/*.' + ext
-    pkgs = glob.glob(pkgs_str)
+    pkgs = sorted(glob.glob(pkgs_str))
 
     # Parse each package
     for pkg in pkgs:
@@ -441,16 +457,7 @@ def parse_packages(path, ext):
         pkg_path = pkg
         pkg_file = os.path.basename(pkg_path)
 
-        pkg_name = None
-        pkg_name_match = pkg_name_re.search(pkg_file)
-        if pkg_name_match:
-            pkg_name = pkg_name_match.group().lower()
-
-        pkg_vers = ''
-        pkg_vers_match = pkg_vers_re.search(pkg_file)
-        if pkg_vers_match:
-            pkg_vers = pkg_vers_match.group()
-            pkg_vers = pkg_vers.replace('-', '.')
+        pkg_name, pkg_vers = csw.parse_package_file(pkg_file)
 
         if pkg_name:
             packages[pkg_name] = {
@@ -523,21 +530,13 @@ def process_dmg_package(dmg_pkgs, dmg_pkg, pkg_names):
     if dmg_name:
         for pkg_name in pkg_names:
 
+            # All packages share the dmg file (and its size and checksum when
+            # read from the manifest)
+            packages[pkg_name] = dict(dmg_data)
+
             # vascert has a version different from the other software packages
             if pkg_name == 'vascert':
-                packages[pkg_name] = {
-                        'path': dmg_data['path'],
-                        'file': dmg_data['file'],
-                        'vers': get_vascert_version(dmg_data['vers'])
-                    }
-
-            # All other packages share the same version as the installer
-            else:
-                packages[pkg_name] = {
-                        'path': dmg_data['path'],
-                        'file': dmg_data['file'],
-                        'vers': dmg_data['vers']
-                    }
+                packages[pkg_name]['vers'] = get_vascert_version(dmg_data['vers'])
 
     return packages
 
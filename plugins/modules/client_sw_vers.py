@@ -0,0 +1,498 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: client_sw_vers.py
+# Desc: Ansible module for client_sw role that reads the installed versions of
+#       the client software packages in one call.
+# Auth: Laszlo Nagy
+# Note:
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Required Ansible documentation
+# ------------------------------------------------------------------------------
+
+ANSIBLE_METADATA = {
+    'metadata_version': '0.2',
+    'status': ['preview'],
+    'supported_by': 'community'
+}
+
+DOCUMENTATION = """
+---
+module: client_sw_vers
+
+short_description: Reads installed Authentication Services client software package versions
+
+version_added: '2.9'
+
+description: >
+    Reads the installed version of every listed package with a single query of
+    the package database of the OS family (os_family).  Packages that are not
+    installed get an empty version.
+
+options:
+    packages:
+        description:
+            - Package names
+        type: list
+        elements: str
+        required: true
+    os_family:
+        description:
+            - OS family (Redhat, Debian, etc.)
+        type: str
+        required: true
+    facts:
+        description:
+            - Generate Ansible facts?
+        type: bool
+        required: false
+        default: false
+    facts_key:
+        description:
+            - Ansible facts key
+        type: str
+        required: false
+        default: 'client_sw_vers'
+
+author:
+    - Laszlo Nagy (laszlo.nagy@oneidentity.com)
+"""
+
+EXAMPLES = """
+- name: Normal usage
+  client_sw_vers:
+    packages:
+      - vasclnt
+      - vasgp
+      - vasyp
+    os_family: "{{ ansible_facts['os_family'] }}"
+  register: client_sw_vers_result
+"""
+
+RETURN = """
+params:
+    description: Parameters passed in
+    type: dict
+    returned: always
+versions:
+    description: Installed version of each package, empty string if not installed
+    type: dict
+    returned: always
+ansible_facts:
+    description: All return data is placed in Ansible facts
+    type: dict
+    returned: when facts parameter is true
+    keys:
+        changed:
+            description: Did the state of the host change?
+            type: bool
+            returned: always
+        failed:
+            description: Did the module fail?
+            type: bool
+            returned: always
+        msg:
+            description: Additional information if failed
+            type: str
+            returned: always
+        params:
+            description: Parameters passed in
+            type: dict
+            returned: always
+        versions:
+            description: Installed version of each package, empty string if not installed
+            type: dict
+            returned: always
+"""
+
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.common.text.converters import to_text
+import traceback
+import re
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.exec_cmd as ec
+
+
+# ------------------------------------------------------------------------------
+# Constants
+# ------------------------------------------------------------------------------
+
+# Arg choices and defaults
+FACTS_DEFAULT = False
+FACTS_KEY_DEFAULT = 'client_sw_vers'
+
+# dpkg database
+DPKG_STATUS_PATH = '/var/lib/dpkg/status'
+
+# Number of seconds a package database query may run before it is killed
+QUERY_TIMEOUT = 120
+
+# Package version, same as the version read from the package file names
+VERS_RE = re.compile(r'(?=.*)[\d]+\.[\d]+\.[\d]+[\.-][\d]+')
+
+
+# ------------------------------------------------------------------------------
+# Functions
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def run_module():
+    """
+    Main Ansible module function
+    """
+
+    # Module argument info
+    module_args = {
+            'packages': {
+                'type': 'list',
+                'elements': 'str',
+                'required': True
+            },
+            'os_family': {
+                'type': 'str',
+                'required': True
+            },
+            'facts': {
+                'type': 'bool',
+                'required': False,
+                'default': FACTS_DEFAULT
+            },
+            'facts_key': {
+                'type': 'str',
+                'required': False,
+                'default': FACTS_KEY_DEFAULT
+            }
+        }
+
+    # Seed result value
+    result = {
+            'changed': False,
+            'failed': False,
+            'msg': '',
+            'params': {},
+            'versions': {}
+        }
+
+    # Lean on boilerplate code in AnsibleModule class
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=True
+    )
+
+    # Run logic
+    # NOTE: This module makes no changes so check mode doesn't need to be handled
+    #       specially
+    err, result = run_normal(module.params, result)
+
+    # Exit - success
+    module.exit_json(**result)
+
+
+# ------------------------------------------------------------------------------
+def run_normal(params, result):
+    """
+    Normal mode logic.
+
+    params contains input parameters.
+
+    result contains run results skeleton, will modify/add to and then return
+    this value along with an err value that contains None if no error or a string
+    describing the error.
+    """
+
+    # Return data
+    err = None
+    versions = {}
+
+    # Parameters
+    packages = params['packages']
+    os_family = params['os_family'].lower()
+    facts = params['facts']
+    facts_key = params['facts_key'] if params['facts_key'] else FACTS_KEY_DEFAULT
+
+    try:
+
+        # Read versions
+        err, versions = read_versions(packages, os_family)
+
+    except Exception:
+        tb = traceback.format_exc()
+        err = str(tb)
+
+    # Build result
+    result['changed'] = False   # Never makes any changes to the host
+    result['failed'] = err is not None
+    result['msg'] = err if err is not None else ''
+    result['params'] = params
+    result['versions'] = versions
+
+    # Create ansible_facts data
+    if facts:
+        result_facts = result.copy()
+        result['ansible_facts'] = {facts_key: result_facts}
+
+    # Return
+    return err, result
+
+
+# ------------------------------------------------------------------------------
+def read_versions(packages, os_family):
+    """
+    Read installed versions of packages for the specified OS family
+    """
+
+    # Return values
+    err = None
+    versions = dict((pkg, '') for pkg in packages)
+
+    if not packages:
+        return err, versions
+
+    if os_family not in VERSION_READERS:
+        return 'Unsupported OS family ' + os_family, versions
+
+    err, installed = VERSION_READERS[os_family](packages)
+    for pkg in packages:
+        versions[pkg] = installed.get(pkg, '')
+
+    # Return
+    return err, versions
+
+
+# ------------------------------------------------------------------------------
+def query(cmd):
+    """
+    Run a package database query.  A non-zero return code is expected when some
+    of the packages are not installed so only failing to run the query at all
+    is an error.
+    """
+
+    rc, rval_str, _ = ec.exec_cmd(cmd, QUERY_TIMEOUT)
+    if rc in (ec.TIMEOUT_RC, ec.EXEC_FAILED_RC):
+        return rval_str, ''
+
+    return None, rval_str
+
+
+# ------------------------------------------------------------------------------
+def parse_version(vers_str):
+    """
+    Parse version from a version string, empty string if there is none
+    """
+
+    vers_match = VERS_RE.search(vers_str)
+    if not vers_match:
+        return ''
+
+    return vers_match.group().replace('-', '.')
+
+
+# ------------------------------------------------------------------------------
+def read_versions_rpm(packages):
+    """
+    Redhat and SuSE: one rpm query with all package names.
+
+    Example:
+    vasclnt 5.1.0-123
+    package vasgp is not installed
+    """
+
+    installed = {}
+    err, rval_str = query(['rpm', '-q', '--queryformat', '%{NAME} %{VERSION}-%{RELEASE}\\n'] + packages)
+    for line in rval_str.splitlines():
+        items = line.split(None, 1)
+        if len(items) == 2 and items[0] in packages:
+            installed[items[0]] = parse_version(items[1])
+
+    return err, installed
+
+
+# ------------------------------------------------------------------------------
+def read_versions_dpkg(packages):
+    """
+    Debian: parse the dpkg status database directly.
+
+    Example stanza:
+    Package: vasclnt
+    Status: install ok installed
+    Version: 5.1.0-123
+    """
+
+    installed = {}
+    wanted = set(packages)
+
+    def add(stanza):
+        if stanza.get('Package') in wanted and stanza.get('Status', '').endswith(' installed'):
+            installed[stanza['Package']] = parse_version(stanza.get('Version', ''))
+
+    stanza = {}
+    try:
+        with open(DPKG_STATUS_PATH, 'rb') as status_file:
+            for line in status_file:
+                line = to_text(line, errors='surrogate_or_replace').rstrip('\n')
+                if not line:
+                    add(stanza)
+                    stanza = {}
+                elif not line[0].isspace():
+                    key, sep, value = line.partition(':')
+                    if key in ('Package', 'Status', 'Version'):
+                        stanza[key] = value.strip()
+        add(stanza)
+    except (IOError, OSError) as e:
+        return 'Failed to read ' + DPKG_STATUS_PATH + ': ' + str(e), installed
+
+    return None, installed
+
+
+# ------------------------------------------------------------------------------
+def read_versions_pkg(packages):
+    """
+    FreeBSD: one query of all installed packages.
+
+    Example:
+    vasclnt 5.1.0.123
+    """
+
+    installed = {}
+    err, rval_str = query(['pkg', 'query', '-a', '%n %v'])
+    for line in rval_str.splitlines():
+        items = line.split(None, 1)
+        if len(items) == 2 and items[0] in packages:
+            installed[items[0]] = parse_version(items[1])
+
+    return err, installed
+
+
+# ------------------------------------------------------------------------------
+def read_versions_pkginfo(packages):
+    """
+    Solaris: one pkginfo call with all package names.
+
+    Example:
+       PKGINST:  vasclnt
+          NAME:  Authentication Services
+       VERSION:  5.1.0.123
+    """
+
+    installed = {}
+    pkg = None
+    err, rval_str = query(['pkginfo', '-l'] + packages)
+    for line in rval_str.splitlines():
+        key, sep, value = line.strip().partition(':')
+        if key == 'PKGINST':
+            pkg = value.strip()
+        elif key == 'VERSION' and pkg in packages:
+            installed[pkg] = parse_version(value)
+
+    return err, installed
+
+
+# ------------------------------------------------------------------------------
+def read_versions_lslpp(packages):
+    """
+    AIX: one listing of all installed filesets.
+
+    Example:
+    #Package Name:Fileset:Level:State:PTF Id:Fix State:Type:Description:...
+    vasclnt.rte:vasclnt.rte:5.1.0.123: : :C: :Authentication Services:...
+    """
+
+    installed = {}
+    err, rval_str = query(['lslpp', '-cL'])
+    for line in rval_str.splitlines():
+        items = line.split(':')
+        if len(items) < 3 or line.startswith('#'):
+            continue
+        pkg = items[1].split('.')[0]
+        if pkg in packages and pkg not in installed:
+            installed[pkg] = parse_version(items[2])
+
+    return err, installed
+
+
+# ------------------------------------------------------------------------------
+def read_versions_swlist(packages):
+    """
+    HP-UX: one listing of all installed products.
+
+    Example:
+      vasclnt               5.1.0.123      Authentication Services
+    """
+
+    installed = {}
+    err, rval_str = query(['swlist'])
+    for line in rval_str.splitlines():
+        items = line.split()
+        if len(items) >= 2 and items[0] in packages:
+            installed[items[0]] = parse_version(items[1])
+
+    return err, installed
+
+
+# ------------------------------------------------------------------------------
+def read_versions_pkgutil(packages):
+    """
+    macOS: one listing of all package receipts, then the info of the receipts
+    of our packages.
+
+    Example:
+    com.quest.vasclnt
+    version: 5.1.0.123
+    """
+
+    installed = {}
+    err, rval_str = query(['pkgutil', '--pkgs'])
+    if err is not None:
+        return err, installed
+
+    pkg_ids = rval_str.split()
+    for pkg in packages:
+        pkg_id = next((pkg_id for pkg_id in pkg_ids if pkg_id.endswith(pkg)), None)
+        if pkg_id is None:
+            continue
+        err, info_str = query(['pkgutil', '--pkg-info', pkg_id])
+        if err is not None:
+            break
+        for line in info_str.splitlines():
+            key, sep, value = line.partition(':')
+            if key.strip() == 'version':
+                installed[pkg] = parse_version(value)
+
+    return err, installed
+
+
+# Version reader of each supported OS family
+VERSION_READERS = {
+    'redhat': read_versions_rpm,
+    'suse': read_versions_rpm,
+    'debian': read_versions_dpkg,
+    'freebsd': read_versions_pkg,
+    'solaris': read_versions_pkginfo,
+    'aix': read_versions_lslpp,
+    'hp-ux': read_versions_swlist,
+    'darwin': read_versions_pkgutil
+}
+
+
+# ------------------------------------------------------------------------------
+def main():
+    """
+    Main
+    """
+
+    run_module()
+
+
+# When run from command line
+# ------------------------------------------------------------------------------
+if __name__ == '__main__':
+    main()
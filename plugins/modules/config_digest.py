@@ -0,0 +1,206 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: config_digest.py
+# Desc: Ansible module for client_config role that checks which configuration
+#       files are already in their desired state.
+# Auth: Laszlo Nagy
+# Note:
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Required Ansible documentation
+# ------------------------------------------------------------------------------
+
+ANSIBLE_METADATA = {
+    'metadata_version': '0.2',
+    'status': ['preview'],
+    'supported_by': 'community'
+}
+
+DOCUMENTATION = """
+---
+module: config_digest
+
+short_description: Checks which configuration files are in their desired state
+
+version_added: '2.9'
+
+description: >
+    Computes the digest of the desired state of every configuration file, the
+    same way the vas_conf and line_file modules do with digest set, and compares
+    it with the digest stored next to the file.  A file is current when both
+    digests match and the file content, mode and ownership have not changed
+    since the digest was stored.  Current files can be skipped without running
+    the module that applies their items.
+
+options:
+    files:
+        description:
+            - >
+              Configuration files by name, each a dict with path, module
+              (vas_conf or line_file), items, create, mode, owner and group,
+              the parameters the file is applied with
+        type: dict
+        required: true
+
+author:
+    - Laszlo Nagy (laszlo.nagy@oneidentity.com)
+"""
+
+EXAMPLES = """
+- name: Normal usage
+  config_digest:
+    files:
+      users_allow:
+        path: /etc/opt/quest/vas/users.allow
+        module: line_file
+        items:
+          - line: 'unix_admins@example.com'
+            state: present
+        create: true
+  register: client_config_digest_result
+"""
+
+RETURN = """
+current:
+    description: Names of the files in their desired state
+    type: list
+    returned: always
+stale:
+    description: Names of the files that have to be applied
+    type: list
+    returned: always
+"""
+
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.parsing.convert_bool import boolean
+import traceback
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.config_file as cf
+
+
+# ------------------------------------------------------------------------------
+# Constants
+# ------------------------------------------------------------------------------
+
+# Modules that store digests
+MODULE_CHOICES = ['vas_conf', 'line_file']
+
+
+# ------------------------------------------------------------------------------
+# Functions
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def run_module():
+    """
+    Main Ansible module function
+    """
+
+    # Module argument info
+    module_args = {
+            'files': {
+                'type': 'dict',
+                'required': True
+            }
+        }
+
+    # Seed result value
+    result = {
+            'changed': False,
+            'failed': False,
+            'msg': '',
+            'current': [],
+            'stale': []
+        }
+
+    # Lean on boilerplate code in AnsibleModule class
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=True
+    )
+
+    # Run logic
+    err, result = run_normal(module.params, result)
+
+    # Exit
+    module.exit_json(**result)
+
+
+# ------------------------------------------------------------------------------
+def run_normal(params, result):
+    """
+    Normal mode logic.
+
+    params contains input parameters.
+
+    result contains run results skeleton, will modify/add to and then return
+    this value along with an err value that contains None if no error or a string
+    describing the error.
+    """
+
+    # Return data
+    err = None
+    current = []
+    stale = []
+
+    # Parameters
+    files = params['files']
+
+    try:
+
+        for name in sorted(files):
+            file_params = files[name]
+            if file_params.get('module') not in MODULE_CHOICES:
+                err = name + ': module must be one of: ' + ', '.join(MODULE_CHOICES)
+                break
+
+            desired = cf.desired_digest(
+                file_params['module'],
+                file_params.get('items') or [],
+                boolean(file_params.get('create', True)),
+                file_params.get('mode'),
+                file_params.get('owner'),
+                file_params.get('group'))
+
+            if cf.digest_current(file_params['path'], desired):
+                current.append(name)
+            else:
+                stale.append(name)
+
+    except Exception:
+        tb = traceback.format_exc()
+        err = str(tb)
+
+    # Build result
+    result['changed'] = False
+    result['failed'] = err is not None
+    result['msg'] = err if err is not None else ''
+    result['current'] = current
+    result['stale'] = stale
+
+    # Return
+    return err, result
+
+
+# ------------------------------------------------------------------------------
+def main():
+    """
+    Main
+    """
+
+    run_module()
+
+
+# When run from command line
+# ------------------------------------------------------------------------------
+if __name__ == '__main__':
+    main()
@@ -31,9 +31,28 @@ version_added: '2.9'
 
 description: >
     Returns list of Active Directory users, groups, organizational units and
-    domain names from users.allow and users.deny.
+    domain names from users.allow and users.deny.  The file locations are read
+    from vas.conf, only settings not in vas.conf or cached on the host are
+    resolved with vastool inspect, one call per setting.
+    With users set, also evaluates on the host whether each of the users may
+    log on.  The entries are compiled once into hash sets of user, group, OU
+    and domain names and wildcard patterns, the most specific matching entry
+    decides (user, group, OU, domain), users.deny wins a tie and users not
+    matched by a users.allow with entries are denied.  Users that do not
+    resolve to Active Directory (no domain, dn or groups, like root) are not
+    governed by these files and are not evaluated.
 
 options:
+    users:
+        description:
+            - >
+              Users to evaluate, each a user name (DOMAIN\\user or
+              user@domain) or a dict with name, groups (list of group names),
+              dn (distinguished name), upn and domain keys
+        type: list
+        elements: raw
+        required: false
+        default: []
     facts:
         description:
             - Generate Ansible facts?
@@ -57,6 +76,18 @@ EXAMPLES = """
     facts: true
     facts_key: host_access_control_facts_key
   register: get_host_access_control_result
+
+- name: Can these users log on?
+  get_host_access_control:
+    users:
+      - EXAMPLE\\user1
+      - name: user2@example.com
+        groups:
+          - EXAMPLE\\unix_admins
+        dn: CN=user2,OU=Admins,DC=example,DC=com
+    facts: true
+    facts_key: host_access_control_facts_key
+  register: get_host_access_control_result
 """
 
 RETURN = """
@@ -89,6 +120,14 @@ ansible_facts:
             description: All entries of users.deny
             type: list of strs
             returned: always
+        access:
+            description: >
+                Verdict of each user in users with user, allowed, file
+                (users.allow, users.deny or empty) and entry (the deciding
+                entry) keys.  allowed is null for users that were not
+                evaluated because they do not resolve to Active Directory.
+            type: list of dicts
+            returned: always
 """
 
 
@@ -97,13 +136,10 @@ ansible_facts:
 # ------------------------------------------------------------------------------
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible.module_utils.common.text.converters import to_text
-import os
-import sys
-import subprocess
 import traceback
 import ansible_collections.oneidentity.authentication_services.plugins.module_utils.vastool as vt
 import ansible_collections.oneidentity.authentication_services.plugins.module_utils.check_file_exec as cfe
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.host_access as hac
 
 
 # ------------------------------------------------------------------------------
@@ -111,6 +147,7 @@ import ansible_collections.oneidentity.authentication_services.plugins.module_ut
 # ------------------------------------------------------------------------------
 
 # Arg defaults
+USERS_DEFAULT = []
 FACTS_DEFAULT = True
 FACTS_VERBOSE_DEFAULT = True
 FACTS_KEY_DEFAULT = 'host_access_control'
@@ -128,6 +165,12 @@ def run_module():
 
     # Module argument info
     module_args = {
+            'users': {
+                'type': 'list',
+                'elements': 'raw',
+                'required': False,
+                'default': USERS_DEFAULT
+            },
             'facts': {
                 'type': 'bool',
                 'required': False,
@@ -179,8 +222,10 @@ def run_normal(params, result):
     version = ''
     users_allow = []
     users_deny = []
+    access = []
 
     # Parameters
+    users = params['users'] or []
     facts = params['facts']
     facts_key = params['facts_key'] if params['facts_key'] else FACTS_KEY_DEFAULT
 
@@ -189,24 +234,13 @@ def run_normal(params, result):
         # Check vastool
         err, version = cfe.check_file_exec(vt.VASTOOL_PATH, '-v')
 
-        # Run vastool
+        # Run vastool and read the access control files
         if err is None:
-            err, users_allow_file = run_vastool_inspect('vas_auth users-allow-file')
+            err, users_allow, users_deny = hac.get_users_allow_deny()
 
-        if err is None:
-            err, users_deny_file = run_vastool_inspect('vas_auth users-deny-file')
-
-        if err is None:
-            if not users_allow_file:
-                users_allow_file = '/etc/opt/quest/vas/users.allow'
-            if not users_deny_file:
-                users_deny_file = '/etc/opt/quest/vas/users.deny'
-
-        if err is None:
-            err, users_allow = get_entries(users_allow_file)
-
-        if err is None:
-            err, users_deny = get_entries(users_deny_file)
+        # Evaluate access of the users
+        if err is None and users:
+            err, access = hac.evaluate_access(users)
 
     except Exception:
         tb = traceback.format_exc()
@@ -224,82 +258,13 @@ def run_normal(params, result):
         result_facts['version'] = version
         result_facts['users_allow'] = users_allow
         result_facts['users_deny'] = users_deny
+        result_facts['access'] = access
         result['ansible_facts'] = {facts_key: result_facts}
 
     # Return
     return err, result
 
 
-
-# ------------------------------------------------------------------------------
-def run_vastool_inspect(setting):
-    """
-    Run vastool inspect
-    """
-
-    # Return values
-    err = None
-    value = ''
-    non_zero_ret_code = False
-
-    # Build vastool command
-    cmd = []
-    cmd += [vt.VASTOOL_PATH]
-    cmd += ['inspect']
-    cmd += [setting]
-
-    # Call vastool
-    try:
-        p = subprocess.Popen(' '.join(cmd), stdin=None, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=True)
-        rval_bytes, rval_err = p.communicate()
-        rval_bytes += rval_err
-    # This exception happens when the process exits with a non-zero return code
-    except subprocess.CalledProcessError as e:
-        # Just grab output bytes likes a normal exit
-        rval_bytes = e.output
-    # Popen returns list of bytes so we have to decode to get a string
-    rval_str = rval_bytes.decode(sys.stdout.encoding)
-
-    if p.returncode:
-        err = rval_str
-    else:
-        value = rval_str.strip()
-
-    # Return
-    return err, value
-
-
-# ------------------------------------------------------------------------------
-def get_entries(file_name):
-    """
-    Get non-empty, non-comment lines
-    """
-
-    err = None
-    entries = []
-
-    # check whether the file exists
-    if os.path.isfile(file_name):
-        try:
-            with open(file_name, 'rb') as users_file:
-                users_bytes = users_file.read()
-                users_str = to_text(users_bytes, errors='surrogate_or_strict')
-
-                entries = users_str.split('\n')
-                entries = [entry.strip() for entry in entries]
-                entries = [entry for entry in entries if len(entry) > 0]
-                entries = [entry for entry in entries if entry[0] != '#']
-
-        except Exception:
-            tb = traceback.format_exc()
-            err = str(tb)
-    else:
-        entries.append(file_name + ' does not exist.')
-
-    # Return
-    return err, entries
-
-
 # ------------------------------------------------------------------------------
 def main():
     """
@@ -58,6 +58,58 @@ options:
         type: bool
         required: false
         default: true
+    output:
+        description:
+            - >
+              Return all fields of each group (records) or only aggregates
+              of them computed on the host in one pass (summary)?  delta is
+              ignored with summary.
+        type: str
+        choices: ['records', 'summary']
+        required: false
+        default: 'records'
+    summary_range_size:
+        description:
+            - Number of IDs in each ID range of the summary
+        type: int
+        required: false
+        default: 1000
+    summary_top:
+        description:
+            - >
+              Number of largest groups and of GIDs used by several groups
+              listed in the summary
+        type: int
+        required: false
+        default: 10
+    delta:
+        description:
+            - >
+              Return only the groups added, changed and removed since the
+              version in delta_baseline?  The groups returned and their
+              version are stored in delta_path on the host.  Ignored in
+              check mode, all groups are returned and nothing is stored.
+        type: bool
+        required: false
+        default: false
+    delta_baseline:
+        description:
+            - >
+              Version of the groups the controller has, the delta_version
+              fact of an earlier run.  All groups are returned when it is
+              empty or not the version stored on the host.
+        type: str
+        required: false
+        default: ''
+    delta_path:
+        description:
+            - >
+              File on the host storing the groups returned last, created private
+              to the user the module runs as.  It is ignored if other users
+              could have written it.
+        type: str
+        required: false
+        default: '~/.ansible/oneidentity/get_local_unix_groups_delta.json'
     facts:
         description:
             - Generate Ansible facts?
@@ -83,6 +135,11 @@ EXAMPLES = """
     member: ''
     include_all_group_members: true
   register: get_local_unix_groups_result
+
+- name: Capacity summary
+  get_local_unix_groups:
+    output: summary
+  register: get_local_unix_groups_result
 """
 
 RETURN = """
@@ -110,7 +167,31 @@ ansible_facts:
         local_unix_groups:
             description: All fields of each group
             type: list of lists
-            returned: always
+            returned: when output is records and delta is not returned
+        delta_version:
+            description: Version of the groups, the delta_baseline of the next run
+            type: str
+            returned: when output is records and delta is true, not in check mode
+        delta:
+            description: >
+                Changes since delta_baseline, a dict with baseline, added
+                and changed (all fields of the groups) and removed (names).
+                All groups of a name are returned when any of them changed.
+            type: dict
+            returned: when delta is true and the groups of delta_baseline are stored on the host
+        summary:
+            description: >
+                Aggregates of the groups: count, gid_min, gid_max,
+                gid_invalid (non-numeric GIDs), gid_ranges (first GID,
+                last GID and number of groups of each range in use),
+                duplicate_gid_count (number of GIDs used by several
+                groups), duplicate_gids (GID, number of groups and their
+                names, each up to summary_top, of the GIDs used most),
+                members (total number of members), sizes (number of
+                groups by number of members: 0, 1-9, 10-99 and so on) and
+                largest (name and number of members of the largest groups)
+            type: dict
+            returned: when output is summary
 """
 
 
@@ -119,12 +200,9 @@ ansible_facts:
 # ------------------------------------------------------------------------------
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible.module_utils.common.text.converters import to_text
-import platform
-import subprocess
-import sys
 import traceback
-from ansible_collections.oneidentity.authentication_services.plugins.module_utils.misc_utils import enclose_shell_arg
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.local_unix as lu
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.fact_delta as fd
 
 
 # ------------------------------------------------------------------------------
@@ -134,6 +212,13 @@ from ansible_collections.oneidentity.authentication_services.plugins.module_util
 # Arg defaults
 GROUP_FIELD_DEFAULT = ''
 INCLUDE_ALL_GROUP_MEMBERS_DEFAULT = True
+OUTPUT_CHOICES = ['records', 'summary']
+OUTPUT_DEFAULT = 'records'
+SUMMARY_RANGE_SIZE_DEFAULT = lu.SUMMARY_RANGE_SIZE_DEFAULT
+SUMMARY_TOP_DEFAULT = lu.SUMMARY_TOP_DEFAULT
+DELTA_DEFAULT = False
+DELTA_BASELINE_DEFAULT = ''
+DELTA_PATH_DEFAULT = '~/.ansible/oneidentity/get_local_unix_groups_delta.json'
 FACTS_DEFAULT = True
 FACTS_KEY_DEFAULT = 'local_unix_groups'
 
@@ -170,6 +255,37 @@ def run_module():
                 'required': False,
                 'default': INCLUDE_ALL_GROUP_MEMBERS_DEFAULT
             },
+            'output': {
+                'type': 'str',
+                'choices': OUTPUT_CHOICES,
+                'required': False,
+                'default': OUTPUT_DEFAULT
+            },
+            'summary_range_size': {
+                'type': 'int',
+                'required': False,
+                'default': SUMMARY_RANGE_SIZE_DEFAULT
+            },
+            'summary_top': {
+                'type': 'int',
+                'required': False,
+                'default': SUMMARY_TOP_DEFAULT
+            },
+            'delta': {
+                'type': 'bool',
+                'required': False,
+                'default': DELTA_DEFAULT
+            },
+            'delta_baseline': {
+                'type': 'str',
+                'required': False,
+                'default': DELTA_BASELINE_DEFAULT
+            },
+            'delta_path': {
+                'type': 'str',
+                'required': False,
+                'default': DELTA_PATH_DEFAULT
+            },
             'facts': {
                 'type': 'bool',
                 'required': False,
@@ -196,21 +312,23 @@ def run_module():
     )
 
     # Run logic
-    # NOTE: This module makes no changes so check mode doesn't need to be handled
-    #       specially
-    err, result = run_normal(module.params, result)
+    # NOTE: This module makes no changes to the host, in check mode it only
+    #       doesn't store the groups returned for delta
+    err, result = run_normal(module.params, result, module.check_mode)
 
     # Exit
     module.exit_json(**result)
 
 
 # ------------------------------------------------------------------------------
-def run_normal(params, result):
+def run_normal(params, result, check_mode):
     """
     Normal mode logic.
 
     params contains input parameters.
 
+    check_mode is True in check mode, the delta state is not written then.
+
     result contains run results skeleton, will modify/add to and then return
     this value along with an err value that contains None if no error or a string
     describing the error.
@@ -219,54 +337,46 @@ def run_normal(params, result):
     # Return data
     err = None
     local_unix_groups = []
+    summary = None
+    delta_version = None
+    records_delta = None
 
     # Parameters
     group_name = params['group_name']
     gid_number = params['gid_number']
     member = params['member']
     include_all_group_members = params['include_all_group_members']
+    output = params['output']
+    summary_range_size = params['summary_range_size']
+    summary_top = params['summary_top']
+    delta = params['delta']
+    delta_baseline = params['delta_baseline']
+    delta_path = params['delta_path'] if params['delta_path'] else DELTA_PATH_DEFAULT
     facts = params['facts']
     facts_key = params['facts_key'] if params['facts_key'] else FACTS_KEY_DEFAULT
 
     try:
-        if platform.system() == 'Darwin':
-            rc, rval_str = run_dscl('. -list /Groups')
-            if rc == 0:
-                list_of_groups = rval_str.splitlines()
-                for group in list_of_groups:
-                    gid = get_group_property(group, 'PrimaryGroupID')
-                    members = get_group_property(group, 'GroupMembership')
-                    local_unix_groups.append([group, '*', gid, members])
-            else:
-                err = 'Failed to get list of groups. ' + rval_str
-        else :
-            with open('/etc/group', 'rb') as group_file:
-                group_bytes = group_file.read()
-                group_str = to_text(group_bytes, errors='surrogate_or_strict')
-
-                local_unix_groups = group_str.split('\n')
-                local_unix_groups = [group.strip() for group in local_unix_groups]
-                local_unix_groups = [group for group in local_unix_groups if len(group) > 0]
-                local_unix_groups = [group for group in local_unix_groups if group[0] != '#']
-                local_unix_groups = [group.split(':') for group in local_unix_groups]
-                local_unix_groups = [group for group in local_unix_groups if len(group) == 4]
-
-        if group_name:
-            local_unix_groups = [group for group in local_unix_groups if group_name in group[0]]
-        if gid_number:
-            local_unix_groups = [group for group in local_unix_groups if gid_number == group[2]]
-        if member:
-            local_unix_group_having_member_users = []
-            member_users = member.split(',')
-            for group in local_unix_groups:
-                for member_user in member_users:
-                    if member_user in group[3]:
-                        local_unix_group_having_member_users.append(group)
-                        break
-            local_unix_groups = local_unix_group_having_member_users
-
-        if not include_all_group_members:
-            local_unix_groups = [group[ : -1] for group in local_unix_groups]
+        match = lu.field_matcher(
+            equals={2: gid_number},
+            contains={0: group_name},
+            contains_any={3: member.split(',') if member else []}
+        )
+
+        # Aggregate the groups while reading them
+        if output == 'summary' and (summary_range_size < 1 or summary_top < 0):
+            err = 'summary_range_size must be greater than 0 and summary_top must not be negative'
+        elif output == 'summary':
+            err, groups = lu.iter_groups(match)
+            summary = lu.summarize_groups(groups, summary_range_size, summary_top)
+        else:
+            err, local_unix_groups = lu.read_groups(match)
+
+            if not include_all_group_members:
+                local_unix_groups = [group[ : -1] for group in local_unix_groups]
+
+        # Changes since the version the controller has
+        if delta and facts and err is None and summary is None and not check_mode:
+            delta_version, records_delta = fd.delta_since(delta_path, delta_baseline, local_unix_groups)
 
     except Exception:
         tb = traceback.format_exc()
@@ -281,56 +391,20 @@ def run_normal(params, result):
     if facts:
         result_facts = result.copy()
         result_facts['params'] = params
-        result_facts['local_unix_groups'] = local_unix_groups
+        if delta_version is not None:
+            result_facts['delta_version'] = delta_version
+        if summary is not None:
+            result_facts['summary'] = summary
+        elif records_delta is not None:
+            result_facts['delta'] = records_delta
+        else:
+            result_facts['local_unix_groups'] = local_unix_groups
         result['ansible_facts'] = {facts_key: result_facts}
 
     # Return
     return err, result
 
 
-# ------------------------------------------------------------------------------
-def run_dscl(args):
-    """
-    macOS manages users and groups by directory services instead of /etc/passwd
-    and /etc/group.
-    macOS uses the dscl command to interact with directory services.
-    """
-
-    try:
-        p = subprocess.Popen('dscl ' + args, stdin = None, stdout = subprocess.PIPE,
-            stderr = subprocess.PIPE, shell = True)
-        rval_bytes, rval_err = p.communicate()
-        rval_bytes += rval_err
-    # This exception happens when the process exits with a non-zero return code
-    except subprocess.CalledProcessError as e:
-        # Just grab output bytes likes a normal exit, we'll parse it for errors anyway
-        rval_bytes = e.output
-
-    # Popen returns list of bytes so we have to decode to get a string
-    rval_str = rval_bytes.decode(sys.stdout.encoding)
-
-    return p.returncode, rval_str
-
-
-# ------------------------------------------------------------------------------
-def get_group_property(group, prop):
-
-    rc, rval_str = run_dscl('. -read /Groups/' + enclose_shell_arg(group) + ' ' + prop)
-    if rc == 0:
-        # -read: Prints a directory. The property key is followed by colon, then a
-        # space-separated list of the values for that property. If any value contains
-        # embedded spaces, the list will instead be displayed one entry per line,
-        # starting on the line after the key.
-        lines = rval_str.splitlines()
-        if len(lines) == 1:
-            if lines[0].startswith(prop):
-                return lines[0].split(': ')[1]
-        elif len(lines) == 2:
-            return lines[1].strip()
-
-    return ''
-
-
 # ------------------------------------------------------------------------------
 def main():
     """
@@ -33,19 +33,33 @@ version_added: '2.9'
 
 description: >
     Returns local user accounts that would conflict with a
-    specified user name and UID on other hosts.
+    specified user name and UID on other hosts.  Any number of user name and
+    UID pairs can be checked at once with the candidates option, /etc/passwd
+    is read only once.
 
 options:
     user_name:
         description:
             - User name.
+            - Required unless candidates is given.
         type: str
-        required: true
+        required: false
+        default: ''
     uid_number:
         description:
             - User ID.
+            - Required unless candidates is given.
         type: str
-        required: true
+        required: false
+        default: ''
+    candidates:
+        description:
+            - List of user_name and uid_number pairs to check, checked in
+              addition to user_name and uid_number if those are given as well.
+        type: list
+        elements: dict
+        required: false
+        default: []
     facts:
         description:
             - Generate Ansible facts?
@@ -69,6 +83,15 @@ EXAMPLES = """
     user_name: 'bob'
     uid_number: '1001'
   register: get_local_unix_user_conflicts_result
+
+- name: Check a migration batch
+  get_local_unix_user_conflicts:
+    candidates:
+      - user_name: 'bob'
+        uid_number: '1001'
+      - user_name: 'alice'
+        uid_number: '1002'
+  register: get_local_unix_user_conflicts_result
 """
 
 RETURN = """
@@ -97,6 +120,12 @@ ansible_facts:
             description: All fields of each conflicting user account
             type: list of lists
             returned: always
+        local_unix_user_conflicts_by_candidate:
+            description: >
+                The candidates that have conflicts, each with its user_name,
+                uid_number and the conflicting user accounts in conflicts.
+            type: list of dicts
+            returned: always
 """
 
 
@@ -105,12 +134,8 @@ ansible_facts:
 # ------------------------------------------------------------------------------
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible.module_utils.common.text.converters import to_text
-import platform
-import subprocess
-import sys
 import traceback
-from ansible_collections.oneidentity.authentication_services.plugins.module_utils.misc_utils import enclose_shell_arg
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.local_unix as lu
 
 
 # ------------------------------------------------------------------------------
@@ -118,6 +143,8 @@ from ansible_collections.oneidentity.authentication_services.plugins.module_util
 # ------------------------------------------------------------------------------
 
 # Arg defaults
+USER_FIELD_DEFAULT = ''
+CANDIDATES_DEFAULT = []
 FACTS_DEFAULT = True
 FACTS_KEY_DEFAULT = 'local_unix_user_conflicts'
 
@@ -136,11 +163,19 @@ def run_module():
     module_args = {
             'user_name': {
                 'type': 'str',
-                'required': True,
+                'required': False,
+                'default': USER_FIELD_DEFAULT
             },
             'uid_number': {
                 'type': 'str',
-                'required': True,
+                'required': False,
+                'default': USER_FIELD_DEFAULT
+            },
+            'candidates': {
+                'type': 'list',
+                'elements': 'dict',
+                'required': False,
+                'default': CANDIDATES_DEFAULT
             },
             'facts': {
                 'type': 'bool',
@@ -191,42 +226,19 @@ def run_normal(params, result):
     # Return data
     err = None
     local_unix_users = []
+    conflicts_by_candidate = []
 
     # Parameters
     user_name = params['user_name']
     uid_number = params['uid_number']
+    candidates = params['candidates'] if params['candidates'] else []
     facts = params['facts']
     facts_key = params['facts_key'] if params['facts_key'] else FACTS_KEY_DEFAULT
 
     try:
-        if platform.system() == 'Darwin':
-            rc, rval_str = run_dscl('. -list /Users')
-            if rc == 0:
-                list_of_users = rval_str.splitlines()
-                for user in list_of_users:
-                    uid = get_user_property(user, 'UniqueID')
-                    gid = get_user_property(user, 'PrimaryGroupID')
-                    gecos = get_user_property(user, 'RealName')
-                    home_dir = get_user_property(user, 'NFSHomeDirectory')
-                    shell = get_user_property(user, 'UserShell')
-                    local_unix_users.append([user, '*', uid, gid, gecos, home_dir, shell])
-            else:
-                err = 'Failed to get list of users. ' + rval_str
-        else:
-            with open('/etc/passwd', 'rb') as passwd_file:
-                passwd_bytes = passwd_file.read()
-                passwd_str = to_text(passwd_bytes, errors='surrogate_or_strict')
-
-                local_unix_users = passwd_str.split('\n')
-                local_unix_users = [user.strip() for user in local_unix_users]
-                local_unix_users = [user for user in local_unix_users if len(user) > 0]
-                local_unix_users = [user for user in local_unix_users if user[0] != '#']
-                local_unix_users = [user.split(':') for user in local_unix_users]
-                local_unix_users = [user for user in local_unix_users if len(user) == 7]
-
-        local_unix_users = [user for user in local_unix_users if
-            (user_name == user[0] and uid_number != user[2]) or
-            (user_name != user[0] and uid_number == user[2])]
+        err, candidates = get_candidates(user_name, uid_number, candidates)
+        if err is None:
+            err, local_unix_users, conflicts_by_candidate = find_conflicts(candidates)
 
     except Exception:
         tb = traceback.format_exc()
@@ -242,6 +254,7 @@ def run_normal(params, result):
         result_facts = result.copy()
         result_facts['params'] = params
         result_facts['local_unix_user_conflicts'] = local_unix_users
+        result_facts['local_unix_user_conflicts_by_candidate'] = conflicts_by_candidate
         result['ansible_facts'] = {facts_key: result_facts}
 
     # Return
@@ -249,46 +262,84 @@ def run_normal(params, result):
 
 
 # ------------------------------------------------------------------------------
-def run_dscl(args):
+def get_candidates(user_name, uid_number, candidates):
     """
-    macOS manages users and groups by directory services instead of /etc/passwd
-    and /etc/group.
-    macOS uses the dscl command to interact with directory services.
+    Merge the user_name and uid_number parameters with the candidates
+    parameter into one list of (user name, UID) tuples.
     """
 
-    try:
-        p = subprocess.Popen('dscl ' + args, stdin = None, stdout = subprocess.PIPE,
-            stderr = subprocess.PIPE, shell = True)
-        rval_bytes, rval_err = p.communicate()
-        rval_bytes += rval_err
-    # This exception happens when the process exits with a non-zero return code
-    except subprocess.CalledProcessError as e:
-        # Just grab output bytes likes a normal exit, we'll parse it for errors anyway
-        rval_bytes = e.output
+    # Return values
+    err = None
+    pairs = []
 
-    # Popen returns list of bytes so we have to decode to get a string
-    rval_str = rval_bytes.decode(sys.stdout.encoding)
+    if user_name or uid_number:
+        candidates = [{'user_name': user_name, 'uid_number': uid_number}] + candidates
 
-    return p.returncode, rval_str
+    for candidate in candidates:
+        name = str(candidate.get('user_name', '') or '')
+        uid = str(candidate.get('uid_number', '') or '')
+        if not name or not uid:
+            err = 'Both user_name and uid_number must be specified for every candidate: ' + str(candidate)
+            break
+        pairs.append((name, uid))
+
+    if err is None and not pairs:
+        err = 'Either user_name and uid_number or candidates must be specified'
+
+    # Return
+    return err, pairs
 
 
 # ------------------------------------------------------------------------------
-def get_user_property(user, prop):
-
-    rc, rval_str = run_dscl('. -read /Users/' + enclose_shell_arg(user) + ' ' + prop)
-    if rc == 0:
-        # -read: Prints a directory. The property key is followed by colon, then a
-        # space-separated list of the values for that property. If any value contains
-        # embedded spaces, the list will instead be displayed one entry per line,
-        # starting on the line after the key.
-        lines = rval_str.splitlines()
-        if len(lines) == 1:
-            if lines[0].startswith(prop):
-                return lines[0].split(': ')[1]
-        elif len(lines) == 2:
-            return lines[1].strip()
-
-    return ''
+def find_conflicts(candidates):
+    """
+    Find the local users that conflict with the (user name, UID) candidates,
+    that is either the name or the UID matches a candidate, but not both.
+
+    /etc/passwd is read once, keeping only the users whose name or UID is in
+    any candidate, and indexed by name and by UID so each candidate is a pair
+    of hash lookups.
+
+    Returns an err value, all conflicting users in /etc/passwd order and the
+    candidates that have conflicts with their conflicting users.
+    """
+
+    # Return values
+    err = None
+    conflicting_users = []
+    conflicts_by_candidate = []
+
+    names = set(name for name, uid in candidates)
+    uids = set(uid for name, uid in candidates)
+
+    err, local_unix_users = lu.read_users(lambda user: user[0] in names or user[2] in uids)
+    if err is not None:
+        return err, conflicting_users, conflicts_by_candidate
+
+    # Index users by name and by UID, remembering their position in the file
+    users_by_name = {}
+    users_by_uid = {}
+    for index, user in enumerate(local_unix_users):
+        users_by_name.setdefault(user[0], []).append(index)
+        users_by_uid.setdefault(user[2], []).append(index)
+
+    conflicting = set()
+    for name, uid in candidates:
+        conflicts = [index for index in users_by_name.get(name, []) if local_unix_users[index][2] != uid]
+        conflicts += [index for index in users_by_uid.get(uid, []) if local_unix_users[index][0] != name]
+        if conflicts:
+            conflicts.sort()
+            conflicting.update(conflicts)
+            conflicts_by_candidate.append({
+                'user_name': name,
+                'uid_number': uid,
+                'conflicts': [local_unix_users[index] for index in conflicts]
+            })
+
+    conflicting_users = [local_unix_users[index] for index in sorted(conflicting)]
+
+    # Return
+    return err, conflicting_users, conflicts_by_candidate
 
 
 # ------------------------------------------------------------------------------
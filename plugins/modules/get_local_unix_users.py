@@ -70,6 +70,56 @@ options:
         type: str
         required: false
         default: ''
+    output:
+        description:
+            - >
+              Return all fields of each user (records) or only aggregates
+              of them computed on the host in one pass (summary)?  delta is
+              ignored with summary.
+        type: str
+        choices: ['records', 'summary']
+        required: false
+        default: 'records'
+    summary_range_size:
+        description:
+            - Number of IDs in each ID range of the summary
+        type: int
+        required: false
+        default: 1000
+    summary_top:
+        description:
+            - Number of UIDs used by several users listed in the summary
+        type: int
+        required: false
+        default: 10
+    delta:
+        description:
+            - >
+              Return only the users added, changed and removed since the
+              version in delta_baseline?  The users returned and their
+              version are stored in delta_path on the host.  Ignored in
+              check mode, all users are returned and nothing is stored.
+        type: bool
+        required: false
+        default: false
+    delta_baseline:
+        description:
+            - >
+              Version of the users the controller has, the delta_version
+              fact of an earlier run.  All users are returned when it is
+              empty or not the version stored on the host.
+        type: str
+        required: false
+        default: ''
+    delta_path:
+        description:
+            - >
+              File on the host storing the users returned last, created private
+              to the user the module runs as.  It is ignored if other users
+              could have written it.
+        type: str
+        required: false
+        default: '~/.ansible/oneidentity/get_local_unix_users_delta.json'
     facts:
         description:
             - Generate Ansible facts?
@@ -97,6 +147,11 @@ EXAMPLES = """
     home_directory: ''
     login_shell: ''
   register: get_local_unix_users_result
+
+- name: Capacity summary
+  get_local_unix_users:
+    output: summary
+  register: get_local_unix_users_result
 """
 
 RETURN = """
@@ -124,7 +179,31 @@ ansible_facts:
         local_unix_users:
             description: All fields of each user account
             type: list of lists
-            returned: always
+            returned: when output is records and delta is not returned
+        delta_version:
+            description: Version of the users, the delta_baseline of the next run
+            type: str
+            returned: when output is records and delta is true, not in check mode
+        delta:
+            description: >
+                Changes since delta_baseline, a dict with baseline, added
+                and changed (all fields of the users) and removed (names).
+                All users of a name are returned when any of them changed.
+            type: dict
+            returned: when delta is true and the users of delta_baseline are stored on the host
+        summary:
+            description: >
+                Aggregates of the users: count, uid_min, uid_max,
+                uid_invalid (non-numeric UIDs), uid_ranges (first UID,
+                last UID and number of users of each range in use),
+                duplicate_uid_count (number of UIDs used by several
+                users), duplicate_uids (UID, number of users and their
+                names, each up to summary_top, of the UIDs used most),
+                shells (number of users by login shell) and nologin
+                (number of users with a shell like /bin/false or
+                /sbin/nologin)
+            type: dict
+            returned: when output is summary
 """
 
 
@@ -133,12 +212,9 @@ ansible_facts:
 # ------------------------------------------------------------------------------
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible.module_utils.common.text.converters import to_text
-import platform
-import subprocess
-import sys
 import traceback
-from ansible_collections.oneidentity.authentication_services.plugins.module_utils.misc_utils import enclose_shell_arg
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.local_unix as lu
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.fact_delta as fd
 
 
 # ------------------------------------------------------------------------------
@@ -147,6 +223,13 @@ from ansible_collections.oneidentity.authentication_services.plugins.module_util
 
 # Arg defaults
 USER_FIELD_DEFAULT = ''
+OUTPUT_CHOICES = ['records', 'summary']
+OUTPUT_DEFAULT = 'records'
+SUMMARY_RANGE_SIZE_DEFAULT = lu.SUMMARY_RANGE_SIZE_DEFAULT
+SUMMARY_TOP_DEFAULT = lu.SUMMARY_TOP_DEFAULT
+DELTA_DEFAULT = False
+DELTA_BASELINE_DEFAULT = ''
+DELTA_PATH_DEFAULT = '~/.ansible/oneidentity/get_local_unix_users_delta.json'
 FACTS_DEFAULT = True
 FACTS_KEY_DEFAULT = 'local_unix_users'
 
@@ -193,6 +276,37 @@ def run_module():
                 'required': False,
                 'default': USER_FIELD_DEFAULT
             },
+            'output': {
+                'type': 'str',
+                'choices': OUTPUT_CHOICES,
+                'required': False,
+                'default': OUTPUT_DEFAULT
+            },
+            'summary_range_size': {
+                'type': 'int',
+                'required': False,
+                'default': SUMMARY_RANGE_SIZE_DEFAULT
+            },
+            'summary_top': {
+                'type': 'int',
+                'required': False,
+                'default': SUMMARY_TOP_DEFAULT
+            },
+            'delta': {
+                'type': 'bool',
+                'required': False,
+                'default': DELTA_DEFAULT
+            },
+            'delta_baseline': {
+                'type': 'str',
+                'required': False,
+                'default': DELTA_BASELINE_DEFAULT
+            },
+            'delta_path': {
+                'type': 'str',
+                'required': False,
+                'default': DELTA_PATH_DEFAULT
+            },
             'facts': {
                 'type': 'bool',
                 'required': False,
@@ -219,21 +333,23 @@ def run_module():
     )
 
     # Run logic
-    # NOTE: This module makes no changes so check mode doesn't need to be handled
-    #       specially
-    err, result = run_normal(module.params, result)
+    # NOTE: This module makes no changes to the host, in check mode it only
+    #       doesn't store the users returned for delta
+    err, result = run_normal(module.params, result, module.check_mode)
 
     # Exit
     module.exit_json(**result)
 
 
 # ------------------------------------------------------------------------------
-def run_normal(params, result):
+def run_normal(params, result, check_mode):
     """
     Normal mode logic.
 
     params contains input parameters.
 
+    check_mode is True in check mode, the delta state is not written then.
+
     result contains run results skeleton, will modify/add to and then return
     this value along with an err value that contains None if no error or a string
     describing the error.
@@ -242,6 +358,9 @@ def run_normal(params, result):
     # Return data
     err = None
     local_unix_users = []
+    summary = None
+    delta_version = None
+    records_delta = None
 
     # Parameters
     user_name = params['user_name']
@@ -250,47 +369,33 @@ def run_normal(params, result):
     comment = params['comment']
     home_directory = params['home_directory']
     login_shell = params['login_shell']
+    output = params['output']
+    summary_range_size = params['summary_range_size']
+    summary_top = params['summary_top']
+    delta = params['delta']
+    delta_baseline = params['delta_baseline']
+    delta_path = params['delta_path'] if params['delta_path'] else DELTA_PATH_DEFAULT
     facts = params['facts']
     facts_key = params['facts_key'] if params['facts_key'] else FACTS_KEY_DEFAULT
 
     try:
-        if platform.system() == 'Darwin':
-            rc, rval_str = run_dscl('. -list /Users')
-            if rc == 0:
-                list_of_users = rval_str.splitlines()
-                for user in list_of_users:
-                    uid = get_user_property(user, 'UniqueID')
-                    gid = get_user_property(user, 'PrimaryGroupID')
-                    gecos = get_user_property(user, 'RealName')
-                    home_dir = get_user_property(user, 'NFSHomeDirectory')
-                    shell = get_user_property(user, 'UserShell')
-                    local_unix_users.append([user, '*', uid, gid, gecos, home_dir, shell])
-            else:
-                err = 'Failed to get list of users. ' + rval_str
+        match = lu.field_matcher(
+            equals={2: uid_number, 3: gid_number},
+            contains={0: user_name, 4: comment, 5: home_directory, 6: login_shell}
+        )
+
+        # Aggregate the users while reading them
+        if output == 'summary' and (summary_range_size < 1 or summary_top < 0):
+            err = 'summary_range_size must be greater than 0 and summary_top must not be negative'
+        elif output == 'summary':
+            err, users = lu.iter_users(match)
+            summary = lu.summarize_users(users, summary_range_size, summary_top)
         else:
-            with open('/etc/passwd', 'rb') as passwd_file:
-                passwd_bytes = passwd_file.read()
-                passwd_str = to_text(passwd_bytes, errors='surrogate_or_strict')
-
-                local_unix_users = passwd_str.split('\n')
-                local_unix_users = [user.strip() for user in local_unix_users]
-                local_unix_users = [user for user in local_unix_users if len(user) > 0]
-                local_unix_users = [user for user in local_unix_users if user[0] != '#']
-                local_unix_users = [user.split(':') for user in local_unix_users]
-                local_unix_users = [user for user in local_unix_users if len(user) == 7]
-
-        if user_name:
-            local_unix_users = [user for user in local_unix_users if user_name in user[0]]
-        if uid_number:
-            local_unix_users = [user for user in local_unix_users if uid_number == user[2]]
-        if gid_number:
-            local_unix_users = [user for user in local_unix_users if gid_number == user[3]]
-        if comment:
-            local_unix_users = [user for user in local_unix_users if comment in user[4]]
-        if home_directory:
-            local_unix_users = [user for user in local_unix_users if home_directory in user[5]]
-        if login_shell:
-            local_unix_users = [user for user in local_unix_users if login_shell in user[6]]
+            err, local_unix_users = lu.read_users(match)
+
+        # Changes since the version the controller has
+        if delta and facts and err is None and summary is None and not check_mode:
+            delta_version, records_delta = fd.delta_since(delta_path, delta_baseline, local_unix_users)
 
     except Exception:
         tb = traceback.format_exc()
@@ -305,56 +410,20 @@ def run_normal(params, result):
     if facts:
         result_facts = result.copy()
         result_facts['params'] = params
-        result_facts['local_unix_users'] = local_unix_users
+        if delta_version is not None:
+            result_facts['delta_version'] = delta_version
+        if summary is not None:
+            result_facts['summary'] = summary
+        elif records_delta is not None:
+            result_facts['delta'] = records_delta
+        else:
+            result_facts['local_unix_users'] = local_unix_users
         result['ansible_facts'] = {facts_key: result_facts}
 
     # Return
     return err, result
 
 
-# ------------------------------------------------------------------------------
-def run_dscl(args):
-    """
-    macOS manages users and groups by directory services instead of /etc/passwd
-    and /etc/group.
-    macOS uses the dscl command to interact with directory services.
-    """
-
-    try:
-        p = subprocess.Popen('dscl ' + args, stdin = None, stdout = subprocess.PIPE,
-            stderr = subprocess.PIPE, shell = True)
-        rval_bytes, rval_err = p.communicate()
-        rval_bytes += rval_err
-    # This exception happens when the process exits with a non-zero return code
-    except subprocess.CalledProcessError as e:
-        # Just grab output bytes likes a normal exit, we'll parse it for errors anyway
-        rval_bytes = e.output
-
-    # Popen returns list of bytes so we have to decode to get a string
-    rval_str = rval_bytes.decode(sys.stdout.encoding)
-
-    return p.returncode, rval_str
-
-
-# ------------------------------------------------------------------------------
-def get_user_property(user, prop):
-
-    rc, rval_str = run_dscl('. -read /Users/' + enclose_shell_arg(user) + ' ' + prop)
-    if rc == 0:
-        # -read: Prints a directory. The property key is followed by colon, then a
-        # space-separated list of the values for that property. If any value contains
-        # embedded spaces, the list will instead be displayed one entry per line,
-        # starting on the line after the key.
-        lines = rval_str.splitlines()
-        if len(lines) == 1:
-            if lines[0].startswith(prop):
-                return lines[0].split(': ')[1]
-        elif len(lines) == 2:
-            return lines[1].strip()
-
-    return ''
-
-
 # ------------------------------------------------------------------------------
 def main():
     """
@@ -31,7 +31,11 @@ version_added: '2.9'
 
 description: >
     Returns users that are allowed access to the Unix host using the
-    vastool list users-allowed command.
+    vastool list users-allowed command.  With vasd_cache set and a known schema
+    version and table layout of the vasd identity cache database the users
+    are read from the database instead.  With user_name or user_names only the requested users
+    are looked up in the database or split into records from the vastool
+    output.
 
 options:
     user_name:
@@ -40,6 +44,52 @@ options:
         type: str
         required: false
         default: ''
+    user_names:
+        description:
+            - Return only the specified users, combined with user_name
+        type: list
+        elements: str
+        required: false
+        default: []
+    vasd_cache:
+        description:
+            - >
+              Read the users from the vasd identity cache database
+              (/var/opt/quest/vas/vasd/vas_ident.vdb) instead of running
+              vastool when its schema version and tables are known?  The
+              tables and columns are checked, but the database layout
+              is not documented by vasd, check that it matches the layout
+              in plugins/module_utils/vasd_cache.py before enabling it.
+        type: bool
+        required: false
+        default: false
+    delta:
+        description:
+            - >
+              Return only the users added, changed and removed since the
+              version in delta_baseline?  The users returned and their
+              version are stored in delta_path on the host.
+        type: bool
+        required: false
+        default: false
+    delta_baseline:
+        description:
+            - >
+              Version of the users the controller has, the delta_version
+              fact of an earlier run.  All users are returned when it is
+              empty or not the version stored on the host.
+        type: str
+        required: false
+        default: ''
+    delta_path:
+        description:
+            - >
+              File on the host storing the users returned last, created private
+              to the user the module runs as.  It is ignored if other users
+              could have written it.
+        type: str
+        required: false
+        default: '~/.ansible/oneidentity/get_logon_policy_for_unix_host_delta.json'
     facts:
         description:
             - Generate Ansible facts?
@@ -63,6 +113,14 @@ EXAMPLES = """
     facts: true
     facts_key: get_logon_policy_for_unix_host_facts_key
   register: get_logon_policy_for_unix_host_result
+
+- name: Check a few users
+  get_logon_policy_for_unix_host:
+    user_names:
+      - user1@example.com
+      - user2@example.com
+    facts: false
+  register: get_logon_policy_for_unix_host_result
 """
 
 RETURN = """
@@ -94,7 +152,18 @@ ansible_facts:
         users_allowed:
             description: All fields of each user account
             type: list of lists
-            returned: always
+            returned: unless delta is returned
+        delta_version:
+            description: Version of the users, the delta_baseline of the next run
+            type: str
+            returned: when delta is true
+        delta:
+            description: >
+                Changes since delta_baseline, a dict with baseline, added
+                and changed (all fields of the users) and removed (names).
+                All users of a name are returned when any of them changed.
+            type: dict
+            returned: when delta is true and the users of delta_baseline are stored on the host
 """
 
 
@@ -104,11 +173,10 @@ ansible_facts:
 
 
 from ansible.module_utils.basic import AnsibleModule
-import sys
-import subprocess
 import traceback
 import ansible_collections.oneidentity.authentication_services.plugins.module_utils.vastool as vt
 import ansible_collections.oneidentity.authentication_services.plugins.module_utils.check_file_exec as cfe
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.fact_delta as fd
 
 
 # ------------------------------------------------------------------------------
@@ -117,6 +185,11 @@ import ansible_collections.oneidentity.authentication_services.plugins.module_ut
 
 # Arg choices and defaults
 USER_NAME_DEFAULT = ''
+USER_NAMES_DEFAULT = []
+VASD_CACHE_DEFAULT = False
+DELTA_DEFAULT = False
+DELTA_BASELINE_DEFAULT = ''
+DELTA_PATH_DEFAULT = '~/.ansible/oneidentity/get_logon_policy_for_unix_host_delta.json'
 FACTS_DEFAULT = True
 FACTS_VERBOSE_DEFAULT = True
 FACTS_KEY_DEFAULT = 'get_logon_policy_for_unix_host_facts_key'
@@ -139,6 +212,32 @@ def run_module():
                 'required': False,
                 'default': USER_NAME_DEFAULT
             },
+            'user_names': {
+                'type': 'list',
+                'elements': 'str',
+                'required': False,
+                'default': USER_NAMES_DEFAULT
+            },
+            'vasd_cache': {
+                'type': 'bool',
+                'required': False,
+                'default': VASD_CACHE_DEFAULT
+            },
+            'delta': {
+                'type': 'bool',
+                'required': False,
+                'default': DELTA_DEFAULT
+            },
+            'delta_baseline': {
+                'type': 'str',
+                'required': False,
+                'default': DELTA_BASELINE_DEFAULT
+            },
+            'delta_path': {
+                'type': 'str',
+                'required': False,
+                'default': DELTA_PATH_DEFAULT
+            },
             'facts': {
                 'type': 'bool',
                 'required': False,
@@ -188,9 +287,16 @@ def run_normal(params, result):
     err = None
     version = ''
     users_allowed = []
+    delta_version = None
+    records_delta = None
 
     # Parameters
     user_name = params['user_name'] if params['user_name'] else USER_NAME_DEFAULT
+    user_names = [name for name in [user_name] + (params['user_names'] or []) if name]
+    vasd_cache = params['vasd_cache']
+    delta = params['delta']
+    delta_baseline = params['delta_baseline']
+    delta_path = params['delta_path'] if params['delta_path'] else DELTA_PATH_DEFAULT
     facts = params['facts']
     facts_key = params['facts_key'] if params['facts_key'] else FACTS_KEY_DEFAULT
 
@@ -201,10 +307,11 @@ def run_normal(params, result):
 
         # Run vastool
         if err is None:
-            err, users_allowed = run_vastool_list_users_allowed()
+            err, users_allowed = vt.vastool_list_users_allowed(user_names, vasd_cache)
 
-        if user_name:
-            users_allowed = [user for user in users_allowed if user[0] == user_name]
+        # Changes since the version the controller has
+        if delta and facts and err is None:
+            delta_version, records_delta = fd.delta_since(delta_path, delta_baseline, users_allowed)
 
     except Exception:
         tb = traceback.format_exc()
@@ -220,71 +327,18 @@ def run_normal(params, result):
         result_facts = result.copy()
         result_facts['params'] = params
         result_facts['version'] = version
-        result_facts['users_allowed'] = users_allowed
+        if delta_version is not None:
+            result_facts['delta_version'] = delta_version
+        if records_delta is not None:
+            result_facts['delta'] = records_delta
+        else:
+            result_facts['users_allowed'] = users_allowed
         result['ansible_facts'] = {facts_key: result_facts}
 
     # Return
     return err, result
 
 
-# ------------------------------------------------------------------------------
-def run_vastool_list_users_allowed():
-    """
-    Run vastool list users-allowed
-    """
-
-    # Return values
-    err = None
-    users_allowed = []
-    non_zero_ret_code = False
-
-    # Build vastool command
-    cmd = []
-    cmd += [vt.VASTOOL_PATH]
-    cmd += ['list']
-    cmd += ['users-allowed']
-
-    # Call vastool
-    try:
-        p = subprocess.Popen(' '.join(cmd), stdin=None, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=True)
-        rval_bytes, rval_err = p.communicate()
-        rval_bytes += rval_err
-    # This exception happens when the process exits with a non-zero return code
-    except subprocess.CalledProcessError as e:
-        # Just grab output bytes likes a normal exit, we'll parse it for errors anyway
-        rval_bytes = e.output
-    if p.returncode > 0:
-        non_zero_ret_code = True
-    # Popen returns list of bytes so we have to decode to get a string
-    rval_str = rval_bytes.decode(sys.stdout.encoding)
-
-    # Parse vastool return
-    err, users_allowed = parse_vastool_stdout(non_zero_ret_code, rval_str)
-
-    # Return
-    return err, users_allowed
-
-
-# ------------------------------------------------------------------------------
-def parse_vastool_stdout(non_zero_ret_code, stdout_str):
-
-    # Return values
-    err = None
-    users_allowed = []
-
-    if non_zero_ret_code:
-        err = stdout_str
-    else:
-        users_allowed = stdout_str.split('\n')
-        users_allowed = [user.strip() for user in users_allowed]
-        users_allowed = [user for user in users_allowed if len(user) > 0]
-        users_allowed = [user.split(':') for user in users_allowed]
-        users_allowed = [user for user in users_allowed if len(user) == 7]
-
-    # Return
-    return err, users_allowed
-
-
 # ------------------------------------------------------------------------------
 def main():
     """
@@ -0,0 +1,517 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: line_file.py
+# Desc: Ansible module for client_config role that applies all line settings of
+#       a line based configuration file in one pass.
+# Auth: Laszlo Nagy
+# Note: Edits lines the same way as the Ansible lineinfile module so results do
+#       not change when switching from a loop of lineinfile tasks.
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Required Ansible documentation
+# ------------------------------------------------------------------------------
+
+ANSIBLE_METADATA = {
+    'metadata_version': '0.2',
+    'status': ['preview'],
+    'supported_by': 'community'
+}
+
+DOCUMENTATION = """
+---
+module: line_file
+
+short_description: Applies a list of line settings to a line based file in one pass
+
+version_added: '2.9'
+
+description: >
+    Reads a line based file like users.allow or user-override once, applies
+    every line, regex, insertafter, insertbefore and state item in memory the
+    same way the lineinfile module would, and writes the file atomically only
+    if its content changed.  Items with only line and state are looked up in a
+    hashed index of the file lines instead of scanning the file, so large line
+    sets are applied in linear time.  Returns the result of every item like a
+    loop of lineinfile tasks does.
+
+options:
+    path:
+        description:
+            - File path
+        type: path
+        required: true
+    items:
+        description:
+            - >
+              Lines to set or clear in order, each a dict with line (default
+              empty string), regex, insertafter, insertbefore and state
+              (present or absent, required).  insertafter and insertbefore
+              also accept EOF and BOF.
+        type: list
+        elements: dict
+        required: true
+    create:
+        description:
+            - Create the file if it does not exist?
+        type: bool
+        required: false
+        default: true
+    backup:
+        description:
+            - Create a backup file when the file is changed?
+        type: bool
+        required: false
+        default: false
+    digest:
+        description:
+            - >
+              Store a digest of the desired state (items, create and file
+              attributes) and of the resulting file next to the file, and
+              skip applying the items while both still match?
+        type: bool
+        required: false
+        default: false
+
+extends_documentation_fragment:
+    - files
+
+author:
+    - Laszlo Nagy (laszlo.nagy@oneidentity.com)
+"""
+
+EXAMPLES = """
+- name: Normal usage
+  line_file:
+    path: /etc/opt/quest/vas/users.allow
+    items:
+      - line: 'unix_admins@example.com'
+        state: present
+      - regex: '^old_group@'
+        state: absent
+  register: file_result
+"""
+
+RETURN = """
+results:
+    description: >
+        Result of each item with changed, failed, msg and item keys, the shape
+        of the results of a loop of lineinfile tasks
+    type: list
+    returned: always
+backup_file:
+    description: Backup file name
+    type: str
+    returned: when backup is true and the file was changed
+digest_match:
+    description: Was the file skipped because it is in the desired state?
+    type: bool
+    returned: always
+"""
+
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.common.text.converters import to_text
+import traceback
+import os
+import re
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.config_file as cf
+
+
+# ------------------------------------------------------------------------------
+# Constants
+# ------------------------------------------------------------------------------
+
+# Arg choices and defaults
+CREATE_DEFAULT = True
+BACKUP_DEFAULT = False
+DIGEST_DEFAULT = False
+STATE_CHOICES = ['present', 'absent']
+
+# Line separator of added lines
+LINESEP = '\n'
+
+
+# ------------------------------------------------------------------------------
+# Functions
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def run_module():
+    """
+    Main Ansible module function
+    """
+
+    # Module argument info
+    module_args = {
+            'path': {
+                'type': 'path',
+                'required': True
+            },
+            'items': {
+                'type': 'list',
+                'elements': 'dict',
+                'required': True
+            },
+            'create': {
+                'type': 'bool',
+                'required': False,
+                'default': CREATE_DEFAULT
+            },
+            'backup': {
+                'type': 'bool',
+                'required': False,
+                'default': BACKUP_DEFAULT
+            },
+            'digest': {
+                'type': 'bool',
+                'required': False,
+                'default': DIGEST_DEFAULT
+            }
+        }
+
+    # Seed result value
+    result = {
+            'changed': False,
+            'failed': False,
+            'msg': '',
+            'results': [],
+            'digest_match': False
+        }
+
+    # Lean on boilerplate code in AnsibleModule class
+    module = AnsibleModule(
+        argument_spec=module_args,
+        add_file_common_args=True,
+        supports_check_mode=True
+    )
+
+    # Run logic
+    err, result = run_normal(module, result)
+
+    # Exit
+    module.exit_json(**result)
+
+
+# ------------------------------------------------------------------------------
+def run_normal(module, result):
+    """
+    Normal mode logic, in check mode the file is not written.
+
+    module is the AnsibleModule, used for atomic writes, backups and file
+    attributes.
+
+    result contains run results skeleton, will modify/add to and then return
+    this value along with an err value that contains None if no error or a string
+    describing the error.
+    """
+
+    # Return data
+    err = None
+    changed = False
+    results = []
+    digest_match = False
+
+    # Parameters
+    path = module.params['path']
+    items = module.params['items']
+    create = module.params['create']
+    backup = module.params['backup']
+    digest = module.params['digest']
+    desired = cf.desired_digest(
+        'line_file', items, create, module.params['mode'], module.params['owner'], module.params['group'])
+
+    try:
+
+        # Skip the file if it has not changed since the same items were applied
+        if digest and cf.digest_current(path, desired):
+            digest_match = True
+            results = [{'changed': False, 'failed': False, 'msg': cf.DIGEST_MATCH_MSG, 'item': item} for item in items]
+
+        # Read file once
+        else:
+            err, content = cf.read_file(path, create)
+
+        if err is None and not digest_match:
+
+            # Apply all items in memory
+            lines = {'lines': content.splitlines(True), 'index': None}
+            for item in items:
+                item_err, item_changed, item_msg = apply_item(lines, item)
+                results.append({
+                    'changed': item_changed,
+                    'failed': item_err is not None,
+                    'msg': item_err if item_err is not None else item_msg,
+                    'item': item
+                })
+            new_content = ''.join(compact_lines(lines))
+
+            # Write only if the content hash changed
+            if cf.sha256(new_content) != cf.sha256(content) or not os.path.exists(path):
+                changed = True
+                if module._diff:
+                    result['diff'] = {
+                        'before_header': path,
+                        'before': content,
+                        'after_header': path,
+                        'after': new_content
+                    }
+                if not module.check_mode:
+                    if backup and os.path.exists(path):
+                        result['backup_file'] = module.backup_local(path)
+                    cf.write_file(module, path, new_content)
+
+            # File attributes
+            if os.path.exists(path) and not module.check_mode:
+                file_args = module.load_file_common_arguments(module.params)
+                changed = module.set_fs_attributes_if_different(file_args, changed)
+
+            # Store the digest only when every item was applied
+            if digest and not module.check_mode:
+                if any(r['failed'] for r in results):
+                    cf.remove_digest(path)
+                else:
+                    cf.write_digest(path, desired)
+
+    except Exception:
+        tb = traceback.format_exc()
+        err = str(tb)
+
+    # Whole file errors fail every item like they would fail every lineinfile task
+    if err is not None:
+        results = [{'changed': False, 'failed': True, 'msg': err, 'item': item} for item in items]
+
+    # Build result
+    item_failed = [r['msg'] for r in results if r['failed']]
+    result['changed'] = changed
+    result['failed'] = err is not None or bool(item_failed)
+    result['msg'] = err if err is not None else '\n'.join(item_failed)
+    result['results'] = results
+    result['digest_match'] = digest_match
+
+    # Return
+    return err, result
+
+
+# ------------------------------------------------------------------------------
+def index_positions(lines, text):
+    """
+    Positions of the lines matching text exactly (without line separator),
+    builds the hashed index of lines if needed.
+
+    lines is a dict with the file lines (removed lines are None until the lines
+    are compacted so removals do not shift indexed positions) and the index.
+    """
+
+    if lines['index'] is None:
+        lines['index'] = {}
+        for lineno, cur_line in enumerate(lines['lines']):
+            if cur_line is not None:
+                lines['index'].setdefault(cur_line.rstrip('\r\n'), []).append(lineno)
+
+    return lines['index'].get(text, [])
+
+
+# ------------------------------------------------------------------------------
+def compact_lines(lines):
+    """
+    Drop removed lines and the index, returns the file lines
+    """
+
+    if any(cur_line is None for cur_line in lines['lines']):
+        lines['lines'] = [cur_line for cur_line in lines['lines'] if cur_line is not None]
+        lines['index'] = None
+
+    return lines['lines']
+
+
+# ------------------------------------------------------------------------------
+def index_present(lines, text):
+    """
+    lineinfile present logic for a line without regex, insertafter or
+    insertbefore using the index
+    """
+
+    positions = index_positions(lines, text)
+    file_lines = lines['lines']
+
+    # Last matching line is replaced when its line separator differs
+    if positions:
+        if file_lines[positions[-1]] != text + LINESEP:
+            file_lines[positions[-1]] = text + LINESEP
+            return True, 'line replaced'
+        return False, ''
+
+    # Ensure the last line ends with a line separator before adding
+    for lineno in range(len(file_lines) - 1, -1, -1):
+        if file_lines[lineno] is not None:
+            if file_lines[lineno][-1:] not in ('\n', '\r'):
+                file_lines[lineno] += LINESEP
+            break
+
+    lines['index'].setdefault(text, []).append(len(file_lines))
+    file_lines.append(text + LINESEP)
+    return True, 'line added'
+
+
+# ------------------------------------------------------------------------------
+def index_absent(lines, text):
+    """
+    lineinfile absent logic for a line without regex using the index
+    """
+
+    positions = index_positions(lines, text)
+    for lineno in positions:
+        lines['lines'][lineno] = None
+    lines['index'].pop(text, None)
+
+    return bool(positions), '%s line(s) removed' % len(positions)
+
+
+# ------------------------------------------------------------------------------
+def apply_item(lines, item):
+    """
+    Apply one line/regex/insertafter/insertbefore/state item to lines in place,
+    returns err, changed and msg like the lineinfile module.
+    """
+
+    line = item.get('line')
+    line = '' if line is None else to_text(line)
+    regex = item.get('regex', item.get('regexp'))
+    insertafter = item.get('insertafter')
+    insertbefore = item.get('insertbefore')
+    state = item.get('state')
+
+    if state not in STATE_CHOICES:
+        return 'state must be one of: ' + ', '.join(STATE_CHOICES) + ', got: ' + str(state), False, ''
+    if insertafter and insertbefore:
+        return 'parameters are mutually exclusive: insertafter|insertbefore', False, ''
+
+    try:
+        regex_re = re.compile(regex) if regex is not None else None
+        if insertafter not in (None, 'BOF', 'EOF'):
+            insert_re = re.compile(insertafter)
+        elif insertbefore not in (None, 'BOF'):
+            insert_re = re.compile(insertbefore)
+        else:
+            insert_re = None
+    except re.error as e:
+        return 'Invalid regular expression: ' + str(e), False, ''
+
+    # Exact lines are looked up in the index
+    if regex_re is None and state == 'absent':
+        changed, msg = index_absent(lines, line)
+        return None, changed, msg
+    if regex_re is None and not insertafter and not insertbefore:
+        changed, msg = index_present(lines, line)
+        return None, changed, msg
+
+    # Everything else scans the lines
+    file_lines = compact_lines(lines)
+    if state == 'absent':
+        changed, msg = scan_absent(file_lines, regex_re, line)
+    else:
+        changed, msg = scan_present(file_lines, regex_re, insert_re, line, insertafter, insertbefore)
+    lines['index'] = None
+
+    return None, changed, msg
+
+
+# ------------------------------------------------------------------------------
+def scan_present(file_lines, regex_re, insert_re, line, insertafter, insertbefore):
+    """
+    lineinfile present logic, edits file_lines in place
+    """
+
+    # Last matching line and the position after/before the last insert match
+    index = [-1, -1]
+    for lineno, cur_line in enumerate(file_lines):
+        if regex_re is not None:
+            match_found = regex_re.search(cur_line)
+        else:
+            match_found = line == cur_line.rstrip('\r\n')
+        if match_found:
+            index[0] = lineno
+        elif insert_re is not None and insert_re.search(cur_line):
+            if insertafter:
+                index[1] = lineno + 1
+            if insertbefore:
+                index[1] = lineno
+
+    new_line = line + LINESEP
+
+    # Matched a line in the file
+    if index[0] != -1:
+        if file_lines[index[0]] != new_line:
+            file_lines[index[0]] = new_line
+            return True, 'line replaced'
+        return False, ''
+
+    # Add it to the beginning of the file
+    if insertbefore == 'BOF' or insertafter == 'BOF':
+        file_lines.insert(0, new_line)
+        return True, 'line added'
+
+    # Add it to the end of the file if requested or if insertafter and
+    # insertbefore didn't match anything
+    if insertafter == 'EOF' or index[1] == -1:
+        if file_lines and file_lines[-1][-1:] not in ('\n', '\r'):
+            file_lines[-1] += LINESEP
+        file_lines.append(new_line)
+        return True, 'line added'
+
+    # Don't insert the line if it already follows the insertafter match
+    if insertafter:
+        if index[1] == len(file_lines):
+            if file_lines[index[1] - 1].rstrip('\r\n') == line:
+                return False, ''
+        elif file_lines[index[1]].rstrip('\r\n') == line:
+            return False, ''
+
+    file_lines.insert(index[1], new_line)
+    return True, 'line added'
+
+
+# ------------------------------------------------------------------------------
+def scan_absent(file_lines, regex_re, line):
+    """
+    lineinfile absent logic, edits file_lines in place
+    """
+
+    kept = []
+    removed = 0
+    for cur_line in file_lines:
+        if regex_re is not None:
+            match_found = regex_re.search(cur_line)
+        else:
+            match_found = line == cur_line.rstrip('\r\n')
+        if match_found:
+            removed += 1
+        else:
+            kept.append(cur_line)
+    file_lines[:] = kept
+
+    return removed > 0, '%s line(s) removed' % removed
+
+
+# ------------------------------------------------------------------------------
+def main():
+    """
+    Main
+    """
+
+    run_module()
+
+
+# When run from command line
+# ------------------------------------------------------------------------------
+if __name__ == '__main__':
+    main()
@@ -74,6 +74,12 @@ options:
         type: str
         required: false
         default: ''
+    run_timeout:
+        description:
+            - Number of seconds preflight may run before it is killed, 0 waits forever
+        type: int
+        required: false
+        default: 600
     facts:
         description:
             - Generate Ansible facts?
@@ -138,6 +144,10 @@ ansible_facts:
             description: Version of preflight
             type: str
             returned: always
+        run_time:
+            description: Number of seconds preflight ran
+            type: float
+            returned: always
         steps:
             description: The preflight checks and results of those checks
             type: list of dicts
@@ -150,11 +160,10 @@ ansible_facts:
 # ------------------------------------------------------------------------------
 
 from ansible.module_utils.basic import AnsibleModule
-import sys
 import traceback
-import subprocess
+import shlex
 import ansible_collections.oneidentity.authentication_services.plugins.module_utils.check_file_exec as cfe
-from ansible_collections.oneidentity.authentication_services.plugins.module_utils.misc_utils import enclose_shell_arg
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.exec_cmd as ec
 
 
 # ------------------------------------------------------------------------------
@@ -166,6 +175,7 @@ SERVERS_DEFAULT = []
 TIMEOUT_DEFAULT = 5
 TIMESYNC_DEFAULT = False
 EXTRA_ARGS_DEFAULT = ''
+RUN_TIMEOUT_DEFAULT = 600
 PATH_DEFAULT = '/opt/quest/bin/preflight'
 FACTS_DEFAULT = True
 FACTS_VERBOSE_DEFAULT = True
@@ -218,6 +228,11 @@ def run_module():
                 'required': False,
                 'default': EXTRA_ARGS_DEFAULT
             },
+            'run_timeout': {
+                'type': 'int',
+                'required': False,
+                'default': RUN_TIMEOUT_DEFAULT
+            },
             'facts': {
                 'type': 'bool',
                 'required': False,
@@ -278,6 +293,7 @@ def run_normal(params, result):
     err = None
     version = ''
     steps = []
+    run_time = 0.0
 
     # Parameters
     domain = params['domain']
@@ -287,6 +303,7 @@ def run_normal(params, result):
     timeout = params['timeout']
     timesync = params['timesync']
     extra_args = params['extra_args']
+    run_timeout = params['run_timeout']
     facts = params['facts']
     facts_verbose = params['facts_verbose']
     facts_key = params['facts_key'] if params['facts_key'] else FACTS_KEY_DEFAULT
@@ -299,7 +316,7 @@ def run_normal(params, result):
 
         # Run preflight
         if err is None:
-            err, steps = run_preflight(
+            err, steps, run_time = run_preflight(
                 domain,
                 username,
                 password,
@@ -307,7 +324,8 @@ def run_normal(params, result):
                 timeout,
                 timesync,
                 extra_args,
-                path)
+                path,
+                run_timeout)
 
     except Exception:
         tb = traceback.format_exc()
@@ -323,6 +341,7 @@ def run_normal(params, result):
         result_facts = result.copy()
         result_facts['params'] = params
         result_facts['version'] = version
+        result_facts['run_time'] = run_time
         if facts_verbose:
             result_facts['steps'] = steps
         result['ansible_facts'] = {facts_key: result_facts}
@@ -340,13 +359,14 @@ def run_preflight(
         timeout,
         timesync,
         extra_args,
-        path):
+        path,
+        run_timeout):
     """
-    Run preflight
+    Run preflight, also returns the number of seconds it ran
     """
 
     if not password:
-        return 'Error: password is empty string!', []
+        return 'Error: password is empty string!', [], 0.0
 
     # Return values
     err = None
@@ -355,32 +375,25 @@ def run_preflight(
     # Build preflight command
     cmd = []
     cmd += [path]
-    cmd += ['-u ' + enclose_shell_arg(username)]
-    cmd += ['-w ' + enclose_shell_arg(password)]
+    cmd += ['-u', username]
+    cmd += ['-w', password]
     cmd += ['--csv']
-    cmd += ['-t ' + str(timeout)]
+    cmd += ['-t', str(timeout)]
     cmd += ['-S'] if timesync else []
-    cmd += [extra_args] if extra_args else []
+    cmd += shlex.split(extra_args) if extra_args else []
     cmd += [domain]
     cmd += servers if servers else []
 
     # Call preflight
-    try:
-        p = subprocess.Popen(' '.join(cmd), stdin=None, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=True)
-        rval_bytes, rval_err = p.communicate()
-        rval_bytes += rval_err
-    # This exception happens when the process exits with a non-zero return code
-    except subprocess.CalledProcessError as e:
-        # Just grab output bytes likes a normal exit, we'll parse it for errors anyway
-        rval_bytes = e.output
-    # Popen returns list of bytes so we have to decode to get a string
-    rval_str = rval_bytes.decode(sys.stdout.encoding)
-
-    # Parse preflight return
+    rc, rval_str, run_time = ec.exec_cmd(cmd, run_timeout)
+
+    # Parse preflight return, the checks of a killed preflight are incomplete
     err, steps = parse_preflight_steps(rval_str)
+    if rc == ec.TIMEOUT_RC and err is None:
+        err = rval_str.strip()
 
     # Return
-    return err, steps
+    return err, steps, run_time
 
 
 # ------------------------------------------------------------------------------
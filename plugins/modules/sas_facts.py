@@ -0,0 +1,369 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: sas_facts.py
+# Desc: Ansible module that gathers only the host facts used by the roles and
+#       their reports.
+# Auth: Laszlo Nagy
+# Note:
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Required Ansible documentation
+# ------------------------------------------------------------------------------
+
+ANSIBLE_METADATA = {
+    'metadata_version': '0.2',
+    'status': ['preview'],
+    'supported_by': 'community'
+}
+
+DOCUMENTATION = """
+---
+module: sas_facts
+
+short_description: Gathers the host facts used by the Authentication Services roles
+
+version_added: '2.9'
+
+description: >
+    Lightweight replacement of the setup module for the roles of this
+    collection.  Gathers only system, architecture, os_family, distribution,
+    distribution_version, distribution_major_version, distribution_release,
+    default_ipv4.address and date_time.date/time into ansible_facts.
+    The facts except date_time can be cached in a file on the host and reused
+    until the cache is older than cache_ttl seconds.  The cache file is created
+    private to the user the module runs as and ignored if other users could
+    have written it.
+
+options:
+    cache:
+        description:
+            - Reuse facts cached on the host?
+        type: bool
+        required: false
+        default: false
+    cache_path:
+        description:
+            - Facts cache file on the host
+        type: str
+        required: false
+        default: '~/.ansible/oneidentity/sas_facts.json'
+    cache_ttl:
+        description:
+            - Number of seconds cached facts are reused
+        type: int
+        required: false
+        default: 86400
+
+author:
+    - Laszlo Nagy (laszlo.nagy@oneidentity.com)
+"""
+
+EXAMPLES = """
+- name: Normal usage
+  sas_facts:
+
+- name: Reuse facts cached on the host for an hour
+  sas_facts:
+    cache: true
+    cache_ttl: 3600
+"""
+
+RETURN = """
+cached:
+    description: Were the facts read from the cache?
+    type: bool
+    returned: always
+ansible_facts:
+    description: Gathered facts
+    type: dict
+    returned: always
+    keys:
+        system:
+            description: System (Linux, SunOS, AIX, etc.)
+            type: str
+        architecture:
+            description: Architecture (x86_64, i386, chrp, etc.)
+            type: str
+        os_family:
+            description: OS family (RedHat, Debian, etc.)
+            type: str
+        distribution:
+            description: Distribution
+            type: str
+        distribution_version:
+            description: Distribution version
+            type: str
+        default_ipv4:
+            description: Address of the interface of the default IPv4 route
+            type: dict
+        date_time:
+            description: Local date and time
+            type: dict
+"""
+
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.facts.system.distribution import DistributionFactCollector
+import traceback
+import os
+import platform
+import re
+import socket
+import time
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.exec_cmd as ec
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.private_file as pf
+
+
+# ------------------------------------------------------------------------------
+# Constants
+# ------------------------------------------------------------------------------
+
+# Arg choices and defaults
+CACHE_DEFAULT = False
+CACHE_PATH_DEFAULT = '~/.ansible/oneidentity/sas_facts.json'
+CACHE_TTL_DEFAULT = 86400
+
+# Cached facts
+CACHE_KEYS = [
+    'system',
+    'architecture',
+    'os_family',
+    'distribution',
+    'distribution_version',
+    'distribution_major_version',
+    'distribution_release',
+    'default_ipv4'
+]
+
+# Public address whose route is the default route, the same one the setup
+# module probes (ip route get 8.8.8.8), no packets are sent to it
+ROUTE_PROBE_ADDRESS = '8.8.8.8'
+
+# Number of seconds architecture commands may run
+ARCH_TIMEOUT = 30
+
+
+# ------------------------------------------------------------------------------
+# Functions
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def run_module():
+    """
+    Main Ansible module function
+    """
+
+    # Module argument info
+    module_args = {
+            'cache': {
+                'type': 'bool',
+                'required': False,
+                'default': CACHE_DEFAULT
+            },
+            'cache_path': {
+                'type': 'str',
+                'required': False,
+                'default': CACHE_PATH_DEFAULT
+            },
+            'cache_ttl': {
+                'type': 'int',
+                'required': False,
+                'default': CACHE_TTL_DEFAULT
+            }
+        }
+
+    # Seed result value
+    result = {
+            'changed': False,
+            'failed': False,
+            'msg': '',
+            'cached': False,
+            'ansible_facts': {}
+        }
+
+    # Lean on boilerplate code in AnsibleModule class
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=True
+    )
+
+    # Run logic
+    # NOTE: Writing the cache is not a change to the host so check mode doesn't
+    #       need to be handled specially
+    err, result = run_normal(module, result)
+
+    # Exit
+    module.exit_json(**result)
+
+
+# ------------------------------------------------------------------------------
+def run_normal(module, result):
+    """
+    Normal mode logic.
+
+    module is the AnsibleModule, the distribution fact collector needs it.
+
+    result contains run results skeleton, will modify/add to and then return
+    this value along with an err value that contains None if no error or a string
+    describing the error.
+    """
+
+    # Return data
+    err = None
+    facts = {}
+    cached = False
+
+    # Parameters
+    cache = module.params['cache']
+    cache_path = module.params['cache_path']
+    cache_ttl = module.params['cache_ttl']
+
+    try:
+
+        if cache:
+            facts = read_cache(cache_path, cache_ttl)
+            cached = facts is not None
+
+        if not cached:
+            facts = gather_facts(module)
+            if cache:
+                write_cache(cache_path, facts)
+
+        facts['date_time'] = {
+            'date': time.strftime('%Y-%m-%d'),
+            'time': time.strftime('%H:%M:%S')
+        }
+
+    except Exception:
+        tb = traceback.format_exc()
+        err = str(tb)
+
+    # Build result
+    result['changed'] = False
+    result['failed'] = err is not None
+    result['msg'] = err if err is not None else ''
+    result['cached'] = cached
+    result['ansible_facts'] = facts
+
+    # Return
+    return err, result
+
+
+# ------------------------------------------------------------------------------
+def gather_facts(module):
+    """
+    Gather facts
+    """
+
+    facts = {
+        'system': platform.system(),
+        'architecture': get_architecture(),
+        'default_ipv4': get_default_ipv4()
+    }
+
+    # Distribution facts are read from release files, same as the setup module
+    dist_facts = DistributionFactCollector().collect(module=module)
+    for key in CACHE_KEYS:
+        if key in dist_facts:
+            facts[key] = dist_facts[key]
+
+    return facts
+
+
+# ------------------------------------------------------------------------------
+def get_architecture():
+    """
+    Architecture the way the setup module reports it
+    """
+
+    system = platform.system()
+    machine = platform.machine()
+
+    if re.match(r'i[3456]86$', machine):
+        return 'i386'
+
+    if system == 'SunOS' and machine == 'i86pc':
+        rc, rval_str, _ = ec.exec_cmd(['isainfo', '-k'], ARCH_TIMEOUT)
+        if rc == 0 and rval_str.strip():
+            return rval_str.strip()
+
+    if system == 'AIX':
+        rc, rval_str, _ = ec.exec_cmd(['/usr/sbin/bootinfo', '-p'], ARCH_TIMEOUT)
+        if rc == 0 and rval_str.strip():
+            return rval_str.strip()
+
+    return machine
+
+
+# ------------------------------------------------------------------------------
+def get_default_ipv4():
+    """
+    Address of the interface of the default IPv4 route.  Connecting a UDP
+    socket only selects the route, no packets are sent.
+    """
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        sock.connect((ROUTE_PROBE_ADDRESS, 9))
+        address = sock.getsockname()[0]
+    except (socket.error, OSError):
+        return {}
+    finally:
+        sock.close()
+
+    return {'address': address}
+
+
+# ------------------------------------------------------------------------------
+def read_cache(cache_path, cache_ttl):
+    """
+    Read cached facts, None if there are none, they are too old or could have
+    been written by somebody else
+    """
+
+    try:
+        if time.time() - os.path.getmtime(os.path.expanduser(cache_path)) > cache_ttl:
+            return None
+    except OSError:
+        return None
+
+    facts = pf.read_json(cache_path)
+
+    if not isinstance(facts, dict) or any(key not in facts for key in ['system', 'architecture', 'os_family']):
+        return None
+
+    return facts
+
+
+# ------------------------------------------------------------------------------
+def write_cache(cache_path, facts):
+    """
+    Atomically write the facts cache private to the user, failing to write it
+    is not an error
+    """
+
+    pf.write_json(cache_path, dict((key, facts[key]) for key in CACHE_KEYS if key in facts))
+
+
+# ------------------------------------------------------------------------------
+def main():
+    """
+    Main
+    """
+
+    run_module()
+
+
+# When run from command line
+# ------------------------------------------------------------------------------
+if __name__ == '__main__':
+    main()
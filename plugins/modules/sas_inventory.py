@@ -0,0 +1,410 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: sas_inventory.py
+# Desc: Ansible module that collects all Authentication Services related facts
+#       of a host in one invocation.
+# Auth: Laszlo Nagy
+# Note:
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Required Ansible documentation
+# ------------------------------------------------------------------------------
+
+ANSIBLE_METADATA = {
+    'metadata_version': '0.2',
+    'status': ['preview'],
+    'supported_by': 'community'
+}
+
+DOCUMENTATION = """
+---
+module: sas_inventory
+
+short_description: Collects all Authentication Services facts of a host at once
+
+version_added: '2.9'
+
+description: >
+    Collects the same data as the get_join_status, vastool_status,
+    get_host_access_control, get_logon_policy_for_unix_host,
+    get_local_unix_users, get_local_unix_groups and
+    get_local_unix_users_with_ad_logon modules in a single module run.
+    The sections are collected concurrently and vastool is checked only once.
+    A failing section does not fail the module, each section reports its own
+    failed and msg values.
+
+options:
+    sections:
+        description:
+            - Sections to collect
+        type: list
+        elements: str
+        required: false
+        default: ['join_status', 'agent_status', 'host_access_control', 'logon_policy',
+                  'local_unix_users', 'local_unix_groups', 'local_unix_users_with_ad_logon']
+        choices: ['join_status', 'agent_status', 'host_access_control', 'logon_policy',
+                  'local_unix_users', 'local_unix_groups', 'local_unix_users_with_ad_logon']
+    max_workers:
+        description:
+            - Maximum number of sections collected at the same time
+        type: int
+        required: false
+        default: 4
+    facts:
+        description:
+            - Generate Ansible facts?
+        type: bool
+        required: false
+        default: true
+    facts_key:
+        description:
+            - Ansible facts key
+        type: str
+        required: false
+        default: 'sas_inventory'
+
+author:
+    - Laszlo Nagy (laszlo.nagy@oneidentity.com)
+"""
+
+EXAMPLES = """
+- name: Collect everything
+  sas_inventory:
+  register: sas_inventory_result
+
+- name: Collect local accounts only
+  sas_inventory:
+    sections:
+      - local_unix_users
+      - local_unix_groups
+  register: sas_inventory_result
+"""
+
+RETURN = """
+ansible_facts:
+    description: All non-standard return values are placed in Ansible facts
+    type: dict
+    returned: when facts parameter is true
+    keys:
+        changed:
+            description: Did the state of the host change?
+            type: bool
+            returned: always
+        failed:
+            description: Did the module fail?
+            type: bool
+            returned: always
+        msg:
+            description: Additional information if failed, lists failed sections
+            type: str
+            returned: always
+        params:
+            description: Parameters passed in
+            type: dict
+            returned: always
+        version:
+            description: Version of vastool
+            type: str
+            returned: always
+        time:
+            description: Wall-clock seconds spent collecting all sections
+            type: float
+            returned: always
+        sections:
+            description: >
+                Collected sections.  Every section has failed, msg and time keys
+                plus its data: join_status (domain), agent_status (issues),
+                host_access_control (users_allow, users_deny), logon_policy
+                (users_allowed), local_unix_users (local_unix_users),
+                local_unix_groups (local_unix_groups) and
+                local_unix_users_with_ad_logon (local_unix_users_with_ad_logon).
+            type: dict
+            returned: always
+"""
+
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+from ansible.module_utils.basic import AnsibleModule
+import time
+import traceback
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.vastool as vt
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.check_file_exec as cfe
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.host_access as hac
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.local_unix as lu
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.asdcom as asdcom
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+    HAS_THREAD_POOL = True
+except ImportError:
+    HAS_THREAD_POOL = False
+
+
+# ------------------------------------------------------------------------------
+# Constants
+# ------------------------------------------------------------------------------
+
+# Arg choices and defaults
+SECTIONS_CHOICES = [
+    'join_status',
+    'agent_status',
+    'host_access_control',
+    'logon_policy',
+    'local_unix_users',
+    'local_unix_groups',
+    'local_unix_users_with_ad_logon'
+]
+SECTIONS_DEFAULT = SECTIONS_CHOICES
+MAX_WORKERS_DEFAULT = 4
+FACTS_DEFAULT = True
+FACTS_KEY_DEFAULT = 'sas_inventory'
+
+# Sections that need vastool
+VASTOOL_SECTIONS = ['join_status', 'agent_status', 'host_access_control', 'logon_policy']
+
+
+# ------------------------------------------------------------------------------
+# Functions
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def run_module():
+    """
+    Main Ansible module function
+    """
+
+    # Module argument info
+    module_args = {
+            'sections': {
+                'type': 'list',
+                'elements': 'str',
+                'required': False,
+                'choices': SECTIONS_CHOICES,
+                'default': SECTIONS_DEFAULT
+            },
+            'max_workers': {
+                'type': 'int',
+                'required': False,
+                'default': MAX_WORKERS_DEFAULT
+            },
+            'facts': {
+                'type': 'bool',
+                'required': False,
+                'default': FACTS_DEFAULT
+            },
+            'facts_key': {
+                'type': 'str',
+                'required': False,
+                'default': FACTS_KEY_DEFAULT
+            }
+        }
+
+    # Seed result value
+    result = {
+            'changed': False,
+            'failed': False,
+            'msg': ''
+        }
+
+    # Lean on boilerplate code in AnsibleModule class
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=True
+    )
+
+    # Run logic
+    # NOTE: This module makes no changes so check mode doesn't need to be handled
+    #       specially
+    err, result = run_normal(module.params, result)
+
+    # Exit
+    module.exit_json(**result)
+
+
+# ------------------------------------------------------------------------------
+def run_normal(params, result):
+    """
+    Normal mode logic.
+
+    params contains input parameters.
+
+    result contains run results skeleton, will modify/add to and then return
+    this value along with an err value that contains None if no error or a string
+    describing the error.
+    """
+
+    # Return data
+    err = None
+    version = ''
+    sections = {}
+    start = time.time()
+
+    # Parameters
+    section_names = params['sections'] if params['sections'] else SECTIONS_DEFAULT
+    max_workers = params['max_workers'] if params['max_workers'] and params['max_workers'] > 0 else MAX_WORKERS_DEFAULT
+    facts = params['facts']
+    facts_key = params['facts_key'] if params['facts_key'] else FACTS_KEY_DEFAULT
+
+    try:
+
+        # Check vastool once for all sections that need it
+        vastool_err = None
+        if set(section_names) & set(VASTOOL_SECTIONS):
+            vastool_err, version = cfe.check_file_exec(vt.VASTOOL_PATH, '-v')
+
+        # Collect sections
+        sections = collect_sections(section_names, vastool_err, max_workers)
+
+        # Summarize failed sections
+        failed_sections = [name for name in section_names if sections[name]['failed']]
+        if failed_sections:
+            result['msg'] = 'Failed sections: ' + ', '.join(failed_sections)
+
+    except Exception:
+        tb = traceback.format_exc()
+        err = str(tb)
+
+    # Build result
+    result['changed'] = False   # this module never makes any changes to the host
+    result['failed'] = err is not None
+    if err is not None:
+        result['msg'] = err
+
+    # Create ansible_facts data
+    if facts:
+        result_facts = result.copy()
+        result_facts['params'] = params
+        result_facts['version'] = version
+        result_facts['time'] = time.time() - start
+        result_facts['sections'] = sections
+        result['ansible_facts'] = {facts_key: result_facts}
+
+    # Return
+    return err, result
+
+
+# ------------------------------------------------------------------------------
+def collect_sections(section_names, vastool_err, max_workers):
+    """
+    Collect the sections concurrently, or one after the other if there is no
+    thread pool available.
+    """
+
+    def collect(name):
+        return name, collect_section(name, vastool_err)
+
+    if HAS_THREAD_POOL and len(section_names) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            collected = list(executor.map(collect, section_names))
+    else:
+        collected = [collect(name) for name in section_names]
+
+    return dict(collected)
+
+
+# ------------------------------------------------------------------------------
+def collect_section(name, vastool_err):
+    """
+    Collect one section and time it.
+    """
+
+    # Return data
+    err = None
+    data = {}
+    start = time.time()
+
+    try:
+        if name in VASTOOL_SECTIONS and vastool_err is not None:
+            err = vastool_err
+        else:
+            err, data = SECTION_COLLECTORS[name]()
+
+    except Exception:
+        tb = traceback.format_exc()
+        err = str(tb)
+
+    section = {
+        'failed': err is not None,
+        'msg': err if err is not None else '',
+        'time': time.time() - start
+    }
+    section.update(data)
+
+    # Return
+    return section
+
+
+# ------------------------------------------------------------------------------
+def collect_join_status():
+    return None, {'domain': vt.vastool_status() or ''}
+
+
+# ------------------------------------------------------------------------------
+def collect_agent_status():
+    err, issues = vt.vastool_status_check()
+    return err, {'issues': issues}
+
+
+# ------------------------------------------------------------------------------
+def collect_host_access_control():
+    err, users_allow, users_deny = hac.get_users_allow_deny()
+    return err, {'users_allow': users_allow, 'users_deny': users_deny}
+
+
+# ------------------------------------------------------------------------------
+def collect_logon_policy():
+    err, users_allowed = vt.vastool_list_users_allowed()
+    return err, {'users_allowed': users_allowed}
+
+
+# ------------------------------------------------------------------------------
+def collect_local_unix_users():
+    err, local_unix_users = lu.read_users()
+    return err, {'local_unix_users': local_unix_users}
+
+
+# ------------------------------------------------------------------------------
+def collect_local_unix_groups():
+    err, local_unix_groups = lu.read_groups()
+    return err, {'local_unix_groups': local_unix_groups}
+
+
+# ------------------------------------------------------------------------------
+def collect_local_unix_users_with_ad_logon():
+    err, mapped_users = asdcom.get_mapped_users_with_gecos()
+    return err, {'local_unix_users_with_ad_logon': mapped_users}
+
+
+# Section name -> collector function
+SECTION_COLLECTORS = {
+    'join_status': collect_join_status,
+    'agent_status': collect_agent_status,
+    'host_access_control': collect_host_access_control,
+    'logon_policy': collect_logon_policy,
+    'local_unix_users': collect_local_unix_users,
+    'local_unix_groups': collect_local_unix_groups,
+    'local_unix_users_with_ad_logon': collect_local_unix_users_with_ad_logon
+}
+
+
+# ------------------------------------------------------------------------------
+def main():
+    """
+    Main
+    """
+
+    run_module()
+
+
+# When run from command line
+# ------------------------------------------------------------------------------
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: sas_snapshot_facts.py
+# Desc: Documentation of the sas_snapshot_facts action.
+# Auth: Laszlo Nagy
+# Note: The action runs on the Ansible control node, see
+#       plugins/action/sas_snapshot_facts.py.
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Required Ansible documentation
+# ------------------------------------------------------------------------------
+
+ANSIBLE_METADATA = {
+    'metadata_version': '0.2',
+    'status': ['preview'],
+    'supported_by': 'community'
+}
+
+DOCUMENTATION = """
+---
+module: sas_snapshot_facts
+
+short_description: Sets the facts of a host from the controller side snapshot
+
+version_added: '2.9'
+
+description: >
+    Loads the facts of the host stored by the sas_snapshot callback from the
+    snapshot on the Ansible control node and sets them as the host facts, so
+    reports can be generated from them without connecting to the host.  A host
+    that is not in the snapshot gets no facts and is reported like a host the
+    role was not run on.
+
+options:
+    path:
+        description:
+            - Snapshot database path on the Ansible control node
+        type: path
+        required: false
+        default: ~/.ansible/sas_snapshot.db
+    keys:
+        description:
+            - Set only these facts, all facts of the host if empty
+        type: list
+        elements: str
+        required: false
+        default: []
+
+author:
+    - Laszlo Nagy (laszlo.nagy@oneidentity.com)
+"""
+
+EXAMPLES = """
+- name: Normal usage
+  sas_snapshot_facts:
+    path: ~/.ansible/sas_snapshot.db
+  register: result
+"""
+
+RETURN = """
+ansible_facts:
+    description: Facts of the host stored in the snapshot
+    type: dict
+    returned: when the snapshot could be read
+found:
+    description: Does the snapshot have any of the requested facts of the host?
+    type: bool
+    returned: always
+"""
@@ -0,0 +1,432 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: vas_conf.py
+# Desc: Ansible module for client_config role that applies all vas.conf
+#       settings in one pass.
+# Auth: Laszlo Nagy
+# Note: Edits lines the same way as the Ansible ini_file module so results do
+#       not change when switching from a loop of ini_file tasks.
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Required Ansible documentation
+# ------------------------------------------------------------------------------
+
+ANSIBLE_METADATA = {
+    'metadata_version': '0.2',
+    'status': ['preview'],
+    'supported_by': 'community'
+}
+
+DOCUMENTATION = """
+---
+module: vas_conf
+
+short_description: Applies a list of section/option settings to vas.conf in one pass
+
+version_added: '2.9'
+
+description: >
+    Reads an INI file like vas.conf once, applies every section, option, value
+    and state item in memory the same way the ini_file module would, and writes
+    the file atomically only if its content changed.  Returns the result of
+    every item like a loop of ini_file tasks does.
+
+options:
+    path:
+        description:
+            - INI file path
+        type: path
+        required: true
+    items:
+        description:
+            - >
+              Settings to apply in order, each a dict with section (required),
+              option, value (default empty string) and state (present or absent,
+              required).  state absent without option removes the section.
+        type: list
+        elements: dict
+        required: true
+    create:
+        description:
+            - Create the file if it does not exist?
+        type: bool
+        required: false
+        default: true
+    backup:
+        description:
+            - Create a backup file when the file is changed?
+        type: bool
+        required: false
+        default: false
+    digest:
+        description:
+            - >
+              Store a digest of the desired state (items, create and file
+              attributes) and of the resulting file next to the file, and
+              skip applying the items while both still match?
+        type: bool
+        required: false
+        default: false
+
+extends_documentation_fragment:
+    - files
+
+author:
+    - Laszlo Nagy (laszlo.nagy@oneidentity.com)
+"""
+
+EXAMPLES = """
+- name: Normal usage
+  vas_conf:
+    path: /etc/opt/quest/vas/vas.conf
+    items:
+      - section: libdefaults
+        option: default_realm
+        value: EXAMPLE.COM
+        state: present
+      - section: vasypd
+        state: absent
+  register: file_result
+"""
+
+RETURN = """
+results:
+    description: >
+        Result of each item with changed, failed, msg and item keys, the shape
+        of the results of a loop of ini_file tasks
+    type: list
+    returned: always
+backup_file:
+    description: Backup file name
+    type: str
+    returned: when backup is true and the file was changed
+digest_match:
+    description: Was the file skipped because it is in the desired state?
+    type: bool
+    returned: always
+"""
+
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.common.text.converters import to_text
+import traceback
+import os
+import re
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.config_file as cf
+
+
+# ------------------------------------------------------------------------------
+# Constants
+# ------------------------------------------------------------------------------
+
+# Arg choices and defaults
+CREATE_DEFAULT = True
+BACKUP_DEFAULT = False
+DIGEST_DEFAULT = False
+STATE_CHOICES = ['present', 'absent']
+
+# Option line format
+ASSIGNMENT_FORMAT = '%s = %s\n'
+
+
+# ------------------------------------------------------------------------------
+# Functions
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def run_module():
+    """
+    Main Ansible module function
+    """
+
+    # Module argument info
+    module_args = {
+            'path': {
+                'type': 'path',
+                'required': True
+            },
+            'items': {
+                'type': 'list',
+                'elements': 'dict',
+                'required': True
+            },
+            'create': {
+                'type': 'bool',
+                'required': False,
+                'default': CREATE_DEFAULT
+            },
+            'backup': {
+                'type': 'bool',
+                'required': False,
+                'default': BACKUP_DEFAULT
+            },
+            'digest': {
+                'type': 'bool',
+                'required': False,
+                'default': DIGEST_DEFAULT
+            }
+        }
+
+    # Seed result value
+    result = {
+            'changed': False,
+            'failed': False,
+            'msg': '',
+            'results': [],
+            'digest_match': False
+        }
+
+    # Lean on boilerplate code in AnsibleModule class
+    module = AnsibleModule(
+        argument_spec=module_args,
+        add_file_common_args=True,
+        supports_check_mode=True
+    )
+
+    # Run logic
+    err, result = run_normal(module, result)
+
+    # Exit
+    module.exit_json(**result)
+
+
+# ------------------------------------------------------------------------------
+def run_normal(module, result):
+    """
+    Normal mode logic, in check mode the file is not written.
+
+    module is the AnsibleModule, used for atomic writes, backups and file
+    attributes.
+
+    result contains run results skeleton, will modify/add to and then return
+    this value along with an err value that contains None if no error or a string
+    describing the error.
+    """
+
+    # Return data
+    err = None
+    changed = False
+    results = []
+    digest_match = False
+
+    # Parameters
+    path = module.params['path']
+    items = module.params['items']
+    create = module.params['create']
+    backup = module.params['backup']
+    digest = module.params['digest']
+    desired = cf.desired_digest(
+        'vas_conf', items, create, module.params['mode'], module.params['owner'], module.params['group'])
+
+    try:
+
+        # Skip the file if it has not changed since the same items were applied
+        if digest and cf.digest_current(path, desired):
+            digest_match = True
+            results = [{'changed': False, 'failed': False, 'msg': cf.DIGEST_MATCH_MSG, 'item': item} for item in items]
+
+        # Read file once
+        else:
+            err, content = cf.read_file(path, create)
+
+        if err is None and not digest_match:
+
+            # Apply all items in memory
+            lines = content.splitlines(True)
+            if lines and not lines[-1].endswith('\n'):
+                lines[-1] += '\n'
+            for item in items:
+                item_err, item_changed, item_msg = apply_item(lines, item)
+                results.append({
+                    'changed': item_changed,
+                    'failed': item_err is not None,
+                    'msg': item_err if item_err is not None else item_msg,
+                    'item': item
+                })
+            new_content = ''.join(lines)
+
+            # Write only if the content hash changed
+            if cf.sha256(new_content) != cf.sha256(content) or not os.path.exists(path):
+                changed = True
+                if module._diff:
+                    result['diff'] = {
+                        'before_header': path,
+                        'before': content,
+                        'after_header': path,
+                        'after': new_content
+                    }
+                if not module.check_mode:
+                    if backup and os.path.exists(path):
+                        result['backup_file'] = module.backup_local(path)
+                    cf.write_file(module, path, new_content)
+
+            # File attributes
+            if os.path.exists(path) and not module.check_mode:
+                file_args = module.load_file_common_arguments(module.params)
+                changed = module.set_fs_attributes_if_different(file_args, changed)
+
+            # Store the digest only when every item was applied
+            if digest and not module.check_mode:
+                if any(r['failed'] for r in results):
+                    cf.remove_digest(path)
+                else:
+                    cf.write_digest(path, desired)
+
+    except Exception:
+        tb = traceback.format_exc()
+        err = str(tb)
+
+    # Whole file errors fail every item like they would fail every ini_file task
+    if err is not None:
+        results = [{'changed': False, 'failed': True, 'msg': err, 'item': item} for item in items]
+
+    # Build result
+    item_failed = [r['msg'] for r in results if r['failed']]
+    result['changed'] = changed
+    result['failed'] = err is not None or bool(item_failed)
+    result['msg'] = err if err is not None else '\n'.join(item_failed)
+    result['results'] = results
+    result['digest_match'] = digest_match
+
+    # Return
+    return err, result
+
+
+# ------------------------------------------------------------------------------
+def match_opt(option, line):
+    """
+    Option line, possibly commented out
+    """
+
+    option = re.escape(option)
+    return re.match('( |\t)*%s( |\t)*(=|$)' % option, line) \
+        or re.match('#( |\t)*%s( |\t)*(=|$)' % option, line) \
+        or re.match(';( |\t)*%s( |\t)*(=|$)' % option, line)
+
+
+# ------------------------------------------------------------------------------
+def match_active_opt(option, line):
+    """
+    Option line not commented out
+    """
+
+    option = re.escape(option)
+    return re.match('( |\t)*%s( |\t)*(=|$)' % option, line)
+
+
+# ------------------------------------------------------------------------------
+def apply_item(lines, item):
+    """
+    Apply one section/option/value/state item to lines in place, returns err,
+    changed and msg like the ini_file module.
+    """
+
+    section = item.get('section')
+    option = item.get('option') or None
+    value = item.get('value')
+    value = '' if value is None else to_text(value)
+    state = item.get('state')
+
+    if not section:
+        return 'section is required', False, ''
+    if state not in STATE_CHOICES:
+        return 'state must be one of: ' + ', '.join(STATE_CHOICES) + ', got: ' + str(state), False, ''
+
+    changed = False
+    msg = 'OK'
+
+    # Fake section line at the end to simplify the logic
+    lines.append('[')
+
+    within_section = False
+    section_start = 0
+    index = 0
+    while index < len(lines):
+        line = lines[index]
+
+        if line.startswith('[%s]' % section):
+            within_section = True
+            section_start = index
+
+        elif line.startswith('['):
+            if within_section:
+                if state == 'present' and option:
+                    # Insert missing option line at the end of the section
+                    for i in range(index, 0, -1):
+                        if not re.match(r'^[ \t]*([#;].*)?$', lines[i - 1]):
+                            lines.insert(i, ASSIGNMENT_FORMAT % (option, value))
+                            msg = 'option added'
+                            changed = True
+                            break
+                elif state == 'absent' and not option:
+                    # Remove the entire section
+                    del lines[section_start:index]
+                    msg = 'section removed'
+                    changed = True
+                break
+
+        elif within_section and option:
+            if state == 'present' and match_opt(option, line):
+                # Change the existing option line
+                new_line = ASSIGNMENT_FORMAT % (option, value)
+                option_changed = line != new_line
+                lines[index] = new_line
+                if option_changed:
+                    changed = True
+                    msg = 'option changed'
+
+                    # Remove other occurrences of the option in the section
+                    index += 1
+                    while index < len(lines) and not lines[index].startswith('['):
+                        if match_active_opt(option, lines[index]):
+                            del lines[index]
+                        else:
+                            index += 1
+                break
+
+            if state == 'absent' and match_active_opt(option, line):
+                # Delete the existing line
+                del lines[index]
+                changed = True
+                msg = 'option changed'
+                break
+
+        index += 1
+
+    # Remove the fake section line
+    del lines[-1:]
+
+    if not within_section and state == 'present':
+        lines.append('[%s]\n' % section)
+        changed = True
+        if option:
+            lines.append(ASSIGNMENT_FORMAT % (option, value))
+            msg = 'section and option added'
+        else:
+            msg = 'only section added'
+
+    return None, changed, msg
+
+
+# ------------------------------------------------------------------------------
+def main():
+    """
+    Main
+    """
+
+    run_module()
+
+
+# When run from command line
+# ------------------------------------------------------------------------------
+if __name__ == '__main__':
+    main()
@@ -86,6 +86,12 @@ options:
         type: str
         required: false
         default: ''
+    run_timeout:
+        description:
+            - Number of seconds joining or unjoining may run before it is killed, 0 waits forever
+        type: int
+        required: false
+        default: 600
     facts:
         description:
             - Generate Ansible facts?
@@ -152,6 +158,10 @@ ansible_facts:
             description: Version of vastool
             type: str
             returned: always
+        run_time:
+            description: Number of seconds vastool join or unjoin ran
+            type: float
+            returned: always
         steps:
             description: Vastool join/unjoin steps and results of those steps
             type: list of dicts
@@ -165,13 +175,13 @@ ansible_facts:
 
 from ansible.module_utils.basic import AnsibleModule
 import os
-import sys
-import subprocess
+import shlex
 import traceback
 import re
 import ansible_collections.oneidentity.authentication_services.plugins.module_utils.vastool as vt
 import ansible_collections.oneidentity.authentication_services.plugins.module_utils.check_file_exec as cfe
-from ansible_collections.oneidentity.authentication_services.plugins.module_utils.misc_utils import enclose_shell_arg
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.vastool_cache as vc
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.exec_cmd as ec
 
 
 # ------------------------------------------------------------------------------
@@ -185,6 +195,7 @@ SERVERS_DEFAULT = []
 ACCOUNT_NAME_DEFAULT = None
 ACCOUNT_CONTAINER_DEFAULT = None
 EXTRA_ARGS_DEFAULT = ''
+RUN_TIMEOUT_DEFAULT = 600
 FACTS_DEFAULT = True
 FACTS_VERBOSE_DEFAULT = True
 FACTS_KEY_DEFAULT = 'vastool_join'
@@ -248,6 +259,11 @@ def run_module():
                 'required': False,
                 'default': EXTRA_ARGS_DEFAULT
             },
+            'run_timeout': {
+                'type': 'int',
+                'required': False,
+                'default': RUN_TIMEOUT_DEFAULT
+            },
             'facts': {
                 'type': 'bool',
                 'required': False,
@@ -303,6 +319,7 @@ def run_normal(params, result):
     version = ''
     changed = False
     steps = []
+    run_time = 0.0
 
     # Parameters
     state = params['state']
@@ -314,6 +331,7 @@ def run_normal(params, result):
     account_name = params['account_name']
     account_container = params['account_container']
     extra_args = params['extra_args']
+    run_timeout = params['run_timeout']
     facts = params['facts']
     facts_verbose = params['facts_verbose']
     facts_key = params['facts_key'] if params['facts_key'] else FACTS_KEY_DEFAULT
@@ -333,7 +351,7 @@ def run_normal(params, result):
 
         # Run vastool
         if err is None:
-            err, changed, steps = run_vastool(
+            err, changed, steps, run_time = run_vastool(
                 state,
                 domain,
                 username,
@@ -342,7 +360,8 @@ def run_normal(params, result):
                 servers,
                 account_name,
                 account_container,
-                extra_args)
+                extra_args,
+                run_timeout)
 
     except Exception:
         tb = traceback.format_exc()
@@ -358,6 +377,7 @@ def run_normal(params, result):
         result_facts = result.copy()
         result_facts['params'] = params
         result_facts['version'] = version
+        result_facts['run_time'] = run_time
         if facts_verbose:
             result_facts['steps'] = steps
         result['ansible_facts'] = {facts_key: result_facts}
@@ -376,25 +396,28 @@ def run_vastool(
         servers,
         account_name,
         account_container,
-        extra_args):
+        extra_args,
+        run_timeout):
     """
-    Run vastool
+    Run vastool, also returns the number of seconds join or unjoin ran
     """
 
     # Return values
     err = None
     changed = False
     steps = []
+    run_time = 0.0
 
-    # Check status to decide what to do
-    status_domain = vt.vastool_status()
+    # Check status to decide what to do, never from the cache as a stale status
+    # would skip a needed join or unjoin
+    status_domain = vt.vastool_status(use_cache=False)
 
     # Joined
     if state == 'joined':
 
         # If not already joined to a domain then join
         if status_domain is None:
-            err, changed, steps = run_vastool_join(
+            err, changed, steps, run_time = run_vastool_join(
                 domain,
                 username,
                 password,
@@ -402,8 +425,11 @@ def run_vastool(
                 servers,
                 account_name,
                 account_container,
-                extra_args
+                extra_args,
+                run_timeout
             )
+            # Join state may have changed, cached status and settings are stale
+            vc.cache_invalidate()
 
         # If already joined to requested domain then do nothing
         elif status_domain == domain:
@@ -418,13 +444,16 @@ def run_vastool(
 
         # If joined to a domain then unjoin
         if status_domain is not None:
-            err, changed, steps = run_vastool_unjoin(
+            err, changed, steps, run_time = run_vastool_unjoin(
                 username,
                 password,
                 keytab,
                 account_name,
-                extra_args
+                extra_args,
+                run_timeout
             )
+            # Join state may have changed, cached status and settings are stale
+            vc.cache_invalidate()
 
         # If already unjoined then do nothing
         else:
@@ -435,7 +464,7 @@ def run_vastool(
         err = 'Unexpected state requested: ' + state
 
     # Return
-    return err, changed, steps
+    return err, changed, steps, run_time
 
 
 # ------------------------------------------------------------------------------
@@ -447,7 +476,8 @@ def run_vastool_join(
         servers,
         account_name,
         account_container,
-        extra_args):
+        extra_args,
+        run_timeout):
 
     # Return values
     err = None
@@ -457,36 +487,29 @@ def run_vastool_join(
     # Build vastool command
     cmd = []
     cmd += [vt.VASTOOL_PATH]
-    cmd += ['-u ' + enclose_shell_arg(username)]
+    cmd += ['-u', username]
     if password:
-        cmd += ['-w ' + enclose_shell_arg(password)]
+        cmd += ['-w', password]
     if keytab:
-        cmd += ['-k ' + enclose_shell_arg(keytab)]
+        cmd += ['-k', keytab]
     cmd += ['join']
     cmd += ['-f']
-    cmd += ['-n ' + account_name] if account_name else []
-    cmd += ['-c ' + enclose_shell_arg(account_container)] if account_container else []
-    cmd += [extra_args] if extra_args else []
+    cmd += ['-n', account_name] if account_name else []
+    cmd += ['-c', account_container] if account_container else []
+    cmd += shlex.split(extra_args) if extra_args else []
     cmd += [domain]
     cmd += servers if servers else []
 
     # Call vastool
-    try:
-        p = subprocess.Popen(' '.join(cmd), stdin=None, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=True)
-        rval_bytes, rval_err = p.communicate()
-        rval_bytes += rval_err
-    # This exception happens when the process exits with a non-zero return code
-    except subprocess.CalledProcessError as e:
-        # Just grab output bytes likes a normal exit, we'll parse it for errors anyway
-        rval_bytes = e.output
-    # Popen returns list of bytes so we have to decode to get a string
-    rval_str = rval_bytes.decode(sys.stdout.encoding)
-
-    # Parse vastool return
+    rc, rval_str, run_time = ec.exec_cmd(cmd, run_timeout)
+
+    # Parse vastool return, a killed vastool may have done some of the steps
     err, changed, steps = parse_vastool_steps(domain, rval_str)
+    if rc == ec.TIMEOUT_RC and err is None:
+        err = rval_str.strip()
 
     # Return
-    return err, changed, steps
+    return err, changed, steps, run_time
 
 
 # ------------------------------------------------------------------------------
@@ -495,7 +518,8 @@ def run_vastool_unjoin(
         password,
         keytab,
         account_name,
-        extra_args):
+        extra_args,
+        run_timeout):
 
     # Return values
     err = None
@@ -505,33 +529,26 @@ def run_vastool_unjoin(
     # Build vastool command
     cmd = []
     cmd += [vt.VASTOOL_PATH]
-    cmd += ['-u ' + enclose_shell_arg(username)]
+    cmd += ['-u', username]
     if password:
-        cmd += ['-w ' + enclose_shell_arg(password)]
+        cmd += ['-w', password]
     if keytab:
-        cmd += ['-k ' + enclose_shell_arg(keytab)]
+        cmd += ['-k', keytab]
     cmd += ['unjoin']
     cmd += ['-f']
-    cmd += ['-n ' + account_name] if account_name else []
-    cmd += [extra_args] if extra_args else []
+    cmd += ['-n', account_name] if account_name else []
+    cmd += shlex.split(extra_args) if extra_args else []
 
     # Call vastool
-    try:
-        p = subprocess.Popen(' '.join(cmd), stdin=None, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=True)
-        rval_bytes, rval_err = p.communicate()
-        rval_bytes += rval_err
-    # This exception happens when the process exits with a non-zero return code
-    except subprocess.CalledProcessError as e:
-        # Just grab output bytes likes a normal exit, we'll parse it for errors anyway
-        rval_bytes = e.output
-    # Popen returns list of bytes so we have to decode to get a string
-    rval_str = rval_bytes.decode(sys.stdout.encoding)
-
-    # Parse vastool return
+    rc, rval_str, run_time = ec.exec_cmd(cmd, run_timeout)
+
+    # Parse vastool return, a killed vastool may have done some of the steps
     err, changed, steps = parse_vastool_steps('', rval_str)
+    if rc == ec.TIMEOUT_RC and err is None:
+        err = rval_str.strip()
 
     # Return
-    return err, changed, steps
+    return err, changed, steps, run_time
 
 
 # ------------------------------------------------------------------------------
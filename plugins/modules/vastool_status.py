@@ -105,12 +105,7 @@ ansible_facts:
 
 
 from ansible.module_utils.basic import AnsibleModule
-from io import StringIO
-import csv
-import sys
-import subprocess
 import traceback
-import re
 import ansible_collections.oneidentity.authentication_services.plugins.module_utils.vastool as vt
 import ansible_collections.oneidentity.authentication_services.plugins.module_utils.check_file_exec as cfe
 
@@ -204,7 +199,7 @@ def run_normal(params, result):
 
         # Run vastool
         if err is None:
-            err, issues = run_vastool_status()
+            err, issues = vt.vastool_status_check()
 
     except Exception:
         tb = traceback.format_exc()
@@ -228,87 +223,6 @@ def run_normal(params, result):
     return err, result
 
 
-# ------------------------------------------------------------------------------
-def run_vastool_status():
-    """
-    Run vastool status
-    """
-
-    # Return values
-    err = None
-    issues = []
-    non_zero_ret_code = False
-
-    # Build vastool command
-    cmd = []
-    cmd += [vt.VASTOOL_PATH]
-    cmd += ['status']
-    cmd += ['-c']
-
-    # Call vastool
-    try:
-        p = subprocess.Popen(' '.join(cmd), stdin=None, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=True)
-        rval_bytes, rval_err = p.communicate()
-        rval_bytes += rval_err
-    # This exception happens when the process exits with a non-zero return code
-    except subprocess.CalledProcessError as e:
-        # Just grab output bytes likes a normal exit, we'll parse it for errors anyway
-        rval_bytes = e.output
-    if p.returncode > 0:
-        non_zero_ret_code = True
-    # Popen returns list of bytes so we have to decode to get a string
-    rval_str = rval_bytes.decode(sys.stdout.encoding)
-
-    # Parse vastool return
-    err, issues = parse_vastool_stdout(non_zero_ret_code, rval_str)
-
-    # Return
-    return err, issues
-
-
-# ------------------------------------------------------------------------------
-def parse_vastool_stdout(non_zero_ret_code, stdout_str):
-
-    # Return values
-    err = None
-    issues = []
-
-    failure = False
-
-    severities = {
-        '1': 'Warning',
-        '2': 'Failure',
-        '3': 'Critical Failure'
-    }
-
-    text_stream = StringIO(stdout_str)
-    csv_reader = csv.reader(text_stream)
-    for row in csv_reader:
-        if row[0] != 'STATUS':
-            continue
-        if row[3] not in severities:
-            continue
-        if row[3] in ('2', '3'):
-            failure = True
-        issues += [
-            {
-                'test_id': row[1],
-                'description': row[2].replace("`", ""),
-                'severity': severities[row[3]],
-                'result': row[4].replace("`", "")
-            }
-        ]
-
-    if failure:
-        err = 'One or more QAS Status checks failed.'
-
-    if not issues and non_zero_ret_code:
-        err = stdout_str
-
-    # Return
-    return err, issues
-
-
 # ------------------------------------------------------------------------------
 def main():
     """
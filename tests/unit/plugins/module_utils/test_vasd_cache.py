@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: test_vasd_cache.py
+# Desc: Unit tests of the vasd identity cache reader against local SQLite
+#       fixtures.
+# Auth: Laszlo Nagy
+# Note: Run with ansible-test units, or pytest with the collection on the path.
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+# Future module imports for consistency across Python versions
+from __future__ import absolute_import, division, print_function
+
+# Want classes to be new type for consistency across Python versions
+__metaclass__ = type
+
+import sqlite3
+
+import pytest
+
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.vasd_cache as vdc
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.vastool as vt
+
+
+# ------------------------------------------------------------------------------
+# Fixtures
+# ------------------------------------------------------------------------------
+
+# Users of the fixture database: vastool list users fields and access_allowed
+USERS = [
+    ['alice@EXAMPLE.COM', 'VAS', '5001', '5000', 'Alice', '/home/alice', '/bin/bash', 1],
+    ['bob@EXAMPLE.COM', 'VAS', '5002', '5000', 'Bob', '/home/bob', '/bin/sh', 0],
+    ['carol@EXAMPLE.COM', 'VAS', '5003', '5001', '', '/home/carol', '/bin/bash', 1],
+]
+
+# Groups of the fixture database: vastool list groups fields
+GROUPS = [
+    ['staff@EXAMPLE.COM', 'VAS', '5000', 'alice@EXAMPLE.COM,bob@EXAMPLE.COM'],
+    ['admins@EXAMPLE.COM', 'VAS', '5001', 'carol@EXAMPLE.COM'],
+]
+
+
+# ------------------------------------------------------------------------------
+def make_cache(path, version=4, users=USERS, groups=GROUPS):
+    """
+    Create a vasd identity cache database with the layout of SCHEMAS[4] and
+    the given schema version
+    """
+
+    conn = sqlite3.connect(str(path))
+    conn.execute('CREATE TABLE usercache (name TEXT, passwd TEXT, uid INTEGER, gid INTEGER, '
+                 'gecos TEXT, home TEXT, shell TEXT, access_allowed INTEGER)')
+    conn.execute('CREATE INDEX usercache_name ON usercache (name)')
+    conn.execute('CREATE TABLE groupcache (name TEXT, passwd TEXT, gid INTEGER, members TEXT)')
+    conn.executemany('INSERT INTO usercache VALUES (?, ?, ?, ?, ?, ?, ?, ?)', users)
+    conn.executemany('INSERT INTO groupcache VALUES (?, ?, ?, ?)', groups)
+    conn.execute('PRAGMA user_version = %d' % version)
+    conn.commit()
+    conn.close()
+
+    return str(path)
+
+
+# ------------------------------------------------------------------------------
+@pytest.fixture
+def cache_path(tmp_path):
+    return make_cache(tmp_path / 'vas_ident.vdb')
+
+
+# ------------------------------------------------------------------------------
+def allowed(users):
+    """
+    vastool list users-allowed records of users
+    """
+
+    return [user[:7] for user in users if user[7]]
+
+
+# ------------------------------------------------------------------------------
+# open_cache
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def test_open_cache_known_schema(cache_path):
+    conn, schema = vdc.open_cache(cache_path)
+    try:
+        assert schema is vdc.SCHEMAS[4]
+        assert conn.execute('SELECT COUNT(*) FROM usercache').fetchone()[0] == len(USERS)
+    finally:
+        conn.close()
+
+
+# ------------------------------------------------------------------------------
+def test_open_cache_is_read_only(cache_path):
+    conn, _ = vdc.open_cache(cache_path)
+    try:
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM usercache")
+    finally:
+        conn.close()
+
+
+# ------------------------------------------------------------------------------
+def test_open_cache_unknown_schema(tmp_path):
+    path = make_cache(tmp_path / 'vas_ident.vdb', version=99)
+    assert vdc.open_cache(path) == (None, None)
+
+
+# ------------------------------------------------------------------------------
+def test_open_cache_missing_table(tmp_path):
+    path = str(tmp_path / 'vas_ident.vdb')
+    conn = sqlite3.connect(path)
+    conn.execute('CREATE TABLE usercache (name TEXT, passwd TEXT, uid INTEGER, gid INTEGER, '
+                 'gecos TEXT, home TEXT, shell TEXT, access_allowed INTEGER)')
+    conn.execute('PRAGMA user_version = 4')
+    conn.commit()
+    conn.close()
+
+    assert vdc.open_cache(path) == (None, None)
+
+
+# ------------------------------------------------------------------------------
+def test_open_cache_missing_column(tmp_path):
+    path = str(tmp_path / 'vas_ident.vdb')
+    conn = sqlite3.connect(path)
+    conn.execute('CREATE TABLE usercache (name TEXT, passwd TEXT, uid INTEGER, gid INTEGER, '
+                 'gecos TEXT, home TEXT, shell TEXT)')
+    conn.execute('CREATE TABLE groupcache (name TEXT, passwd TEXT, gid INTEGER, members TEXT)')
+    conn.execute('PRAGMA user_version = 4')
+    conn.commit()
+    conn.close()
+
+    assert vdc.open_cache(path) == (None, None)
+
+
+# ------------------------------------------------------------------------------
+def test_open_cache_missing(tmp_path):
+    assert vdc.open_cache(str(tmp_path / 'missing.vdb')) == (None, None)
+
+
+# ------------------------------------------------------------------------------
+def test_open_cache_not_a_database(tmp_path):
+    path = tmp_path / 'vas_ident.vdb'
+    path.write_text(u'not a database')
+    assert vdc.open_cache(str(path)) == (None, None)
+
+
+# ------------------------------------------------------------------------------
+# find_users_by_names
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def test_find_users_by_names(cache_path):
+    conn, schema = vdc.open_cache(cache_path)
+    try:
+        users = vdc.find_users_by_names(conn, schema, ['bob@EXAMPLE.COM', 'nobody@EXAMPLE.COM'])
+        allowed_users = vdc.find_users_by_names(
+            conn, schema, ['alice@EXAMPLE.COM', 'bob@EXAMPLE.COM'], allowed_only=True)
+    finally:
+        conn.close()
+
+    assert users == [USERS[1][:7]]
+    assert allowed_users == [USERS[0][:7]]
+
+
+# ------------------------------------------------------------------------------
+def test_find_users_by_names_chunks(tmp_path, monkeypatch):
+    users = [['u%03d@EXAMPLE.COM' % i, 'VAS', str(6000 + i), '5000', '', '/home/u%03d' % i, '/bin/sh', 1]
+             for i in range(25)]
+    path = make_cache(tmp_path / 'vas_ident.vdb', users=users)
+    monkeypatch.setattr(vdc, 'LOOKUP_CHUNK', 4)
+
+    conn, schema = vdc.open_cache(path)
+    try:
+        found = vdc.find_users_by_names(conn, schema, [user[0] for user in users[::2]])
+    finally:
+        conn.close()
+
+    assert sorted(found) == sorted(user[:7] for user in users[::2])
+
+
+# ------------------------------------------------------------------------------
+def test_find_users_by_names_none(cache_path):
+    conn, schema = vdc.open_cache(cache_path)
+    try:
+        assert vdc.find_users_by_names(conn, schema, []) == []
+    finally:
+        conn.close()
+
+
+# ------------------------------------------------------------------------------
+# list_users_allowed
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def test_list_users_allowed_hit(cache_path):
+    assert vdc.list_users_allowed(path=cache_path) == (True, allowed(USERS))
+
+
+# ------------------------------------------------------------------------------
+def test_list_users_allowed_user_names(cache_path):
+    hit, users = vdc.list_users_allowed(['carol@EXAMPLE.COM', 'bob@EXAMPLE.COM'], path=cache_path)
+    assert hit
+    assert users == [USERS[2][:7]]
+
+
+# ------------------------------------------------------------------------------
+def test_list_users_allowed_unknown_schema(tmp_path):
+    path = make_cache(tmp_path / 'vas_ident.vdb', version=3)
+    assert vdc.list_users_allowed(path=path) == (False, [])
+
+
+# ------------------------------------------------------------------------------
+def test_list_users_allowed_missing(tmp_path):
+    assert vdc.list_users_allowed(path=str(tmp_path / 'missing.vdb')) == (False, [])
+
+
+# ------------------------------------------------------------------------------
+def test_list_users_allowed_wrong_layout(tmp_path):
+    path = str(tmp_path / 'vas_ident.vdb')
+    conn = sqlite3.connect(path)
+    conn.execute('CREATE TABLE users (name TEXT)')
+    conn.execute('PRAGMA user_version = 4')
+    conn.commit()
+    conn.close()
+
+    assert vdc.list_users_allowed(path=path) == (False, [])
+
+
+# ------------------------------------------------------------------------------
+# vastool_list_users_allowed fallback
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+@pytest.fixture
+def vastool_output(monkeypatch):
+    """
+    Replaces running vastool with list users-allowed output of USERS, the
+    commands run are collected in the returned list
+    """
+
+    calls = []
+
+    def exec_cmd(cmd, timeout):
+        calls.append(cmd)
+        return 0, '\n'.join(':'.join(user) for user in allowed(USERS)) + '\n', 0.0
+
+    monkeypatch.setattr(vt.ec, 'exec_cmd', exec_cmd)
+    return calls
+
+
+# ------------------------------------------------------------------------------
+def test_vastool_list_users_allowed_uses_cache(cache_path, vastool_output, monkeypatch):
+    monkeypatch.setattr(vdc, 'CACHE_PATH', cache_path)
+
+    err, users = vt.vastool_list_users_allowed(['alice@EXAMPLE.COM'], vasd_cache=True)
+
+    assert err is None
+    assert users == [USERS[0][:7]]
+    assert vastool_output == []
+
+
+# ------------------------------------------------------------------------------
+def test_vastool_list_users_allowed_cache_disabled(cache_path, vastool_output, monkeypatch):
+    monkeypatch.setattr(vdc, 'CACHE_PATH', cache_path)
+
+    err, users = vt.vastool_list_users_allowed(['alice@EXAMPLE.COM'])
+
+    assert err is None
+    assert users == [USERS[0][:7]]
+    assert len(vastool_output) == 1
+
+
+# ------------------------------------------------------------------------------
+def test_vastool_list_users_allowed_unknown_schema(tmp_path, vastool_output, monkeypatch):
+    path = make_cache(tmp_path / 'vas_ident.vdb', version=99)
+    monkeypatch.setattr(vdc, 'CACHE_PATH', path)
+
+    err, users = vt.vastool_list_users_allowed(vasd_cache=True)
+
+    assert err is None
+    assert users == allowed(USERS)
+    assert len(vastool_output) == 1
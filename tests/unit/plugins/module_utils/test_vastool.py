@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+# ------------------------------------------------------------------------------
+# Copyright (c) 2026, One Identity LLC
+# File: test_vastool.py
+# Desc: Unit tests of vastool inspect against a fake vastool script that
+#       records the arguments it is called with.
+# Auth: Laszlo Nagy
+# Note: Run with ansible-test units, or pytest with the collection on the path.
+# ------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+# Future module imports for consistency across Python versions
+from __future__ import absolute_import, division, print_function
+
+# Want classes to be new type for consistency across Python versions
+__metaclass__ = type
+
+import json
+import os
+import sys
+
+import pytest
+
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.vastool as vt
+import ansible_collections.oneidentity.authentication_services.plugins.module_utils.vastool_cache as vc
+
+
+# ------------------------------------------------------------------------------
+# Fixtures
+# ------------------------------------------------------------------------------
+
+# Values the fake vastool returns for inspect section key
+INSPECT_VALUES = {
+    'vas_auth users-allow-file': '/etc/opt/quest/vas/users.allow',
+    'vas_auth users-deny-file': '/etc/opt/quest/vas/users.deny',
+}
+
+# Fake vastool: appends its arguments to the log file as a JSON line, prints
+# the value of inspect section key or fails like vastool does
+FAKE_VASTOOL = '''#!%(python)s
+import json
+import sys
+with open(%(log)r, 'a') as log_file:
+    log_file.write(json.dumps(sys.argv[1:]) + '\\n')
+values = %(values)r
+args = sys.argv[1:]
+if len(args) == 3 and args[0] == 'inspect' and ' '.join(args[1:]) in values:
+    print(values[' '.join(args[1:])])
+    sys.exit(0)
+sys.stderr.write('ERROR: unknown setting\\n')
+sys.exit(1)
+'''
+
+
+# ------------------------------------------------------------------------------
+@pytest.fixture
+def fake_vastool(tmp_path, monkeypatch):
+    """
+    Replaces vastool with FAKE_VASTOOL and the host cache and vas.conf with
+    files in tmp_path.  Returns a function returning the argument lists
+    vastool was called with.
+    """
+
+    log_path = str(tmp_path / 'vastool.log')
+    vastool_path = str(tmp_path / 'vastool')
+    with open(vastool_path, 'w') as vastool_file:
+        vastool_file.write(FAKE_VASTOOL % {'python': sys.executable, 'log': log_path, 'values': INSPECT_VALUES})
+    os.chmod(vastool_path, 0o700)
+
+    monkeypatch.setattr(vt, 'VASTOOL_PATH', vastool_path)
+    monkeypatch.setattr(vc, 'CACHE_PATH', str(tmp_path / 'cache.json'))
+    monkeypatch.setattr(vc, 'VAS_CONF_PATH', str(tmp_path / 'vas.conf'))
+
+    def calls():
+        if not os.path.exists(log_path):
+            return []
+        with open(log_path) as log_file:
+            return [json.loads(line) for line in log_file]
+
+    return calls
+
+
+# ------------------------------------------------------------------------------
+# vastool_inspect
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def test_vastool_inspect_argv(fake_vastool):
+    err, value = vt.vastool_inspect('vas_auth users-allow-file')
+
+    assert err is None
+    assert value == INSPECT_VALUES['vas_auth users-allow-file']
+    assert fake_vastool() == [['inspect', 'vas_auth', 'users-allow-file']]
+
+
+# ------------------------------------------------------------------------------
+def test_vastool_inspect_cached(fake_vastool):
+    vt.vastool_inspect('vas_auth users-allow-file')
+    err, value = vt.vastool_inspect('vas_auth users-allow-file')
+
+    assert err is None
+    assert value == INSPECT_VALUES['vas_auth users-allow-file']
+    assert len(fake_vastool()) == 1
+    assert vc.cache_get('inspect vas_auth users-allow-file', vt.VASTOOL_PATH) == (
+        True, INSPECT_VALUES['vas_auth users-allow-file'])
+
+
+# ------------------------------------------------------------------------------
+def test_vastool_inspect_error(fake_vastool):
+    err, value = vt.vastool_inspect('vas_auth no-such-setting')
+
+    assert 'unknown setting' in err
+    assert value == ''
+    assert vc.cache_get('inspect vas_auth no-such-setting', vt.VASTOOL_PATH) == (False, None)
+
+
+# ------------------------------------------------------------------------------
+# vastool_inspect_many
+# ------------------------------------------------------------------------------
+
+# ------------------------------------------------------------------------------
+def test_vastool_inspect_many_misses(fake_vastool):
+    err, values = vt.vastool_inspect_many(sorted(INSPECT_VALUES))
+
+    assert err is None
+    assert values == INSPECT_VALUES
+    assert fake_vastool() == [['inspect'] + setting.split() for setting in sorted(INSPECT_VALUES)]
+
+
+# ------------------------------------------------------------------------------
+def test_vastool_inspect_many_vas_conf(fake_vastool):
+    with open(vc.VAS_CONF_PATH, 'w') as vas_conf_file:
+        vas_conf_file.write('[vas_auth]\n    users-allow-file = /etc/users.allow\n')
+
+    err, values = vt.vastool_inspect_many(sorted(INSPECT_VALUES))
+
+    assert err is None
+    assert values == {
+        'vas_auth users-allow-file': '/etc/users.allow',
+        'vas_auth users-deny-file': INSPECT_VALUES['vas_auth users-deny-file'],
+    }
+    assert fake_vastool() == [['inspect', 'vas_auth', 'users-deny-file']]
+
+
+# ------------------------------------------------------------------------------
+def test_vastool_inspect_many_error(fake_vastool):
+    err, values = vt.vastool_inspect_many(['vas_auth users-allow-file', 'vas_auth no-such-setting'])
+
+    assert 'unknown setting' in err
+    assert values == {
+        'vas_auth users-allow-file': INSPECT_VALUES['vas_auth users-allow-file'],
+        'vas_auth no-such-setting': '',
+    }